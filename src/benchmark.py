@@ -0,0 +1,573 @@
+"""
+Accuracy-versus-cost benchmark of the field solvers.
+
+The benchmark uses the method of manufactured solutions on the Poincaré
+half-plane, i.e. the univariate Gaussian manifold with
+
+    Δ_G φ = σ² ∂_μ² φ + (σ²/2) ∂_σ² φ.
+
+For the analytic field
+
+    φ(μ, σ) = e^{κμ} sin(α(μ − a)) sin(β(σ − c)),
+
+which vanishes on the boundary of the fixed box [a, b] × [c, d], the
+source
+
+    A = −[(−Δ_G + m²) φ] / γ
+
+is computed in closed form. Every benchmark grid covers the interior of
+the same box, so that its Dirichlet ghost layer lies on the box boundary
+and all resolutions discretize one and the same problem. Every solver is
+run on a sequence of grids and tolerances; the discretization error against φ, the observed
+convergence order, the wall time and the peak traced memory are
+recorded, and the non-dominated (time, error) runs form a Pareto table.
+
+Results are written to ``benchmarks/``:
+
+- ``solver_benchmark.json``: all runs;
+- ``solver_benchmark.md``: Pareto table;
+- ``solver_pareto.pdf``: error versus time, rendered via
+  :mod:`src.utils.plotting`.
+
+Usage::
+
+    python -m src.benchmark [--sizes 17 33 65] [--baseline PATH]
+
+With ``--baseline``, the run fails if any solver became less accurate or
+markedly slower than in the baseline results.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Iterable
+
+import numpy as np
+
+from src.utils.action import ActionFunctional, minimize_action
+from src.utils.laplacian import Grid, LaplaceBeltrami
+from src.utils.paths import ROOT_DIR
+from src.utils.plotting import finalize_figure, new_axes
+from src.utils.poisson import FieldSolver
+from src.utils.spectral import Eigenbasis
+
+
+# ---------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------
+BENCHMARK_DIR: Path = ROOT_DIR / "benchmarks"
+"""
+Output directory of benchmark results (not version-controlled).
+"""
+
+GRID_SIZES = (17, 33, 65)
+"""
+Default numbers of nodes per axis.
+"""
+
+TOLERANCES = (1e-4, 1e-7, 1e-10)
+"""
+Default relative tolerances of the iterative solvers.
+"""
+
+MU_RANGE = (-2.0, 2.0)
+SIGMA_RANGE = (0.5, 2.5)
+"""
+Box [a, b] × [c, d] of the manufactured problem; grids cover its interior.
+"""
+
+SCREENING_MASS = 1.0
+GAMMA = 1.0
+
+ERROR_FACTOR = 1.1
+"""
+Allowed growth of the discretization error relative to a baseline.
+"""
+
+STALL_ORDER = 0.5
+"""
+Observed orders below this flag a stalled series: refining the grid no
+longer reduces the error, which is then limited by the solver (spectral
+truncation, iteration tolerance) rather than by the discretization.
+"""
+
+TIME_FACTOR = 2.0
+"""
+Allowed growth of the wall time relative to a baseline.
+"""
+
+TIME_FLOOR = 0.05
+"""
+Wall times below this (in seconds) are treated as equal to it when
+checking for regressions, since they are dominated by timer and
+scheduling noise.
+"""
+
+REPEAT = 5
+"""
+Default number of timed repetitions; the best time is recorded.
+"""
+
+
+# ---------------------------------------------------------------------
+# Manufactured solution
+# ---------------------------------------------------------------------
+@dataclass(frozen=True)
+class ManufacturedSolution:
+    """
+    Analytic field vanishing on the boundary of a fixed box.
+
+    Attributes
+    ----------
+    mu_box, sigma_box : tuple of float
+        Box (a, b) and (c, d) on whose boundary φ vanishes.
+    kappa : float
+        Exponential tilt along μ (breaks the μ ↦ −μ symmetry).
+    """
+
+    mu_box: tuple[float, float] = MU_RANGE
+    sigma_box: tuple[float, float] = SIGMA_RANGE
+    kappa: float = 0.5
+
+    @property
+    def alpha(self) -> float:
+        return math.pi / (self.mu_box[1] - self.mu_box[0])
+
+    @property
+    def beta(self) -> float:
+        return math.pi / (self.sigma_box[1] - self.sigma_box[0])
+
+    def phi(self, mu, sigma) -> np.ndarray:
+        """
+        Exact field φ(μ, σ).
+        """
+        a, c = self.mu_box[0], self.sigma_box[0]
+        return (
+            np.exp(self.kappa * mu)
+            * np.sin(self.alpha * (mu - a))
+            * np.sin(self.beta * (sigma - c))
+        )
+
+    def laplacian(self, mu, sigma) -> np.ndarray:
+        """
+        Exact Δ_G φ on the Gaussian manifold.
+        """
+        a, c = self.mu_box[0], self.sigma_box[0]
+        k, al, be = self.kappa, self.alpha, self.beta
+        s, co = np.sin(al * (mu - a)), np.cos(al * (mu - a))
+        t = np.sin(be * (sigma - c))
+        tilt = np.exp(k * mu)
+        phi_mumu = tilt * t * ((k * k - al * al) * s + 2.0 * k * al * co)
+        phi_sigsig = -be * be * tilt * s * t
+        return sigma**2 * phi_mumu + 0.5 * sigma**2 * phi_sigsig
+
+    def source(self, mu, sigma, *, m: float = 0.0, gamma: float = 1.0) -> np.ndarray:
+        """
+        Source A with (−Δ_G + m²) φ = −γ A.
+        """
+        return (self.laplacian(mu, sigma) - m * m * self.phi(mu, sigma)) / gamma
+
+
+# ---------------------------------------------------------------------
+# Solvers under test
+# ---------------------------------------------------------------------
+Solver = Callable[[Grid, np.ndarray, float], np.ndarray]
+
+
+def _field_solver(method: str, precision: str = "double") -> Solver:
+    def run(grid, source, tol):
+        op = LaplaceBeltrami(grid, precision=precision)
+        solver = FieldSolver(op, m=SCREENING_MASS, method=method, tol=tol)
+        return solver.solve(source, gamma=GAMMA)
+
+    return run
+
+
+def _spectral_solver(k: int) -> Solver:
+    def run(grid, source, tol):
+        basis = Eigenbasis.compute(LaplaceBeltrami(grid), min(k, grid.size))
+        return basis.solve(source, m=SCREENING_MASS, gamma=GAMMA).field
+
+    return run
+
+
+def _action_solver(method: str) -> Solver:
+    def run(grid, source, tol):
+        functional = ActionFunctional(
+            LaplaceBeltrami(grid), source, gamma=GAMMA, m=SCREENING_MASS
+        )
+        return minimize_action(functional, method=method, tol=tol).phi
+
+    return run
+
+
+SOLVERS: dict[str, tuple[Solver, bool]] = {
+    "direct": (_field_solver("direct"), False),
+    "direct-mixed": (_field_solver("direct", "mixed"), True),
+    "cg": (_field_solver("cg"), True),
+    "cg-mixed": (_field_solver("cg", "mixed"), True),
+    "spectral-k64": (_spectral_solver(64), False),
+    "action-lbfgs": (_action_solver("L-BFGS-B"), True),
+    "action-cg": (_action_solver("CG"), True),
+}
+"""
+Registry of benchmarked solvers: ``name -> (run, uses_tolerance)``.
+
+Solvers that ignore the tolerance are run once per grid. ``spectral-k64``
+is truncation-limited: with 64 modes its error stalls near 5e-3 however
+fine the grid, and its series is reported as stalled.
+"""
+
+
+# ---------------------------------------------------------------------
+# Runs
+# ---------------------------------------------------------------------
+@dataclass
+class BenchmarkRun:
+    """
+    One solver run on one grid.
+
+    Attributes
+    ----------
+    solver : str
+        Key of :data:`SOLVERS`.
+    n : int
+        Nodes per axis.
+    h : float
+        Largest grid spacing.
+    tol : float or None
+        Solver tolerance (``None`` if not applicable).
+    error_max : float
+        Max-norm error against the manufactured solution.
+    error_l2 : float
+        Relative Fisher-volume L2 error.
+    time : float
+        Best wall time over the repetitions, in seconds.
+    peak_memory : int
+        Peak memory traced by :mod:`tracemalloc`, in bytes (allocations
+        inside compiled libraries that bypass the tracer are missed).
+    status : str
+        ``"ok"`` or the error message of a failed run.
+    order : float or None
+        Observed convergence order against the next coarser grid.
+    stalled : bool
+        Whether ``order`` fell below :data:`STALL_ORDER`.
+    pareto : bool
+        Whether the run is on the (time, error) Pareto front.
+    """
+
+    solver: str
+    n: int
+    h: float
+    tol: float | None
+    error_max: float = math.nan
+    error_l2: float = math.nan
+    time: float = math.nan
+    peak_memory: int = 0
+    status: str = "ok"
+    order: float | None = None
+    stalled: bool = False
+    pareto: bool = False
+
+    @property
+    def key(self) -> str:
+        tol = "-" if self.tol is None else f"{self.tol:.0e}"
+        return f"{self.solver}|{self.n}|{tol}"
+
+
+def benchmark_grid(n: int) -> Grid:
+    """
+    Grid of ``n`` × ``n`` interior nodes of the benchmark box.
+
+    The box is split into ``n + 1`` intervals per axis, so the Dirichlet
+    ghost layer one spacing outside the grid lies on the box boundary,
+    where the manufactured solution vanishes.
+    """
+    mu = np.linspace(*MU_RANGE, n + 2)[1:-1]
+    sigma = np.linspace(*SIGMA_RANGE, n + 2)[1:-1]
+    return Grid(mu, sigma)
+
+
+def run_solver(
+    name: str, n: int, tol: float | None, *, repeat: int = REPEAT
+) -> BenchmarkRun:
+    """
+    Run one solver on one grid and measure accuracy and cost.
+    """
+    solve, _ = SOLVERS[name]
+    grid = benchmark_grid(n)
+    exact = ManufacturedSolution()
+    MU, SIGMA = grid.mesh()
+    source = exact.source(MU, SIGMA, m=SCREENING_MASS, gamma=GAMMA)
+    phi_exact = exact.phi(MU, SIGMA)
+    run = BenchmarkRun(name, n, max(grid.h_mu, grid.h_sigma), tol)
+
+    try:
+        best = math.inf
+        for _ in range(repeat):
+            started = time.perf_counter()
+            phi = solve(grid, source, tol if tol is not None else 1e-10)
+            best = min(best, time.perf_counter() - started)
+
+        tracemalloc.start()
+        try:
+            solve(grid, source, tol if tol is not None else 1e-10)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    except (RuntimeError, ValueError) as exc:
+        run.status = str(exc)
+        return run
+
+    mass = LaplaceBeltrami(grid).mass
+    error = np.asarray(phi, dtype=float) - phi_exact
+    run.error_max = float(np.max(np.abs(error)))
+    run.error_l2 = float(
+        np.sqrt(np.sum(mass * error**2) / np.sum(mass * phi_exact**2))
+    )
+    run.time = best
+    run.peak_memory = int(peak)
+    return run
+
+
+def convergence_orders(runs: list[BenchmarkRun]) -> None:
+    """
+    Fill ``order`` from successive grids of the same solver and tolerance,
+    and flag runs whose order shows a stalled series.
+    """
+    series: dict[tuple, list[BenchmarkRun]] = {}
+    for run in runs:
+        if run.status == "ok":
+            series.setdefault((run.solver, run.tol), []).append(run)
+    for entries in series.values():
+        entries.sort(key=lambda r: r.n)
+        for coarse, fine in zip(entries, entries[1:]):
+            if coarse.error_l2 > 0.0 and fine.error_l2 > 0.0:
+                fine.order = math.log(coarse.error_l2 / fine.error_l2) / math.log(
+                    coarse.h / fine.h
+                )
+                fine.stalled = fine.order < STALL_ORDER
+
+
+def pareto_front(runs: list[BenchmarkRun]) -> list[BenchmarkRun]:
+    """
+    Mark and return the runs not dominated in (time, error_l2).
+    """
+    ok = sorted(
+        (r for r in runs if r.status == "ok"), key=lambda r: (r.time, r.error_l2)
+    )
+    front, best = [], math.inf
+    for run in ok:
+        run.pareto = run.error_l2 < best
+        if run.pareto:
+            front.append(run)
+            best = run.error_l2
+    return front
+
+
+def run_benchmark(
+    sizes: Iterable[int] = GRID_SIZES,
+    tolerances: Iterable[float] = TOLERANCES,
+    *,
+    solvers: Iterable[str] | None = None,
+    repeat: int = REPEAT,
+) -> list[BenchmarkRun]:
+    """
+    Run every solver on every grid size (and tolerance, if applicable).
+
+    Returns
+    -------
+    list of BenchmarkRun
+        Runs with convergence orders and Pareto flags filled in.
+    """
+    names = list(SOLVERS) if solvers is None else list(solvers)
+    unknown = set(names) - set(SOLVERS)
+    if unknown:
+        raise ValueError(f"Unknown solvers {sorted(unknown)}. Supported: {list(SOLVERS)}")
+
+    runs = []
+    for name in names:
+        uses_tol = SOLVERS[name][1]
+        for tol in (tuple(tolerances) if uses_tol else (None,)):
+            for n in sizes:
+                runs.append(run_solver(name, n, tol, repeat=repeat))
+    convergence_orders(runs)
+    pareto_front(runs)
+    return runs
+
+
+# ---------------------------------------------------------------------
+# Reports
+# ---------------------------------------------------------------------
+def pareto_table(runs: list[BenchmarkRun]) -> str:
+    """
+    Markdown table of all successful runs, sorted by time; Pareto-optimal
+    runs are marked with ``*`` and stalled orders with ``(stalled)``.
+    """
+    lines = [
+        "| | solver | n | tol | rel. L2 error | order | time [s] | peak memory [MiB] |",
+        "|---|---|---:|---:|---:|---:|---:|---:|",
+    ]
+    for run in sorted((r for r in runs if r.status == "ok"), key=lambda r: r.time):
+        tol = "-" if run.tol is None else f"{run.tol:.0e}"
+        order = "-" if run.order is None else f"{run.order:.2f}"
+        if run.stalled:
+            order += " (stalled)"
+        lines.append(
+            f"| {'*' if run.pareto else ''} | {run.solver} | {run.n} | {tol} "
+            f"| {run.error_l2:.3e} | {order} | {run.time:.4f} "
+            f"| {run.peak_memory / 2**20:.1f} |"
+        )
+    stalled = [r for r in runs if r.stalled]
+    if stalled:
+        lines += ["", "Stalled convergence (error not limited by the grid):", ""]
+        lines += [f"- {r.key}: error {r.error_l2:.3e}, order {r.order:.2f}" for r in stalled]
+    failed = [r for r in runs if r.status != "ok"]
+    if failed:
+        lines += ["", "Failed runs:", ""]
+        lines += [f"- {r.key}: {r.status}" for r in failed]
+    return "\n".join(lines) + "\n"
+
+
+def plot_pareto(runs: list[BenchmarkRun], path: Path) -> bool:
+    """
+    Plot error versus wall time per solver, with the Pareto front.
+    """
+    fig, ax = new_axes(width=5.5, height=4.0)
+    for name in dict.fromkeys(r.solver for r in runs):
+        points = [r for r in runs if r.solver == name and r.status == "ok"]
+        if points:
+            ax.loglog(
+                [r.time for r in points],
+                [r.error_l2 for r in points],
+                "o",
+                markersize=3,
+                label=name,
+            )
+    front = sorted((r for r in runs if r.pareto), key=lambda r: r.time)
+    if front:
+        ax.step(
+            [r.time for r in front],
+            [r.error_l2 for r in front],
+            where="post",
+            color="black",
+            linewidth=0.8,
+            label="Pareto front",
+        )
+    ax.set_xlabel("Wall time [s]")
+    ax.set_ylabel("Relative $L^2$ error")
+    ax.legend(fontsize=6)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return finalize_figure(path, fig)
+
+
+def write_reports(runs: list[BenchmarkRun], directory: Path = BENCHMARK_DIR) -> Path:
+    """
+    Write JSON results, the Pareto table and the plot to ``directory``.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    results = directory / "solver_benchmark.json"
+    results.write_text(
+        json.dumps([asdict(r) for r in runs], indent=2, sort_keys=True) + "\n",
+        encoding="utf-8",
+    )
+    (directory / "solver_benchmark.md").write_text(pareto_table(runs), encoding="utf-8")
+    plot_pareto(runs, directory / "solver_pareto.pdf")
+    return results
+
+
+def load_runs(path: Path) -> list[BenchmarkRun]:
+    """
+    Load runs written by :func:`write_reports`.
+    """
+    return [BenchmarkRun(**data) for data in json.loads(Path(path).read_text())]
+
+
+def regressions(
+    runs: list[BenchmarkRun],
+    baseline: list[BenchmarkRun],
+    *,
+    error_factor: float = ERROR_FACTOR,
+    time_factor: float = TIME_FACTOR,
+    time_floor: float = TIME_FLOOR,
+) -> list[str]:
+    """
+    Compare runs with a baseline.
+
+    Baseline times below ``time_floor`` are raised to it, so runs that
+    stay within ``time_factor * time_floor`` are never flagged as slower.
+
+    Returns
+    -------
+    list of str
+        One message per run that failed, lost accuracy by more than
+        ``error_factor`` or slowed down by more than ``time_factor``.
+    """
+    reference = {r.key: r for r in baseline if r.status == "ok"}
+    messages = []
+    for run in runs:
+        base = reference.get(run.key)
+        if base is None:
+            continue
+        if run.status != "ok":
+            messages.append(f"{run.key}: failed ({run.status})")
+        elif run.error_l2 > error_factor * base.error_l2 + 1e-15:
+            messages.append(
+                f"{run.key}: error {run.error_l2:.3e} > baseline {base.error_l2:.3e}"
+            )
+        elif run.time > time_factor * max(base.time, time_floor):
+            messages.append(f"{run.key}: time {run.time:.4f}s > baseline {base.time:.4f}s")
+    return messages
+
+
+# ---------------------------------------------------------------------
+# Command-line interface
+# ---------------------------------------------------------------------
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.benchmark",
+        description="Manufactured-solution accuracy/cost benchmark of the field solvers.",
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(GRID_SIZES))
+    parser.add_argument("--tolerances", type=float, nargs="+", default=list(TOLERANCES))
+    parser.add_argument(
+        "--solver",
+        action="append",
+        choices=list(SOLVERS),
+        help="solver to run (repeatable; default: all)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=REPEAT, help="timing repetitions (best is kept)"
+    )
+    parser.add_argument("--output", type=Path, default=BENCHMARK_DIR)
+    parser.add_argument("--baseline", type=Path, help="results file to compare against")
+    args = parser.parse_args(argv)
+
+    runs = run_benchmark(
+        args.sizes, args.tolerances, solvers=args.solver, repeat=args.repeat
+    )
+    results = write_reports(runs, args.output)
+    print(pareto_table([r for r in runs if r.pareto]), end="")
+    for run in runs:
+        if run.stalled:
+            print(f"STALLED  {run.key}: error {run.error_l2:.3e}, order {run.order:.2f}")
+    print(f"Results written to {results.parent}")
+
+    if args.baseline is not None:
+        messages = regressions(runs, load_runs(args.baseline))
+        for message in messages:
+            print(f"REGRESSION  {message}")
+        return 1 if messages else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
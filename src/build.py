@@ -0,0 +1,483 @@
+"""
+Dependency-aware build of figures and the manuscript.
+
+This module links figure generation to paper compilation through an
+explicit dependency graph:
+
+    figure module (+ the src/ modules it imports)  ->  figure file
+    main .tex + sections/*.tex + .bib + included figures  ->  paper PDF
+
+Each target is rebuilt only when the content hash of its inputs differs
+from the one recorded after its last successful build. Because figure
+output is byte-stable (see :func:`src.utils.plotting.finalize_figure`),
+regenerating a figure whose content did not change leaves the paper
+up to date as well.
+
+Figures draw on standalone Agg canvases without pyplot state (see
+:func:`src.utils.plotting.new_figure`), so stale figures render
+concurrently on a thread pool. Paper compilation runs as an asynchronous
+subprocess that starts as soon as the figures it includes are ready,
+overlapping with any remaining figures the paper does not use.
+
+Every regenerated figure runs inside a :class:`~src.utils.telemetry.Telemetry`
+session; the solver records are written per figure to
+``paper/<format>/.telemetry.json``.
+
+Usage::
+
+    python -m src.build [--force] [--no-paper] [--format revtext]
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import asyncio
+import hashlib
+import json
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Awaitable, Callable, Iterable
+
+from src.run_figures import FIGURES
+from src.utils.telemetry import Telemetry
+from src.utils.tiling import limit_workers
+from src.utils.paths import (
+    ROOT_DIR,
+    SUPPORTED_FORMATS,
+    figure_path,
+    paper_dir,
+)
+
+
+# ---------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------
+MAIN_TEX: dict[str, str] = {
+    "revtext": "fisher-geometric-action.tex",
+}
+"""
+Main LaTeX source file of each paper format.
+"""
+
+STATE_FILE = ".build_state.json"
+"""
+Name of the per-format file recording input digests of built targets.
+"""
+
+TELEMETRY_FILE = ".telemetry.json"
+"""
+Name of the per-format file holding solver telemetry of the last build
+of each figure.
+"""
+
+Compiler = Callable[[Path], Awaitable[None]]
+"""
+Asynchronous paper compiler: receives the main ``.tex`` path.
+"""
+
+_INCLUDE_RE = re.compile(r"\\includegraphics\s*(?:\[[^\]]*\])?\s*\{([^}]+)\}")
+
+
+# ---------------------------------------------------------------------
+# Dependency discovery
+# ---------------------------------------------------------------------
+def _module_file(module: str) -> Path | None:
+    """
+    Resolve a dotted ``src.*`` module name to its source file.
+    """
+    if module != "src" and not module.startswith("src."):
+        return None
+    path = ROOT_DIR.joinpath(*module.split(".")).with_suffix(".py")
+    return path if path.is_file() else None
+
+
+def imported_modules(path: Path) -> set[str]:
+    """
+    Return the dotted names of all ``src.*`` modules imported by a file.
+    """
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    names: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module)
+            names.update(f"{node.module}.{alias.name}" for alias in node.names)
+    return {name for name in names if name.startswith("src.")}
+
+
+def module_dependencies(module: str) -> list[Path]:
+    """
+    Return the source files a module depends on, within ``src/``.
+
+    The module's own file is included, followed by every ``src.*``
+    module it imports, transitively. Third-party imports are ignored.
+
+    Parameters
+    ----------
+    module : str
+        Dotted module name (e.g. ``"src.figures.fig_alignment_field_screening"``).
+
+    Returns
+    -------
+    list of Path
+        Sorted list of source files.
+    """
+    seen: set[Path] = set()
+    pending = [module]
+    while pending:
+        path = _module_file(pending.pop())
+        if path is None or path in seen:
+            continue
+        seen.add(path)
+        pending.extend(imported_modules(path))
+    return sorted(seen)
+
+
+def figure_module(name: str) -> str:
+    """
+    Return the dotted name of the module that generates a figure.
+    """
+    return FIGURES[name].__module__
+
+
+def paper_sources(format: str) -> list[Path]:
+    """
+    Return the LaTeX and bibliography sources of a paper format.
+
+    Bibliography files generated by RevTeX (``<main>Notes.bib``) are
+    build outputs and therefore excluded.
+    """
+    root = paper_dir(format)
+    main = root / MAIN_TEX[format]
+    generated = f"{main.stem}Notes.bib"
+    sources = [main]
+    sources += sorted((root / "sections").glob("*.tex"))
+    sources += sorted(p for p in root.glob("*.bib") if p.name != generated)
+    return sources
+
+
+def included_figures(format: str) -> list[str]:
+    """
+    Return the registered figures included by a paper via ``\\includegraphics``.
+
+    Parameters
+    ----------
+    format : str
+        Paper format identifier.
+
+    Returns
+    -------
+    list of str
+        Figure names in registry order.
+    """
+    included: set[str] = set()
+    for source in paper_sources(format):
+        if source.suffix != ".tex" or not source.exists():
+            continue
+        for match in _INCLUDE_RE.finditer(source.read_text(encoding="utf-8")):
+            included.add(Path(match.group(1).strip()).stem)
+    return [name for name in FIGURES if name in included]
+
+
+# ---------------------------------------------------------------------
+# Content hashing and build state
+# ---------------------------------------------------------------------
+def digest_files(paths: Iterable[Path]) -> str:
+    """
+    Compute a combined SHA-256 digest of file names and contents.
+
+    Missing files contribute a fixed marker, so their later appearance
+    changes the digest.
+    """
+    h = hashlib.sha256()
+    for path in map(Path, paths):
+        label = path.relative_to(ROOT_DIR) if path.is_relative_to(ROOT_DIR) else path
+        h.update(label.as_posix().encode())
+        h.update(b"\0")
+        try:
+            h.update(path.read_bytes())
+        except FileNotFoundError:
+            h.update(b"<missing>")
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _load_json(format: str, name: str) -> dict:
+    path = paper_dir(format) / name
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _save_json(format: str, name: str, data: dict) -> None:
+    path = paper_dir(format) / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(data, indent=2, sort_keys=True) + "\n",
+        encoding="utf-8",
+    )
+
+
+def _load_state(format: str) -> dict[str, str]:
+    return _load_json(format, STATE_FILE)
+
+
+def _save_state(format: str, state: dict[str, str]) -> None:
+    _save_json(format, STATE_FILE, state)
+
+
+def _generate(name: str, formats: tuple[str, ...], threads: int) -> dict:
+    """
+    Render one figure and return the telemetry of the solves it ran.
+
+    Tiled grid evaluations inside the figure use at most ``threads``
+    threads, so concurrent figures share the cores instead of each
+    starting one thread per core.
+    """
+    with Telemetry() as session, limit_workers(threads):
+        FIGURES[name](formats=formats)
+    return session.to_dict()
+
+
+def _figure_digest(name: str) -> str:
+    return digest_files(module_dependencies(figure_module(name)))
+
+
+def _paper_digest(format: str) -> str:
+    figures = [figure_path(n, format=format) for n in included_figures(format)]
+    return digest_files(paper_sources(format) + figures)
+
+
+def _paper_output(format: str) -> Path:
+    return paper_dir(format) / Path(MAIN_TEX[format]).with_suffix(".pdf").name
+
+
+def stale_figures(formats: Iterable[str], *, force: bool = False) -> list[str]:
+    """
+    Return the figures whose inputs changed or whose outputs are missing.
+
+    Parameters
+    ----------
+    formats : iterable of str
+        Paper formats to check.
+    force : bool, optional
+        Treat every figure as stale.
+
+    Returns
+    -------
+    list of str
+        Stale figure names in registry order.
+    """
+    formats = list(formats)
+    states = {fmt: _load_state(fmt) for fmt in formats}
+    stale = []
+    for name in FIGURES:
+        digest = _figure_digest(name)
+        for fmt in formats:
+            if (
+                force
+                or states[fmt].get(name) != digest
+                or not figure_path(name, format=fmt).exists()
+            ):
+                stale.append(name)
+                break
+    return stale
+
+
+# ---------------------------------------------------------------------
+# Compilers
+# ---------------------------------------------------------------------
+async def latexmk_compiler(main_tex: Path) -> None:
+    """
+    Compile a manuscript with ``latexmk -pdf`` in its own directory.
+
+    Raises
+    ------
+    RuntimeError
+        If ``latexmk`` exits with a non-zero status.
+    """
+    process = await asyncio.create_subprocess_exec(
+        "latexmk",
+        "-pdf",
+        "-interaction=nonstopmode",
+        main_tex.name,
+        cwd=main_tex.parent,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+    )
+    output, _ = await process.communicate()
+    if process.returncode != 0:
+        tail = output.decode(errors="replace")[-2000:]
+        raise RuntimeError(
+            f"latexmk failed for {main_tex} (exit {process.returncode}):\n{tail}"
+        )
+
+
+# ---------------------------------------------------------------------
+# Build execution
+# ---------------------------------------------------------------------
+async def build_async(
+    formats: Iterable[str] | None = None,
+    *,
+    compiler: Compiler | None = latexmk_compiler,
+    force: bool = False,
+    jobs: int | None = None,
+) -> dict[str, str]:
+    """
+    Bring all figures and papers up to date.
+
+    Parameters
+    ----------
+    formats : iterable of str or None, optional
+        Paper formats to build. If ``None``, all supported formats.
+    compiler : callable or None, optional
+        Asynchronous paper compiler. ``None`` skips paper compilation.
+    force : bool, optional
+        Rebuild every target regardless of recorded state.
+    jobs : int, optional
+        Figures rendered concurrently (default: one per core, at most one
+        per figure).
+
+    Returns
+    -------
+    dict
+        Mapping from target (figure name or ``"paper:<format>"``) to
+        ``"built"`` or ``"up-to-date"``.
+
+    Notes
+    -----
+    Figures feeding a paper are scheduled first, so its compilation can
+    start while the remaining figures are still rendering.
+    """
+    formats = sorted(SUPPORTED_FORMATS if formats is None else set(formats))
+    states = {fmt: _load_state(fmt) for fmt in formats}
+    stale = set(stale_figures(formats, force=force))
+
+    needed = {name for fmt in formats for name in included_figures(fmt)}
+    order = [n for n in FIGURES if n in needed] + [n for n in FIGURES if n not in needed]
+
+    workers = jobs if jobs is not None else min(len(FIGURES), os.cpu_count() or 1)
+    workers = max(workers, 1)
+    threads = max((os.cpu_count() or 1) // workers, 1)
+
+    report: dict[str, str] = {}
+    loop = asyncio.get_running_loop()
+    done: dict[str, asyncio.Future] = {name: loop.create_future() for name in FIGURES}
+
+    async def run_figure(executor: ThreadPoolExecutor, name: str) -> None:
+        if name not in stale:
+            report[name] = "up-to-date"
+            done[name].set_result(False)
+            return
+        digest = _figure_digest(name)
+        try:
+            solves = await loop.run_in_executor(
+                executor, _generate, name, tuple(formats), threads
+            )
+        except BaseException:
+            # Papers waiting on figures give up; figures still rendering
+            # finish and record their state, but must not resolve their
+            # (now cancelled) futures.
+            for future in done.values():
+                if not future.done():
+                    future.cancel()
+            raise
+        # State files are only touched from the event loop thread.
+        for fmt in formats:
+            states[fmt][name] = digest
+            _save_state(fmt, states[fmt])
+            telemetry = _load_json(fmt, TELEMETRY_FILE)
+            telemetry[name] = solves
+            _save_json(fmt, TELEMETRY_FILE, telemetry)
+        report[name] = "built"
+        if not done[name].done():
+            done[name].set_result(True)
+
+    async def run_figures(executor: ThreadPoolExecutor) -> None:
+        await asyncio.gather(*(run_figure(executor, name) for name in order))
+
+    async def run_paper(fmt: str) -> None:
+        await asyncio.gather(*(done[n] for n in included_figures(fmt)))
+        key = f"paper:{fmt}"
+        digest = _paper_digest(fmt)
+        if (
+            not force
+            and states[fmt].get(key) == digest
+            and _paper_output(fmt).exists()
+        ):
+            report[key] = "up-to-date"
+            return
+        await compiler(paper_dir(fmt) / MAIN_TEX[fmt])
+        states[fmt][key] = digest
+        _save_state(fmt, states[fmt])
+        report[key] = "built"
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="figures") as executor:
+        tasks = [run_figures(executor)]
+        if compiler is not None:
+            tasks += [run_paper(fmt) for fmt in formats]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return report
+
+
+def build(
+    formats: Iterable[str] | None = None,
+    *,
+    compiler: Compiler | None = latexmk_compiler,
+    force: bool = False,
+    jobs: int | None = None,
+) -> dict[str, str]:
+    """
+    Synchronous wrapper around :func:`build_async`.
+    """
+    return asyncio.run(build_async(formats, compiler=compiler, force=force, jobs=jobs))
+
+
+# ---------------------------------------------------------------------
+# Command-line interface
+# ---------------------------------------------------------------------
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.build",
+        description="Rebuild stale figures and recompile the paper if needed.",
+    )
+    parser.add_argument("--force", action="store_true", help="rebuild all targets")
+    parser.add_argument("--no-paper", action="store_true", help="skip LaTeX compilation")
+    parser.add_argument(
+        "--format",
+        action="append",
+        choices=sorted(SUPPORTED_FORMATS),
+        help="paper format to build (repeatable; default: all)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="figures rendered in parallel (default: one per core)",
+    )
+    args = parser.parse_args(argv)
+
+    report = build(
+        args.format,
+        compiler=None if args.no_paper else latexmk_compiler,
+        force=args.force,
+        jobs=args.jobs,
+    )
+    for target, status in report.items():
+        print(f"{status:>10}  {target}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
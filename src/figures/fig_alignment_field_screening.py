@@ -11,9 +11,8 @@ using the centralized path and plotting utilities.
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
 
-from src.utils.plotting import setup_figure, finalize_figure
+from src.utils.plotting import new_axes, finalize_figure
 from src.utils.paths import figure_paths_all_formats
 
 
@@ -40,24 +39,24 @@ def generate(formats=("revtext",)):
     - The figure is created using standardized editorial defaults.
     - Output is vector-safe (PDF) and resolution-enforced.
     - The same figure is saved into all requested paper formats.
+    - The figure is built on a standalone Agg canvas without pyplot,
+      so it can render concurrently with other figures.
     """
     d = np.linspace(0.0, 4.0, 300)
     m_values = [0.5, 1.0, 2.0]
 
-    setup_figure()
+    fig, ax = new_axes()
 
     for m in m_values:
         phi = np.exp(-m * d)
-        plt.plot(d, phi, label=rf"$m={m}$")
+        ax.plot(d, phi, label=rf"$m={m}$")
 
-    plt.xlabel(r"Fisher distance $d_G$")
-    plt.ylabel(r"Alignment field $\phi$")
-    plt.legend(frameon=False)
+    ax.set_xlabel(r"Fisher distance $d_G$")
+    ax.set_ylabel(r"Alignment field $\phi$")
+    ax.legend(frameon=False)
 
     for path in figure_paths_all_formats(
         "fig_alignment_field_screening",
         formats=formats,
     ):
-        finalize_figure(path, close=False)
-
-    plt.close()
+        finalize_figure(path, fig)
@@ -15,10 +15,9 @@ for conceptual and editorial illustration rather than empirical analysis.
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
 
 from src.utils.plotting import (
-    setup_figure,
+    new_axes,
     finalize_figure,
     add_fisher_equilibrium_line,
 )
@@ -47,22 +46,22 @@ def generate(formats=("revtext",)):
       quantitative inference.
     - Output is generated with standardized editorial settings and
       saved consistently across all requested formats.
+    - The figure is built on a standalone Agg canvas without pyplot,
+      so it can render concurrently with other figures.
     """
 
     # --- synthetic representative spectrum (editorial figure) ---
     lambdas = np.array([0.5, 1.0, 5.0])
 
-    setup_figure()
-    plt.plot(lambdas, "o")
-    add_fisher_equilibrium_line(1.0)
+    fig, ax = new_axes()
+    ax.plot(lambdas, "o")
+    add_fisher_equilibrium_line(1.0, ax=ax)
 
-    plt.xlabel("Mode index")
-    plt.ylabel(r"Eigenvalue $\lambda_i$")
+    ax.set_xlabel("Mode index")
+    ax.set_ylabel(r"Eigenvalue $\lambda_i$")
 
     for path in figure_paths_all_formats(
         "fig_alignment_operator_spectrum",
         formats=formats,
     ):
-        finalize_figure(path, close=False)
-
-    plt.close()
+        finalize_figure(path, fig)
@@ -6,9 +6,14 @@ all publication figures in a consistent and reproducible manner across
 supported paper formats.
 
 It is intended to be used both programmatically (e.g. from CI or tests)
-and as a standalone script.
+and as a standalone script. With ``--watch``, the script first brings
+stale figures up to date through the incremental build (see
+:mod:`src.build`), then stays resident and regenerates only the figures
+affected by each source edit (see :mod:`src.watch`).
 """
 
+import argparse
+
 from src.figures.fig_alignment_operator_spectrum import generate as fig_spectrum
 from src.figures.fig_alignment_field_screening import generate as fig_screening
 from src.figures.fig_univariate_gaussian_alignment_field import generate as fig_gaussian
@@ -16,6 +21,19 @@ from src.figures.fig_univariate_gaussian_alignment_field import generate as fig_
 from src.utils.paths import SUPPORTED_FORMATS
 
 
+FIGURES = {
+    "fig_alignment_operator_spectrum": fig_spectrum,
+    "fig_alignment_field_screening": fig_screening,
+    "fig_univariate_gaussian_alignment_field": fig_gaussian,
+}
+"""
+Registry of publication figures, keyed by output name.
+
+Each value is the ``generate(formats=...)`` function of the module that
+produces the figure. Insertion order is the canonical generation order.
+"""
+
+
 def run_all(formats=None):
     """
     Generate all figures for the selected paper formats.
@@ -35,10 +53,48 @@ def run_all(formats=None):
     if formats is None:
         formats = SUPPORTED_FORMATS
 
-    fig_spectrum(formats=formats)
-    fig_screening(formats=formats)
-    fig_gaussian(formats=formats)
+    for generate in FIGURES.values():
+        generate(formats=formats)
+
+
+def main(argv=None):
+    """
+    Command-line entry point: ``python -m src.run_figures [--watch]``.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m src.run_figures",
+        description="Generate all publication figures.",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="build stale figures, then regenerate affected figures on change",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.25,
+        help="polling period in seconds (watch mode)",
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=0.3,
+        help="quiet period ending a burst of edits (watch mode)",
+    )
+    args = parser.parse_args(argv)
+
+    if not args.watch:
+        run_all()
+        return
+
+    from src.build import build
+    from src.watch import watch
+
+    # Skip figures whose recorded build digest is still current.
+    build(compiler=None)
+    watch(interval=args.interval, debounce=args.debounce)
 
 
 if __name__ == "__main__":
-    run_all()
+    main()
@@ -0,0 +1,616 @@
+"""
+Compressed, chunked archives of solved fields and sources.
+
+A field archive is a single file holding named N-d arrays split into
+regular chunks, each compressed independently with a stdlib codec
+(``zlib`` or ``lzma``):
+
+    header   b"FGAR" + format version (1 byte)
+    chunks   compressed payloads, back to back
+    index    UTF-8 JSON: per array shape, dtype, chunk shape, codec,
+             quantization and (offset, length, crc32) of every chunk
+    footer   index offset (uint64, little-endian) + b"FGAR"
+
+The index sits at the end so arrays can be streamed to disk chunk by
+chunk: :meth:`ArchiveWriter.add` reads memory-mapped arrays one chunk at
+a time and also accepts an iterator of pieces along the first axis.
+Readers load only the index on open; slicing an
+:class:`ArchivedArray` decompresses just the chunks it touches.
+
+Arrays may be quantized to ``float16`` or ``float32`` on write. The
+maximum absolute and relative (to max |x|) rounding errors are measured
+and stored in the index, so consumers can check that a snapshot is
+accurate enough for their comparison.
+
+    with ArchiveWriter(path) as archive:
+        archive.add("A", source, quantize="float32")
+        archive.add_field("phi", field)
+
+    archive = Archive(path)
+    window = archive["A"][100:200, ::4]
+"""
+
+from __future__ import annotations
+
+import io
+import itertools
+import json
+import lzma
+import os
+import struct
+import threading
+import zlib
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Any
+
+import numpy as np
+
+from src.utils.field import Field
+from src.utils.laplacian import Grid
+
+
+MAGIC = b"FGAR"
+FORMAT_VERSION = 1
+
+CODECS = ("zlib", "lzma", "none")
+"""
+Supported chunk codecs.
+"""
+
+QUANTIZATIONS = ("float16", "float32")
+"""
+Supported lossy storage dtypes for floating-point arrays.
+"""
+
+CHUNK_BYTES = 1 << 20
+"""
+Target uncompressed chunk size (1 MiB) when no chunk shape is given.
+"""
+
+CACHE_CHUNKS = 16
+"""
+Decoded chunks kept per open archive.
+"""
+
+_FOOTER = struct.Struct("<Q4s")
+
+
+# ---------------------------------------------------------------------
+# Codecs
+# ---------------------------------------------------------------------
+def _compress(data: bytes, codec: str, level: int | None) -> bytes:
+    if codec == "zlib":
+        return zlib.compress(data, 6 if level is None else level)
+    if codec == "lzma":
+        return lzma.compress(data, preset=6 if level is None else level)
+    return data
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zlib":
+        return zlib.decompress(data)
+    if codec == "lzma":
+        return lzma.decompress(data)
+    return data
+
+
+def default_chunks(shape: tuple[int, ...], itemsize: int) -> tuple[int, ...]:
+    """
+    Chunk shape of about :data:`CHUNK_BYTES`, splitting leading axes first.
+    """
+    chunks = list(shape)
+    budget = max(CHUNK_BYTES // max(itemsize, 1), 1)
+    for axis in range(len(shape)):
+        inner = int(np.prod(chunks[axis + 1:], dtype=np.int64))
+        if inner <= budget:
+            chunks[axis] = max(min(shape[axis], budget // max(inner, 1)), 1)
+            break
+        chunks[axis] = 1
+    return tuple(max(c, 1) for c in chunks)
+
+
+# ---------------------------------------------------------------------
+# Quantization
+# ---------------------------------------------------------------------
+@dataclass(frozen=True)
+class Quantization:
+    """
+    Error bounds of a lossy stored array.
+
+    Attributes
+    ----------
+    dtype : str
+        Storage dtype (``"float16"`` or ``"float32"``).
+    max_abs_error : float
+        max |x − x̃| over the array.
+    max_rel_error : float
+        ``max_abs_error / max |x|`` (0 for an all-zero array).
+    """
+
+    dtype: str
+    max_abs_error: float
+    max_rel_error: float
+
+
+def _check_quantization(dtype: np.dtype, quantize: str) -> None:
+    if quantize not in QUANTIZATIONS:
+        raise ValueError(
+            f"Unknown quantization '{quantize}'. Supported: {list(QUANTIZATIONS)}"
+        )
+    if not np.issubdtype(dtype, np.floating):
+        raise ValueError("Only floating-point arrays can be quantized")
+
+
+def _quantize_block(block: np.ndarray, dtype: str) -> tuple[np.ndarray, float, float]:
+    """
+    Round one block; return it with its max absolute error and max |x|.
+    """
+    with np.errstate(over="ignore"):
+        stored = block.astype(dtype)
+    finite = np.isfinite(block)
+    if np.any(np.isinf(stored) & finite):
+        raise ValueError(f"Values overflow the {dtype} range")
+    diff = np.abs(stored.astype(np.float64)[finite] - block[finite])
+    return stored, float(diff.max(initial=0.0)), float(np.abs(block[finite]).max(initial=0.0))
+
+
+def quantize_array(array: np.ndarray, dtype: str) -> tuple[np.ndarray, Quantization]:
+    """
+    Round an array to a lower-precision float and measure the error.
+
+    Raises
+    ------
+    ValueError
+        If ``dtype`` is unsupported, the array is not floating point, or
+        finite values overflow the target range.
+    """
+    array = np.asarray(array)
+    _check_quantization(array.dtype, dtype)
+    stored, max_abs, scale = _quantize_block(array, dtype)
+    return stored, Quantization(dtype, max_abs, max_abs / scale if scale > 0 else 0.0)
+
+
+# ---------------------------------------------------------------------
+# Chunk bands
+# ---------------------------------------------------------------------
+def _array_bands(array: np.ndarray, rows: int) -> Iterator[np.ndarray]:
+    """
+    Consecutive views of ``rows`` entries along the first axis.
+    """
+    if array.ndim == 0 or array.shape[0] == 0:
+        yield array
+        return
+    for start in range(0, array.shape[0], rows):
+        yield array[start:start + rows]
+
+
+def _stream_bands(
+    pieces: Iterator, rows: int, dtype: np.dtype, trailing: tuple[int, ...]
+) -> Iterator[np.ndarray]:
+    """
+    Regroup pieces along the first axis into bands of ``rows`` entries.
+
+    At most one band plus one piece is held in memory.
+    """
+    buffer: list[np.ndarray] = []
+    count = 0
+    for piece in pieces:
+        piece = np.asarray(piece, dtype=dtype)
+        if piece.ndim == 0 or piece.shape[1:] != trailing:
+            raise ValueError(
+                f"Streamed piece of shape {piece.shape} does not have trailing shape {trailing}"
+            )
+        buffer.append(piece)
+        count += piece.shape[0]
+        while count >= rows:
+            data = np.concatenate(buffer) if len(buffer) > 1 else buffer[0]
+            yield data[:rows]
+            rest = data[rows:]
+            buffer = [rest] if rest.shape[0] else []
+            count = rest.shape[0]
+    if count:
+        yield np.concatenate(buffer) if len(buffer) > 1 else buffer[0]
+
+
+# ---------------------------------------------------------------------
+# Writing
+# ---------------------------------------------------------------------
+class ArchiveWriter:
+    """
+    Stream arrays into a new archive.
+
+    The archive is written to a temporary file and moved into place when
+    the writer is closed, so readers never see a partial archive.
+
+    Parameters
+    ----------
+    path : Path
+        Output file.
+    codec : {"zlib", "lzma", "none"}, optional
+        Default chunk codec.
+    level : int, optional
+        Codec compression level (codec default if ``None``).
+    attrs : dict, optional
+        JSON-serializable archive-level metadata.
+    """
+
+    def __init__(self, path: Path, *, codec: str = "zlib", level: int | None = None, attrs=None):
+        if codec not in CODECS:
+            raise ValueError(f"Unknown codec '{codec}'. Supported: {list(CODECS)}")
+        self.path = Path(path)
+        self.codec = codec
+        self.level = level
+        self.attrs: dict[str, Any] = dict(attrs or {})
+        self.arrays: dict[str, dict[str, Any]] = {}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = NamedTemporaryFile(
+            "wb", dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp", delete=False
+        )
+        self._tmp = Path(self._file.name)
+        self._file.write(MAGIC + bytes([FORMAT_VERSION]))
+
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+
+    def __exit__(self, exc_type, *exc) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._file.close()
+            self._tmp.unlink(missing_ok=True)
+
+    def add(
+        self,
+        name: str,
+        array,
+        *,
+        chunks: tuple[int, ...] | None = None,
+        codec: str | None = None,
+        quantize: str | None = None,
+        attrs=None,
+    ) -> None:
+        """
+        Write one array, chunk by chunk.
+
+        Parameters
+        ----------
+        name : str
+            Unique array name (``/`` may be used for grouping).
+        array : array_like or iterator of array_like
+            Data to store. Arrays (including ``numpy.memmap``) are read one
+            chunk at a time. An iterator yields consecutive pieces along
+            the first axis (e.g. bands of a field computed row block by row
+            block); pieces are regrouped into chunk rows and written as
+            they arrive, so the whole array is never held in memory.
+        chunks : tuple of int, optional
+            Chunk shape (see :func:`default_chunks`).
+        codec : str, optional
+            Codec overriding the writer default.
+        quantize : {"float16", "float32"}, optional
+            Lossy storage dtype; error bounds are recorded in the index.
+        attrs : dict, optional
+            JSON-serializable per-array metadata.
+        """
+        if name in self.arrays:
+            raise ValueError(f"Array '{name}' already written")
+        codec = self.codec if codec is None else codec
+        if codec not in CODECS:
+            raise ValueError(f"Unknown codec '{codec}'. Supported: {list(CODECS)}")
+
+        if isinstance(array, Iterator):
+            try:
+                first = np.asarray(next(array))
+            except StopIteration:
+                raise ValueError(f"Array '{name}' has no data") from None
+            if first.ndim == 0:
+                raise ValueError("Streamed pieces need at least one axis")
+            dtype, trailing = first.dtype, first.shape[1:]
+            # The length is unknown up front; chunk as if it were unbounded.
+            shape = (CHUNK_BYTES,) + trailing
+        else:
+            array = np.asarray(array)
+            dtype, shape = array.dtype, array.shape
+        if dtype.hasobject:
+            raise ValueError("Object arrays cannot be archived")
+        if quantize is not None:
+            _check_quantization(dtype, quantize)
+        stored_dtype = np.dtype(quantize or dtype).newbyteorder("<")
+
+        chunks = default_chunks(shape, stored_dtype.itemsize) if chunks is None else tuple(chunks)
+        if len(chunks) != len(shape) or any(c < 1 for c in chunks):
+            raise ValueError(f"Invalid chunk shape {chunks} for array of shape {shape}")
+
+        if isinstance(array, Iterator):
+            bands = _stream_bands(
+                itertools.chain([first], array), chunks[0], dtype, trailing
+            )
+        else:
+            bands = _array_bands(array, chunks[0] if chunks else 1)
+
+        entries, rows = [], 0
+        max_abs, scale = 0.0, 0.0
+        for band in bands:
+            rows += band.shape[0] if band.ndim else 1
+            grid = [range(0, max(n, 1), c) for n, c in zip(band.shape[1:], chunks[1:])]
+            for corner in itertools.product(*grid):
+                block = (slice(None),) * (band.ndim > 0) + tuple(
+                    slice(s, s + c) for s, c in zip(corner, chunks[1:])
+                )
+                data = band[block]
+                if quantize is not None:
+                    data, block_abs, block_scale = _quantize_block(np.asarray(data), quantize)
+                    max_abs, scale = max(max_abs, block_abs), max(scale, block_scale)
+                raw = np.ascontiguousarray(data, dtype=stored_dtype).tobytes()
+                payload = _compress(raw, codec, self.level)
+                entries.append((self._file.tell(), len(payload), zlib.crc32(payload)))
+                self._file.write(payload)
+
+        if isinstance(array, Iterator):
+            shape = (rows,) + trailing
+        quantization = None
+        if quantize is not None:
+            quantization = Quantization(quantize, max_abs, max_abs / scale if scale > 0 else 0.0)
+        self.arrays[name] = {
+            "shape": list(shape),
+            "dtype": dtype.newbyteorder("<").str,
+            "stored_dtype": stored_dtype.str,
+            "chunks": list(chunks),
+            "codec": codec,
+            "quantization": None if quantization is None else vars(quantization),
+            "attrs": dict(attrs or {}),
+            "entries": entries,
+        }
+
+    def add_field(self, name: str, field: Field, **options) -> None:
+        """
+        Write a :class:`~src.utils.field.Field` (grid axes and values).
+
+        ``options`` (e.g. ``quantize``) apply to the values only; grid
+        axes are stored losslessly.
+        """
+        self.add(f"{name}/mu", field.grid.mu)
+        self.add(f"{name}/sigma", field.grid.sigma)
+        self.add(
+            f"{name}/values",
+            field.values,
+            attrs={"kind": field.kind, "decay_length": field.decay_length},
+            **options,
+        )
+
+    def close(self) -> Path:
+        """
+        Write the index and footer and move the archive into place.
+        """
+        if self._file.closed:
+            return self.path
+        offset = self._file.tell()
+        index = {"version": FORMAT_VERSION, "attrs": self.attrs, "arrays": self.arrays}
+        self._file.write(json.dumps(index, sort_keys=True).encode("utf-8"))
+        self._file.write(_FOOTER.pack(offset, MAGIC))
+        self._file.close()
+        os.replace(self._tmp, self.path)
+        return self.path
+
+
+def save_archive(path: Path, arrays: dict[str, Any], **options) -> Path:
+    """
+    Write a mapping of arrays in one call (``options`` go to :meth:`ArchiveWriter.add`).
+    """
+    with ArchiveWriter(path) as writer:
+        for name, array in arrays.items():
+            writer.add(name, array, **options)
+    return Path(path)
+
+
+# ---------------------------------------------------------------------
+# Reading
+# ---------------------------------------------------------------------
+class Archive:
+    """
+    Read-only view of an archive; arrays are loaded lazily.
+
+    Parameters
+    ----------
+    path : Path
+        Archive written by :class:`ArchiveWriter`.
+
+    Raises
+    ------
+    ValueError
+        If the file is not an archive of a supported version.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        self._lock = threading.Lock()
+        self._cache: OrderedDict[tuple[str, int], np.ndarray] = OrderedDict()
+        try:
+            attrs, arrays = self._read_index()
+        except BaseException:
+            self._file.close()
+            raise
+        self.attrs: dict[str, Any] = attrs
+        self._arrays: dict[str, dict[str, Any]] = arrays
+
+    def _read_index(self) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+        header = self._file.read(len(MAGIC) + 1)
+        if len(header) <= len(MAGIC) or header[:4] != MAGIC:
+            raise ValueError(f"{self.path} is not a field archive")
+        if header[4] > FORMAT_VERSION:
+            raise ValueError(f"Unsupported archive version {header[4]}")
+        end = self._file.seek(0, io.SEEK_END) - _FOOTER.size
+        if end < len(header):
+            raise ValueError(f"{self.path} is truncated")
+        self._file.seek(end)
+        offset, magic = _FOOTER.unpack(self._file.read(_FOOTER.size))
+        if magic != MAGIC or not len(header) <= offset <= end:
+            raise ValueError(f"{self.path} is truncated")
+        self._file.seek(offset)
+        try:
+            index = json.loads(self._file.read(end - offset).decode("utf-8"))
+            return index["attrs"], index["arrays"]
+        except (UnicodeDecodeError, json.JSONDecodeError, KeyError, TypeError) as exc:
+            raise ValueError(f"{self.path} has a corrupted index") from exc
+
+    def __enter__(self) -> "Archive":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._arrays
+
+    def __iter__(self):
+        return iter(self._arrays)
+
+    @property
+    def names(self) -> list[str]:
+        return list(self._arrays)
+
+    def info(self, name: str) -> dict[str, Any]:
+        """
+        Index entry of an array (shape, dtypes, chunks, codec, quantization, attrs).
+        """
+        meta = dict(self._arrays[name])
+        meta.pop("entries")
+        return meta
+
+    def __getitem__(self, name: str) -> "ArchivedArray":
+        if name not in self._arrays:
+            raise KeyError(name)
+        return ArchivedArray(self, name)
+
+    def field(self, name: str, **options) -> Field:
+        """
+        Load a field written by :meth:`ArchiveWriter.add_field`.
+        """
+        values = self[f"{name}/values"]
+        attrs = self.info(f"{name}/values")["attrs"]
+        grid = Grid(self[f"{name}/mu"].read(), self[f"{name}/sigma"].read())
+        return Field(
+            grid,
+            values.read(),
+            kind=attrs["kind"],
+            decay_length=attrs["decay_length"],
+            **options,
+        )
+
+    def _chunk(self, name: str, number: int) -> np.ndarray:
+        key = (name, number)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+            meta = self._arrays[name]
+            offset, length, crc = meta["entries"][number]
+            self._file.seek(offset)
+            payload = self._file.read(length)
+        if zlib.crc32(payload) != crc:
+            raise ValueError(f"Chunk {number} of '{name}' is corrupted")
+        raw = _decompress(payload, meta["codec"])
+        chunk = np.frombuffer(raw, dtype=np.dtype(meta["stored_dtype"]))
+        with self._lock:
+            self._cache[key] = chunk
+            while len(self._cache) > CACHE_CHUNKS:
+                self._cache.popitem(last=False)
+        return chunk
+
+
+class ArchivedArray:
+    """
+    Lazily loaded array of an :class:`Archive`.
+
+    Supports basic indexing (integers, slices with any step, ``...``);
+    only the chunks overlapping the selection are decompressed. Results
+    are returned in the array's original dtype.
+    """
+
+    def __init__(self, archive: Archive, name: str):
+        self.archive = archive
+        self.name = name
+        meta = archive._arrays[name]
+        self.shape = tuple(meta["shape"])
+        self.dtype = np.dtype(meta["dtype"])
+        self.chunks = tuple(meta["chunks"])
+        self.quantization = (
+            None if meta["quantization"] is None else Quantization(**meta["quantization"])
+        )
+        self.attrs = meta["attrs"]
+        self._grid = tuple(-(-n // c) if n else 1 for n, c in zip(self.shape, self.chunks))
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        return int(np.prod(self.shape, dtype=np.int64))
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __array__(self, dtype=None, copy=None):
+        return self.read() if dtype is None else self.read().astype(dtype)
+
+    def read(self) -> np.ndarray:
+        """
+        Decompress the whole array.
+        """
+        return self[...]
+
+    def chunk(self, index: tuple[int, ...]) -> np.ndarray:
+        """
+        Decode one chunk by its position in the chunk grid.
+        """
+        number = int(np.ravel_multi_index(index, self._grid)) if index else 0
+        start = [i * c for i, c in zip(index, self.chunks)]
+        shape = tuple(min(c, n - s) for c, n, s in zip(self.chunks, self.shape, start))
+        return self.archive._chunk(self.name, number).reshape(shape)
+
+    def _normalize(self, key) -> tuple[list[np.ndarray], list[int]]:
+        if not isinstance(key, tuple):
+            key = (key,)
+        if any(k is Ellipsis for k in key):
+            at = key.index(Ellipsis)
+            fill = (slice(None),) * (self.ndim - len(key) + 1)
+            key = key[:at] + fill + key[at + 1:]
+        if len(key) > self.ndim:
+            raise IndexError(f"Too many indices for array with {self.ndim} dimensions")
+        key = key + (slice(None),) * (self.ndim - len(key))
+
+        indices, squeeze = [], []
+        for axis, (k, n) in enumerate(zip(key, self.shape)):
+            if isinstance(k, slice):
+                indices.append(np.arange(*k.indices(n)))
+            elif isinstance(k, (int, np.integer)):
+                i = int(k) + n if k < 0 else int(k)
+                if not 0 <= i < n:
+                    raise IndexError(f"Index {k} out of bounds for axis {axis} with size {n}")
+                indices.append(np.array([i]))
+                squeeze.append(axis)
+            else:
+                raise TypeError("Archived arrays support integer and slice indexing only")
+        return indices, squeeze
+
+    def __getitem__(self, key) -> np.ndarray:
+        indices, squeeze = self._normalize(key)
+        out = np.empty(tuple(i.size for i in indices), dtype=self.dtype)
+        if out.size:
+            owners = [i // c for i, c in zip(indices, self.chunks)]
+            for index in itertools.product(*(np.unique(o) for o in owners)):
+                chunk = self.chunk(index)
+                positions = [np.flatnonzero(o == k) for o, k in zip(owners, index)]
+                local = [
+                    i[p] - k * c for i, p, k, c in zip(indices, positions, index, self.chunks)
+                ]
+                out[np.ix_(*positions)] = chunk[np.ix_(*local)]
+        return out.reshape([n for a, n in enumerate(out.shape) if a not in squeeze])
@@ -0,0 +1,611 @@
+"""
+Batched Fisher geometry for exponential families via automatic differentiation.
+
+This module generalizes the closed-form Gaussian geometry of
+:mod:`src.utils.fisher` to arbitrary (conditional) exponential families
+
+    log p(y | θ, x) = η(θ, x) · T(y) − Ψ(η(θ, x)) + log h(y),
+
+specified by three differentiable PyTorch functions: the natural
+parameter map η(θ, x), the log-partition function Ψ(η), and the
+sufficient statistic T(y). The covariate x is ``None`` for unconditional
+families (e.g. multivariate Gaussians) and a feature vector for GLMs
+(e.g. Poisson or categorical regression). Families whose Ψ is not at
+hand can instead be built from a normalized log-likelihood with
+:meth:`ExponentialFamily.from_log_likelihood`.
+
+With J = ∂η/∂θ, μ = ∇Ψ(η) and Σ = ∇²Ψ(η), the geometric quantities are
+
+    s(y; θ)  = Jᵀ (T(y) − μ)                         (score)
+    G(θ)     = E_x[ Jᵀ Σ J ]                         (Fisher–Rao metric)
+    C(θ; q)  = E_q[ s sᵀ ]                           (score covariance)
+
+Derivatives are taken with :mod:`torch.func` and vectorized with
+``vmap`` over both the batch of parameters θ and the data, so no
+per-point Python loops are involved. Results are returned as stacked
+NumPy arrays of shape ``(B, P, P)`` that plug directly into
+:func:`src.utils.fisher.alignment_diagnostic`.
+
+For unconditional families, C(θ; q) only needs the first two moments
+of T under q, which are computed once and reused for every θ.
+
+Two-parameter families plug into the finite-volume operator through
+:func:`laplacian_metric`, which exposes G as the ``volume`` and
+``inverse_metric`` callables of :class:`~src.utils.laplacian.LaplaceBeltrami`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+import torch
+from torch.func import grad, hessian, jacrev, vmap
+
+from src.utils.fisher import alignment_diagnostic
+from src.utils.tensor import SymmetricTensorField
+
+
+# ---------------------------------------------------------------------
+# Defaults
+# ---------------------------------------------------------------------
+DTYPE = torch.float64
+"""
+Floating-point type used for all autodiff computations.
+"""
+
+CHUNK_SIZE = 1024
+"""
+Number of parameter points per vectorized block.
+"""
+
+
+# ---------------------------------------------------------------------
+# Family definition
+# ---------------------------------------------------------------------
+@dataclass(frozen=True)
+class ExponentialFamily:
+    """
+    Exponential family specified through its canonical ingredients.
+
+    Attributes
+    ----------
+    natural : callable
+        ``natural(theta, x)`` returning η, shape ``(K,)``. ``theta`` has
+        shape ``(P,)``; ``x`` is ``None`` for unconditional families.
+    log_partition : callable or None
+        ``log_partition(eta)`` returning the scalar Ψ(η). May be ``None``
+        when ``geometry`` is given.
+    statistic : callable
+        ``statistic(y)`` returning T(y), shape ``(K,)``.
+    dim : int
+        Number of parameters P.
+    conditional : bool
+        Whether η depends on a per-observation covariate x.
+    geometry : callable, optional
+        ``geometry(theta, x)`` returning ``(J, Jᵀμ, JᵀΣJ)`` directly,
+        overriding the derivation from ``natural`` and ``log_partition``.
+    """
+
+    natural: Callable
+    log_partition: Callable | None
+    statistic: Callable
+    dim: int
+    conditional: bool = False
+    geometry: Callable | None = None
+
+    @classmethod
+    def from_log_likelihood(
+        cls,
+        log_likelihood: Callable,
+        statistic: Callable,
+        dim: int,
+        reference,
+        *,
+        conditional: bool = False,
+    ) -> "ExponentialFamily":
+        """
+        Family defined by a normalized log-likelihood.
+
+        ``log_likelihood(theta, y, x)`` must have the exponential-family
+        form η(θ, x) · T(y) − Ψ(η) + log h(y) for the given minimal
+        statistic T, but η and Ψ need not be known. At K + 1 reference
+        observations with affinely independent T(y₀), …, T(y_K),
+
+            η(θ) = D⁻¹ (ℓ(θ, y_k) − ℓ(θ, y₀))ₖ + c,   D = (T(y_k) − T(y₀))ₖ,
+            A(θ) = η(θ) · T(y₀) − ℓ(θ, y₀) + c′,
+
+        with θ-independent offsets c, c′ from the base measure h. Since
+        ∇A = Jᵀμ and ∇²A = JᵀΣJ + Σₖ μₖ ∇²ηₖ, the metric follows without
+        Ψ once μ is recovered from Jᵀμ (which needs rank J = K ≤ P).
+
+        Parameters
+        ----------
+        log_likelihood : callable
+            ``log_likelihood(theta, y, x)`` returning the scalar log p(y | θ, x);
+            ``x`` is ``None`` for unconditional families.
+        statistic : callable
+            Minimal sufficient statistic ``statistic(y)``, shape ``(K,)``.
+        dim : int
+            Number of parameters P.
+        reference : array_like
+            K + 1 observations with affinely independent statistics.
+        conditional : bool, optional
+            Whether the likelihood depends on a covariate x.
+
+        Returns
+        -------
+        ExponentialFamily
+
+        Raises
+        ------
+        ValueError
+            If the reference statistics are not affinely independent.
+        """
+        ref = _tensor(reference)
+        T_ref = vmap(statistic)(ref)
+        k = T_ref.shape[1]
+        D = T_ref[1:] - T_ref[0]
+        if D.shape != (k, k) or torch.linalg.matrix_rank(D) < k:
+            raise ValueError(
+                f"Need {k + 1} reference observations with affinely independent statistics"
+            )
+        D_inv = torch.linalg.inv(D)
+
+        def natural(theta, x):
+            ell = vmap(lambda y: log_likelihood(theta, y, x))(ref)
+            return D_inv @ (ell[1:] - ell[0])
+
+        def partition(theta, x):
+            ell0 = log_likelihood(theta, ref[0], x)
+            return natural(theta, x) @ T_ref[0] - ell0
+
+        jac = jacrev(natural)
+        curvature = jacrev(jacrev(natural))
+        gradient = grad(partition)
+        hess = hessian(partition)
+
+        def geometry(theta, x):
+            J = jac(theta, x)
+            b = gradient(theta, x)
+            mu = torch.linalg.solve(J @ J.T, J @ b)
+            g = hess(theta, x) - torch.einsum("k,kij->ij", mu, curvature(theta, x))
+            return J, b, g
+
+        return cls(
+            natural,
+            None,
+            statistic,
+            dim=dim,
+            conditional=conditional,
+            geometry=geometry,
+        )
+
+
+@dataclass(frozen=True)
+class FisherBatch:
+    """
+    Stacked Fisher geometry for a batch of parameter points.
+
+    Attributes
+    ----------
+    metric : numpy.ndarray
+        Fisher–Rao metric G(θ), shape ``(B, P, P)``.
+    covariance : numpy.ndarray
+        Score covariance C(θ; q), shape ``(B, P, P)``.
+    """
+
+    metric: np.ndarray
+    covariance: np.ndarray
+
+    @property
+    def inverse_metric(self) -> np.ndarray:
+        """
+        G⁻¹(θ), shape ``(B, P, P)``.
+        """
+        return np.linalg.inv(self.metric)
+
+    @property
+    def volume(self) -> np.ndarray:
+        """
+        Invariant volume density √det G(θ), shape ``(B,)``.
+        """
+        return np.sqrt(np.linalg.det(self.metric))
+
+    @property
+    def alignment(self) -> np.ndarray:
+        """
+        Isotropic alignment diagnostic A = Tr(G⁻¹ C) − P, shape ``(B,)``.
+        """
+        return alignment_diagnostic(self.inverse_metric, self.covariance)
+
+    @property
+    def alignment_tensor(self) -> SymmetricTensorField:
+        """
+        Anisotropic alignment tensor L⁻¹ C L⁻ᵀ − I (G = L Lᵀ), packed.
+        """
+        return SymmetricTensorField.alignment(self.metric, self.covariance)
+
+
+# ---------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------
+def _tensor(a) -> torch.Tensor:
+    return torch.as_tensor(np.array(a, dtype=float), dtype=DTYPE)
+
+
+def _weights(n: int, weights) -> torch.Tensor:
+    if weights is None:
+        return torch.full((n,), 1.0 / n, dtype=DTYPE)
+    w = _tensor(weights)
+    return w / w.sum()
+
+
+def _local_geometry(family: ExponentialFamily):
+    """
+    Per-point (J, Jᵀμ, JᵀΣJ) as a function of (θ, x).
+    """
+    if family.geometry is not None:
+        return family.geometry
+    jac = jacrev(family.natural, argnums=0)
+    mean = grad(family.log_partition)
+    curv = hessian(family.log_partition)
+
+    def local(theta, x):
+        eta = family.natural(theta, x)
+        J = jac(theta, x)
+        return J, J.T @ mean(eta), J.T @ curv(eta) @ J
+
+    return local
+
+
+def _chunks(thetas: torch.Tensor, chunk_size: int):
+    for start in range(0, thetas.shape[0], chunk_size):
+        yield thetas[start:start + chunk_size]
+
+
+def _unpack(family: ExponentialFamily, data):
+    if family.conditional:
+        x, y = data
+        return _tensor(x), _tensor(y)
+    return None, _tensor(data)
+
+
+# ---------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------
+def score(
+    family: ExponentialFamily, thetas, data, *, chunk_size: int = CHUNK_SIZE
+) -> np.ndarray:
+    """
+    Scores s(y_n; θ_b) for every parameter point and observation.
+
+    Parameters
+    ----------
+    family : ExponentialFamily
+        Model definition.
+    thetas : array_like
+        Parameter batch, shape ``(B, P)``.
+    data : array_like or tuple
+        Observations ``y`` of shape ``(N, ...)``, or ``(x, y)`` for
+        conditional families.
+    chunk_size : int, optional
+        Parameter points per vectorized block.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape ``(B, N, P)``.
+    """
+    x, y = _unpack(family, data)
+    T = vmap(family.statistic)(y)
+    local = _local_geometry(family)
+    thetas = _tensor(thetas).reshape(-1, family.dim)
+
+    def per_obs(theta, x_n, t_n):
+        J, b, _ = local(theta, x_n)
+        return J.T @ t_n - b
+
+    over_data = vmap(per_obs, in_dims=(None, 0 if family.conditional else None, 0))
+    per_theta = vmap(over_data, in_dims=(0, None, None))
+    out = np.empty((thetas.shape[0], T.shape[0], family.dim))
+    start = 0
+    for block in _chunks(thetas, chunk_size):
+        out[start:start + block.shape[0]] = per_theta(block, x, T).numpy()
+        start += block.shape[0]
+    return out
+
+
+def fisher_metric(
+    family: ExponentialFamily,
+    thetas,
+    covariates=None,
+    *,
+    weights=None,
+    chunk_size: int = CHUNK_SIZE,
+) -> np.ndarray:
+    """
+    Fisher–Rao metric G(θ) alone, without data from q.
+
+    Parameters
+    ----------
+    family : ExponentialFamily
+        Model definition.
+    thetas : array_like
+        Parameter batch, shape ``(B, P)``.
+    covariates : array_like, optional
+        Covariates x of shape ``(N, ...)`` defining E_x for conditional
+        families; ignored otherwise.
+    weights : array_like, optional
+        Covariate weights (uniform if ``None``).
+    chunk_size : int, optional
+        Parameter points per vectorized block.
+
+    Returns
+    -------
+    numpy.ndarray
+        G of shape ``(B, P, P)``.
+    """
+    local = _local_geometry(family)
+    thetas = _tensor(thetas).reshape(-1, family.dim)
+
+    if family.conditional:
+        if covariates is None:
+            raise ValueError("Conditional families need covariates")
+        x = _tensor(covariates)
+        w = _weights(x.shape[0], weights)
+        per_x = vmap(lambda theta, x_n: local(theta, x_n)[2], in_dims=(None, 0))
+
+        def per_theta(theta):
+            return torch.einsum("n,nij->ij", w, per_x(theta, x))
+
+    else:
+
+        def per_theta(theta):
+            return local(theta, None)[2]
+
+    batched = vmap(per_theta)
+    return torch.cat([batched(block) for block in _chunks(thetas, chunk_size)]).numpy()
+
+
+def fisher_batch(
+    family: ExponentialFamily,
+    thetas,
+    data,
+    *,
+    weights=None,
+    chunk_size: int = CHUNK_SIZE,
+) -> FisherBatch:
+    """
+    Compute G(θ) and C(θ; q) for a batch of parameter points.
+
+    Parameters
+    ----------
+    family : ExponentialFamily
+        Model definition.
+    thetas : array_like
+        Parameter batch, shape ``(B, P)``.
+    data : array_like or tuple
+        Samples from q: ``y`` of shape ``(N, ...)``, or ``(x, y)`` for
+        conditional families (whose covariates also define the
+        expectation E_x in G).
+    weights : array_like, optional
+        Non-negative sample weights (e.g. quadrature or bootstrap
+        weights). Normalized internally; uniform if ``None``.
+    chunk_size : int, optional
+        Parameter points per vectorized block.
+
+    Returns
+    -------
+    FisherBatch
+        Stacked metric and score covariance, each ``(B, P, P)``.
+    """
+    x, y = _unpack(family, data)
+    T = vmap(family.statistic)(y)
+    w = _weights(T.shape[0], weights)
+    local = _local_geometry(family)
+    thetas = _tensor(thetas).reshape(-1, family.dim)
+
+    metrics, covariances = [], []
+
+    if family.conditional:
+
+        def per_obs(theta, x_n, t_n):
+            J, b, g = local(theta, x_n)
+            return g, J.T @ t_n - b
+
+        per_theta = vmap(vmap(per_obs, in_dims=(None, 0, 0)), in_dims=(0, None, None))
+        for block in _chunks(thetas, chunk_size):
+            g, s = per_theta(block, x, T)
+            metrics.append(torch.einsum("n,bnij->bij", w, g))
+            covariances.append(torch.einsum("n,bni,bnj->bij", w, s, s))
+    else:
+        # Only the first two moments of T under q are needed.
+        m = w @ T
+        centered = T - m
+        cov_T = centered.T @ (centered * w[:, None])
+
+        def per_theta(theta):
+            J, b, g = local(theta, None)
+            d = J.T @ m - b
+            return g, J.T @ cov_T @ J + torch.outer(d, d)
+
+        batched = vmap(per_theta)
+        for block in _chunks(thetas, chunk_size):
+            g, c = batched(block)
+            metrics.append(g)
+            covariances.append(c)
+
+    return FisherBatch(
+        metric=torch.cat(metrics).numpy(),
+        covariance=torch.cat(covariances).numpy(),
+    )
+
+
+# ---------------------------------------------------------------------
+# Finite-volume operator adapter
+# ---------------------------------------------------------------------
+DIAGONAL_TOL = 1e-12
+"""
+Relative off-diagonal size |G₀₁| / √(G₀₀ G₁₁) treated as round-off.
+"""
+
+
+def laplacian_metric(
+    family: ExponentialFamily,
+    *,
+    chunk_size: int = CHUNK_SIZE,
+    tol: float = DIAGONAL_TOL,
+) -> tuple[Callable, Callable]:
+    """
+    Metric callables of a two-parameter family for the grid operator.
+
+    Parameters
+    ----------
+    family : ExponentialFamily
+        Unconditional family with θ = (θ₁, θ₂) mapped to the grid
+        coordinates (μ, σ).
+    chunk_size : int, optional
+        Parameter points per vectorized block.
+    tol : float, optional
+        Off-diagonal entries below this relative size are set to zero.
+
+    Returns
+    -------
+    tuple of callable
+        ``(volume, inverse_metric)`` for
+        :class:`~src.utils.laplacian.LaplaceBeltrami`, each accepting
+        broadcastable ``(mu, sigma)`` arrays.
+
+    Examples
+    --------
+    >>> volume, inverse_metric = laplacian_metric(diagonal_gaussian_family(1))
+    >>> K = LaplaceBeltrami(grid, volume=volume, inverse_metric=inverse_metric)
+    """
+    if family.dim != 2 or family.conditional:
+        raise ValueError("The grid operator needs an unconditional two-parameter family")
+
+    def metric(mu, sigma) -> np.ndarray:
+        mu, sigma = np.broadcast_arrays(np.asarray(mu, float), np.asarray(sigma, float))
+        thetas = np.stack([mu.ravel(), sigma.ravel()], axis=1)
+        G = fisher_metric(family, thetas, chunk_size=chunk_size)
+        off = np.abs(G[:, 0, 1]) <= tol * np.sqrt(np.abs(G[:, 0, 0] * G[:, 1, 1]))
+        G[off, 0, 1] = G[off, 1, 0] = 0.0
+        return G.reshape(mu.shape + (2, 2))
+
+    def volume(mu, sigma) -> np.ndarray:
+        return np.sqrt(np.linalg.det(metric(mu, sigma)))
+
+    def inverse_metric(mu, sigma) -> np.ndarray:
+        return np.linalg.inv(metric(mu, sigma))
+
+    return volume, inverse_metric
+
+
+# ---------------------------------------------------------------------
+# Canonical families
+# ---------------------------------------------------------------------
+def diagonal_gaussian_family(d: int) -> ExponentialFamily:
+    """
+    d-variate Gaussian with diagonal covariance, θ = (μ₁..μ_d, σ₁..σ_d).
+
+    For ``d = 1`` this reproduces the univariate geometry of
+    :mod:`src.utils.fisher`.
+    """
+
+    def natural(theta, x):
+        mu, sigma = theta[:d], theta[d:]
+        var = sigma * sigma
+        return torch.cat([mu / var, -0.5 / var])
+
+    def log_partition(eta):
+        e1, e2 = eta[:d], eta[d:]
+        return torch.sum(-e1 * e1 / (4.0 * e2) - 0.5 * torch.log(-2.0 * e2))
+
+    def statistic(y):
+        y = y.reshape(d)
+        return torch.cat([y, y * y])
+
+    return ExponentialFamily(natural, log_partition, statistic, dim=2 * d)
+
+
+def gaussian_family(d: int) -> ExponentialFamily:
+    """
+    d-variate Gaussian with full covariance Σ = L Lᵀ, θ = (μ, vech L).
+
+    L is lower triangular with positive diagonal; vech L lists its
+    entries row by row (``torch.tril_indices`` order). The statistic is
+    T(y) = (y, vec(y yᵀ)), with η = (Σ⁻¹μ, −½ vec Σ⁻¹). For ``d = 1``,
+    θ = (μ, σ) as in :func:`diagonal_gaussian_family`.
+    """
+    rows, cols = torch.tril_indices(d, d)
+    # vec L = E vech L, a gather written as a matrix product for vmap.
+    embed = torch.zeros(d * d, rows.numel(), dtype=DTYPE)
+    embed[rows * d + cols, torch.arange(rows.numel())] = 1.0
+    eye = torch.eye(d, dtype=DTYPE)
+
+    def natural(theta, x):
+        mu = theta[:d]
+        L = (embed @ theta[d:]).reshape(d, d)
+        L_inv = torch.linalg.solve_triangular(L, eye, upper=False)
+        precision = L_inv.T @ L_inv
+        return torch.cat([precision @ mu, -0.5 * precision.reshape(-1)])
+
+    def log_partition(eta):
+        e1 = eta[:d]
+        e2 = eta[d:].reshape(d, d)
+        # Ψ depends only on the symmetric part of η₂, like ⟨η₂, y yᵀ⟩.
+        precision = -(e2 + e2.T)
+        # inv and cholesky keep second derivatives exact under vmap, where
+        # those of solve and slogdet are not reliable across torch releases.
+        log_det = 2.0 * torch.log(torch.diagonal(torch.linalg.cholesky(precision))).sum()
+        return 0.5 * e1 @ torch.linalg.inv(precision) @ e1 - 0.5 * log_det
+
+    def statistic(y):
+        y = y.reshape(d)
+        return torch.cat([y, torch.outer(y, y).reshape(-1)])
+
+    return ExponentialFamily(natural, log_partition, statistic, dim=d + rows.numel())
+
+
+def poisson_glm_family(p: int) -> ExponentialFamily:
+    """
+    Poisson regression with log link, θ = β ∈ ℝᵖ, η = xᵀβ.
+    """
+
+    def natural(theta, x):
+        return (x @ theta).reshape(1)
+
+    def log_partition(eta):
+        return torch.exp(eta).sum()
+
+    def statistic(y):
+        return y.reshape(1)
+
+    return ExponentialFamily(natural, log_partition, statistic, dim=p, conditional=True)
+
+
+def categorical_glm_family(p: int, k: int) -> ExponentialFamily:
+    """
+    Multinomial logistic regression with ``k`` classes and ``p`` features.
+
+    The first class is the reference (η₀ = 0), so θ = vec(W) with
+    W of shape ``(k − 1, p)`` and η = (0, W x). Labels are integer
+    class indices.
+    """
+
+    def natural(theta, x):
+        W = theta.reshape(k - 1, p)
+        return torch.cat([torch.zeros(1, dtype=theta.dtype), W @ x])
+
+    def log_partition(eta):
+        return torch.logsumexp(eta, dim=0)
+
+    def statistic(y):
+        classes = torch.arange(k, dtype=y.dtype)
+        return (classes == y.reshape(())).to(DTYPE)
+
+    return ExponentialFamily(
+        natural, log_partition, statistic, dim=(k - 1) * p, conditional=True
+    )
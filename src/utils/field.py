@@ -0,0 +1,379 @@
+"""
+Solved fields as continuous functions of the parameters.
+
+A :class:`Field` wraps the nodal values φ of a solved field on a uniform
+(μ, σ) :class:`~src.utils.laplacian.Grid` and answers batched point
+queries at arbitrary θ:
+
+- φ(θ), via piecewise bicubic Hermite (C¹, default) or bilinear patches;
+- ∇φ(θ) = (∂_μ φ, ∂_σ φ), exact for the interpolant;
+- the Fisher norm of the gradient ‖∇φ‖²_G = G^{ij} ∂_i φ ∂_j φ.
+
+Patch coefficients are computed once and cached. Queries are fully
+vectorized: on a uniform grid the enclosing cell is found by arithmetic,
+so each point costs O(1) independent of the grid size.
+
+Points outside the grid box are evaluated at their projection θ_b onto
+the box and damped with distance,
+
+    φ(θ) = φ(θ_b) exp(−‖θ − θ_b‖ / ℓ),
+
+so the field decays to zero away from the solved domain.
+
+Fields serialize to a directory of ``.npy`` files that worker processes
+can open memory-mapped (:meth:`Field.save`, :meth:`Field.load`).
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from src.utils.fisher import gaussian_inverse_metric
+from src.utils.laplacian import Grid
+
+
+KINDS = ("cubic", "linear")
+"""
+Supported interpolation kinds.
+"""
+
+CHUNK_SIZE = 65536
+"""
+Query points per vectorized block, bounding temporaries to
+``CHUNK_SIZE × 16`` elements.
+"""
+
+DECAY_LENGTH = 1.0
+"""
+Default extrapolation decay length ℓ in coordinate units.
+"""
+
+# Cubic Hermite basis: (p0, p1, d0, d1) -> power coefficients (1, t, t², t³).
+_HERMITE = np.array(
+    [
+        [1.0, 0.0, 0.0, 0.0],
+        [0.0, 0.0, 1.0, 0.0],
+        [-3.0, 3.0, -2.0, -1.0],
+        [2.0, -2.0, 1.0, 1.0],
+    ]
+)
+# Linear basis: (p0, p1) -> (1, t).
+_LINEAR = np.array([[1.0, 0.0], [-1.0, 1.0]])
+
+
+# ---------------------------------------------------------------------
+# Query results
+# ---------------------------------------------------------------------
+@dataclass(frozen=True)
+class FieldQuery:
+    """
+    Field values and derivatives at a batch of points.
+
+    Attributes
+    ----------
+    value : numpy.ndarray
+        φ(θ), shape ``shape``.
+    gradient : numpy.ndarray
+        (∂_μ φ, ∂_σ φ), shape ``(2,) + shape``.
+    fisher_norm : numpy.ndarray
+        G^{ij} ∂_i φ ∂_j φ, shape ``shape`` (NaN where σ ≤ 0).
+    """
+
+    value: np.ndarray
+    gradient: np.ndarray
+    fisher_norm: np.ndarray
+
+
+# ---------------------------------------------------------------------
+# Field
+# ---------------------------------------------------------------------
+class Field:
+    """
+    Interpolated scalar field on a uniform (μ, σ) grid.
+
+    Parameters
+    ----------
+    grid : Grid
+        Grid on which ``values`` are given.
+    values : array_like
+        Nodal values, shape ``grid.shape``.
+    kind : {"cubic", "linear"}, optional
+        Interpolant: C¹ bicubic Hermite patches with finite-difference
+        nodal derivatives, or bilinear patches.
+    decay_length : float, optional
+        Extrapolation length ℓ outside the grid box.
+    inverse_metric : callable, optional
+        ``inverse_metric(mu, sigma)`` returning G^{ij}, shape ``(..., 2, 2)``.
+
+    Raises
+    ------
+    ValueError
+        If ``kind`` is unknown, ``decay_length`` is not positive or the
+        values do not match the grid.
+    """
+
+    def __init__(
+        self,
+        grid: Grid,
+        values,
+        *,
+        kind: str = "cubic",
+        decay_length: float = DECAY_LENGTH,
+        inverse_metric: Callable = gaussian_inverse_metric,
+    ):
+        if kind not in KINDS:
+            raise ValueError(f"Unknown kind '{kind}'. Supported: {list(KINDS)}")
+        if not decay_length > 0.0:
+            raise ValueError(f"Decay length must be positive, got {decay_length}")
+        values = np.asarray(values)
+        if values.shape != grid.shape:
+            raise ValueError(f"Expected values of shape {grid.shape}, got {values.shape}")
+        self.grid = grid
+        self.values = values
+        self.kind = kind
+        self.decay_length = float(decay_length)
+        self.inverse_metric = inverse_metric
+
+    # -----------------------------------------------------------------
+    # Interpolant
+    # -----------------------------------------------------------------
+    @cached_property
+    def coefficients(self) -> np.ndarray:
+        """
+        Patch coefficients a_kl of Σ a_kl vᵏ uˡ in unit cell coordinates.
+
+        Shape ``(n_sigma − 1, n_mu − 1, d, d)`` with ``d = 4`` (cubic) or
+        ``d = 2`` (linear); ``u`` runs along μ and ``v`` along σ.
+        """
+        f = np.asarray(self.values, dtype=float)
+
+        def corners(a):
+            # (v0u0, v0u1), (v1u0, v1u1) per cell
+            return (
+                (a[:-1, :-1], a[:-1, 1:]),
+                (a[1:, :-1], a[1:, 1:]),
+            )
+
+        if self.kind == "linear":
+            F = np.stack([np.stack(row, axis=-1) for row in corners(f)], axis=-2)
+            return np.einsum("ka,ijab,lb->ijkl", _LINEAR, F, _LINEAR)
+
+        # Nodal derivatives in index units (second-order one-sided at edges).
+        fu = np.gradient(f, axis=1, edge_order=2)
+        fv = np.gradient(f, axis=0, edge_order=2)
+        fuv = np.gradient(fu, axis=0, edge_order=2)
+
+        (f00, f01), (f10, f11) = corners(f)
+        (u00, u01), (u10, u11) = corners(fu)
+        (v00, v01), (v10, v11) = corners(fv)
+        (w00, w01), (w10, w11) = corners(fuv)
+        F = np.stack(
+            [
+                np.stack([f00, f01, u00, u01], axis=-1),
+                np.stack([f10, f11, u10, u11], axis=-1),
+                np.stack([v00, v01, w00, w01], axis=-1),
+                np.stack([v10, v11, w10, w11], axis=-1),
+            ],
+            axis=-2,
+        )
+        return np.ascontiguousarray(np.einsum("ka,ijab,lb->ijkl", _HERMITE, F, _HERMITE))
+
+    # -----------------------------------------------------------------
+    # Queries
+    # -----------------------------------------------------------------
+    def _locate(self, mu: np.ndarray, sigma: np.ndarray):
+        # Callers replace non-finite coordinates first: casting NaN to an
+        # integer index is undefined.
+        grid = self.grid
+        mu_b = np.clip(mu, grid.mu[0], grid.mu[-1])
+        sigma_b = np.clip(sigma, grid.sigma[0], grid.sigma[-1])
+        s = (mu_b - grid.mu[0]) / grid.h_mu
+        t = (sigma_b - grid.sigma[0]) / grid.h_sigma
+        j = np.minimum(s.astype(np.intp), grid.mu.size - 2)
+        i = np.minimum(t.astype(np.intp), grid.sigma.size - 2)
+        return i, j, t - i, s - j, mu - mu_b, sigma - sigma_b
+
+    def _evaluate(self, mu: np.ndarray, sigma: np.ndarray, derivatives: bool):
+        finite = np.isfinite(mu) & np.isfinite(sigma)
+        if not finite.all():
+            value, gradient = self._evaluate(
+                np.where(finite, mu, self.grid.mu[0]),
+                np.where(finite, sigma, self.grid.sigma[0]),
+                derivatives,
+            )
+            value[~finite] = np.nan
+            if gradient is not None:
+                gradient[:, ~finite] = np.nan
+            return value, gradient
+
+        i, j, v, u, d_mu, d_sigma = self._locate(mu, sigma)
+        C = self.coefficients[i, j]
+        d = C.shape[-1]
+        exponents = np.arange(d)
+        U = u[:, None] ** exponents
+        V = v[:, None] ** exponents
+
+        CU = np.einsum("nkl,nl->nk", C, U)
+        value = np.einsum("nk,nk->n", V, CU)
+
+        distance = np.hypot(d_mu, d_sigma)
+        damping = np.exp(-distance / self.decay_length)
+        if not derivatives:
+            return value * damping, None
+
+        dU = np.zeros_like(U)
+        dV = np.zeros_like(V)
+        dU[:, 1:] = exponents[1:] * U[:, :-1]
+        dV[:, 1:] = exponents[1:] * V[:, :-1]
+        grad_mu = np.einsum("nk,nkl,nl->n", V, C, dU) / self.grid.h_mu
+        grad_sigma = np.einsum("nk,nk->n", dV, CU) / self.grid.h_sigma
+
+        # Clamped coordinates do not vary with θ; the damping does.
+        grad_mu = np.where(d_mu == 0.0, grad_mu, 0.0)
+        grad_sigma = np.where(d_sigma == 0.0, grad_sigma, 0.0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            radial = np.where(distance > 0.0, value / (self.decay_length * distance), 0.0)
+        gradient = np.stack(
+            [(grad_mu - radial * d_mu) * damping, (grad_sigma - radial * d_sigma) * damping]
+        )
+        return value * damping, gradient
+
+    def _batches(self, mu, sigma, chunk_size: int):
+        mu, sigma = np.broadcast_arrays(np.asarray(mu, float), np.asarray(sigma, float))
+        return mu.shape, mu.reshape(-1), sigma.reshape(-1), range(0, mu.size, chunk_size)
+
+    def __call__(self, mu, sigma, *, chunk_size: int = CHUNK_SIZE) -> np.ndarray:
+        """
+        Evaluate φ at arbitrary points.
+
+        Parameters
+        ----------
+        mu, sigma : array_like
+            Query coordinates (broadcast against each other).
+        chunk_size : int, optional
+            Points per vectorized block.
+
+        Returns
+        -------
+        numpy.ndarray
+            φ with the broadcast shape of ``mu`` and ``sigma``; NaN at
+            non-finite query points.
+        """
+        shape, mu, sigma, blocks = self._batches(mu, sigma, chunk_size)
+        out = np.empty(mu.size)
+        for start in blocks:
+            block = slice(start, start + chunk_size)
+            out[block] = self._evaluate(mu[block], sigma[block], False)[0]
+        return out.reshape(shape)
+
+    def query(self, mu, sigma, *, chunk_size: int = CHUNK_SIZE) -> FieldQuery:
+        """
+        Evaluate φ, ∇φ and ‖∇φ‖²_G at arbitrary points in one pass.
+
+        Parameters
+        ----------
+        mu, sigma : array_like
+            Query coordinates (broadcast against each other).
+        chunk_size : int, optional
+            Points per vectorized block.
+
+        Returns
+        -------
+        FieldQuery
+            All entries are NaN at non-finite query points.
+        """
+        shape, mu, sigma, blocks = self._batches(mu, sigma, chunk_size)
+        value = np.empty(mu.size)
+        gradient = np.empty((2, mu.size))
+        norm = np.empty(mu.size)
+        for start in blocks:
+            block = slice(start, start + chunk_size)
+            value[block], g = self._evaluate(mu[block], sigma[block], True)
+            gradient[:, block] = g
+            sigma_b = sigma[block]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                G_inv = self.inverse_metric(mu[block], np.where(sigma_b > 0.0, sigma_b, np.nan))
+            norm[block] = np.einsum("in,nij,jn->n", g, G_inv, g)
+        return FieldQuery(
+            value.reshape(shape),
+            gradient.reshape((2,) + shape),
+            norm.reshape(shape),
+        )
+
+    def gradient(self, mu, sigma, *, chunk_size: int = CHUNK_SIZE) -> np.ndarray:
+        """
+        Coordinate gradient (∂_μ φ, ∂_σ φ), shape ``(2,) + shape``.
+        """
+        return self.query(mu, sigma, chunk_size=chunk_size).gradient
+
+    def fisher_norm(self, mu, sigma, *, chunk_size: int = CHUNK_SIZE) -> np.ndarray:
+        """
+        Fisher norm of the gradient G^{ij} ∂_i φ ∂_j φ.
+        """
+        return self.query(mu, sigma, chunk_size=chunk_size).fisher_norm
+
+    # -----------------------------------------------------------------
+    # Serialization
+    # -----------------------------------------------------------------
+    def save(self, path: Path) -> Path:
+        """
+        Write the field to a directory of ``.npy`` arrays.
+
+        The cached patch coefficients are stored as well, so loading never
+        recomputes the interpolant. A custom ``inverse_metric`` is not
+        serialized; pass it again to :meth:`load`.
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        arrays = {
+            "mu": self.grid.mu,
+            "sigma": self.grid.sigma,
+            "values": self.values,
+            "coefficients": self.coefficients,
+        }
+        for name, array in arrays.items():
+            np.save(path / f"{name}.npy", np.ascontiguousarray(array))
+        meta = {"kind": self.kind, "decay_length": self.decay_length}
+        (path / "field.json").write_text(json.dumps(meta, indent=2) + "\n")
+        return path
+
+    @classmethod
+    def load(
+        cls,
+        path: Path,
+        *,
+        mmap: bool = True,
+        inverse_metric: Callable = gaussian_inverse_metric,
+    ) -> "Field":
+        """
+        Load a field written by :meth:`save`.
+
+        Parameters
+        ----------
+        path : Path
+            Directory written by :meth:`save`.
+        mmap : bool, optional
+            Open values and coefficients memory-mapped (read-only), so
+            several processes share one copy through the page cache.
+        inverse_metric : callable, optional
+            Metric used for Fisher-norm queries.
+        """
+        path = Path(path)
+        mode = "r" if mmap else None
+        meta = json.loads((path / "field.json").read_text())
+        grid = Grid(np.load(path / "mu.npy"), np.load(path / "sigma.npy"))
+        field = cls(
+            grid,
+            np.load(path / "values.npy", mmap_mode=mode),
+            kind=meta["kind"],
+            decay_length=meta["decay_length"],
+            inverse_metric=inverse_metric,
+        )
+        field.__dict__["coefficients"] = np.load(path / "coefficients.npy", mmap_mode=mode)
+        return field
@@ -0,0 +1,131 @@
+"""
+Fisher–Rao geometry of the univariate Gaussian family.
+
+This module collects the closed-form geometric quantities used
+throughout the paper for the family
+
+    p(x | μ, σ) = N(μ, σ²),   θ = (μ, σ),
+
+namely the Fisher–Rao metric, its inverse, the invariant volume element,
+the score function, and the isotropic alignment diagnostic
+
+    A(θ; q) = Tr(G⁻¹ C) − D.
+
+All functions are vectorized: parameters may be scalars or arrays of any
+(broadcast-compatible) shape, and results carry the same leading shape.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+# ---------------------------------------------------------------------
+# Dimension of the parameter manifold
+# ---------------------------------------------------------------------
+GAUSSIAN_DIM = 2
+"""
+Dimension D of the univariate Gaussian manifold θ = (μ, σ).
+"""
+
+
+# ---------------------------------------------------------------------
+# Metric and volume
+# ---------------------------------------------------------------------
+def gaussian_metric(mu, sigma) -> np.ndarray:
+    """
+    Fisher–Rao metric G_ij(μ, σ) = diag(σ⁻², 2σ⁻²).
+
+    Parameters
+    ----------
+    mu, sigma : array_like
+        Mean and standard deviation (broadcast together).
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape ``broadcast(mu, sigma).shape + (2, 2)``.
+    """
+    mu, sigma = np.broadcast_arrays(np.asarray(mu, float), np.asarray(sigma, float))
+    inv_var = sigma**-2
+    G = np.zeros(sigma.shape + (2, 2))
+    G[..., 0, 0] = inv_var
+    G[..., 1, 1] = 2.0 * inv_var
+    return G
+
+
+def gaussian_inverse_metric(mu, sigma) -> np.ndarray:
+    """
+    Inverse Fisher–Rao metric G^ij(μ, σ) = diag(σ², σ²/2).
+
+    Parameters
+    ----------
+    mu, sigma : array_like
+        Mean and standard deviation (broadcast together).
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape ``broadcast(mu, sigma).shape + (2, 2)``.
+    """
+    mu, sigma = np.broadcast_arrays(np.asarray(mu, float), np.asarray(sigma, float))
+    var = sigma**2
+    G_inv = np.zeros(sigma.shape + (2, 2))
+    G_inv[..., 0, 0] = var
+    G_inv[..., 1, 1] = 0.5 * var
+    return G_inv
+
+
+def gaussian_volume(mu, sigma) -> np.ndarray:
+    """
+    Invariant volume density √det G = √2 σ⁻².
+    """
+    mu, sigma = np.broadcast_arrays(np.asarray(mu, float), np.asarray(sigma, float))
+    return np.sqrt(2.0) / sigma**2
+
+
+# ---------------------------------------------------------------------
+# Score function
+# ---------------------------------------------------------------------
+def gaussian_score(x, mu, sigma) -> np.ndarray:
+    """
+    Score ∂_θ log p(x | μ, σ) of the univariate Gaussian family.
+
+    Parameters
+    ----------
+    x, mu, sigma : array_like
+        Observation and parameters (broadcast together).
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape ``(2,) + broadcast(x, mu, sigma).shape`` with
+        components ``(s_μ, s_σ)``.
+    """
+    z = (np.asarray(x, float) - mu) / sigma
+    return np.stack(np.broadcast_arrays(z / sigma, (z * z - 1.0) / sigma))
+
+
+# ---------------------------------------------------------------------
+# Alignment diagnostic
+# ---------------------------------------------------------------------
+def alignment_diagnostic(G_inv, C) -> np.ndarray:
+    """
+    Isotropic alignment diagnostic A = Tr(G⁻¹ C) − D.
+
+    Parameters
+    ----------
+    G_inv : array_like
+        Inverse metric, shape ``(..., D, D)``.
+    C : array_like
+        Empirical score covariance, shape ``(..., D, D)``.
+
+    Returns
+    -------
+    numpy.ndarray
+        Scalar field of shape ``(...)``.
+    """
+    G_inv = np.asarray(G_inv)
+    C = np.asarray(C)
+    D = G_inv.shape[-1]
+    return np.einsum("...ij,...ji->...", G_inv, C) - D
@@ -0,0 +1,327 @@
+"""
+Discrete Laplace–Beltrami operator on the (μ, σ) half-plane.
+
+The operator is discretized in conservative (divergence) form,
+
+    Δ_G φ = (1/√det G) ∂_i ( √det G · G^{ij} ∂_j φ ),
+
+on a uniform tensor grid with a five-point finite-volume stencil. The
+discrete operator is written as
+
+    −Δ_G φ ≈ M⁻¹ K φ,
+
+where K is the symmetric positive (semi-)definite stiffness matrix built
+from face fluxes and M = diag(√det G · h_μ h_σ) is the Fisher-volume
+mass matrix. The field equation −Δ_G φ = −γ A therefore becomes the
+symmetric system K φ = −γ M A, and spectral problems are posed as the
+generalized eigenproblem K v = λ M v.
+
+Boundary conditions:
+
+- ``"dirichlet"``: φ = 0 on a ghost layer one spacing outside the grid;
+- ``"neumann"``: zero flux through the outer faces (K has the constant
+  vector as zero mode).
+
+Arrays follow the ``np.meshgrid(mu, sigma)`` layout: shape
+``(n_sigma, n_mu)``, rows indexed by σ and columns by μ.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Callable
+
+import numpy as np
+import scipy.sparse as sp
+
+from src.utils.fisher import gaussian_inverse_metric, gaussian_volume
+from src.utils.precision import PrecisionPolicy, get_policy
+from src.utils.tiling import evaluate_grid
+
+
+BOUNDARY_CONDITIONS = ("dirichlet", "neumann")
+"""
+Supported boundary conditions.
+"""
+
+
+# ---------------------------------------------------------------------
+# Grid
+# ---------------------------------------------------------------------
+@dataclass(frozen=True, eq=False)
+class Grid:
+    """
+    Uniform tensor grid on the (μ, σ) half-plane.
+
+    Attributes
+    ----------
+    mu : numpy.ndarray
+        Equally spaced μ nodes, shape ``(n_mu,)``.
+    sigma : numpy.ndarray
+        Equally spaced σ nodes, shape ``(n_sigma,)``.
+    """
+
+    mu: np.ndarray
+    sigma: np.ndarray
+
+    def __post_init__(self):
+        for name in ("mu", "sigma"):
+            nodes = np.ascontiguousarray(getattr(self, name), dtype=float)
+            if nodes.ndim != 1 or nodes.size < 3:
+                raise ValueError(f"Grid axis '{name}' needs at least 3 nodes")
+            steps = np.diff(nodes)
+            if not np.allclose(steps, steps[0], rtol=1e-9, atol=0.0) or steps[0] <= 0:
+                raise ValueError(f"Grid axis '{name}' must be increasing and uniform")
+            nodes.setflags(write=False)
+            object.__setattr__(self, name, nodes)
+        if self.sigma[0] - self.h_sigma <= 0.0:
+            raise ValueError(
+                "Grid must stay inside the half-plane: "
+                "sigma[0] must exceed h_sigma (ghost layer)"
+            )
+
+    @classmethod
+    def linspace(cls, mu_range, sigma_range, shape) -> "Grid":
+        """
+        Build a grid from ``(min, max)`` ranges and ``(n_sigma, n_mu)``.
+        """
+        n_sigma, n_mu = shape
+        return cls(np.linspace(*mu_range, n_mu), np.linspace(*sigma_range, n_sigma))
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """
+        Array shape ``(n_sigma, n_mu)``.
+        """
+        return (self.sigma.size, self.mu.size)
+
+    @property
+    def size(self) -> int:
+        return self.sigma.size * self.mu.size
+
+    @property
+    def h_mu(self) -> float:
+        return float(self.mu[1] - self.mu[0])
+
+    @property
+    def h_sigma(self) -> float:
+        return float(self.sigma[1] - self.sigma[0])
+
+    def mesh(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return ``(MU, SIGMA)`` as produced by ``np.meshgrid(mu, sigma)``.
+        """
+        return np.meshgrid(self.mu, self.sigma)
+
+    @cached_property
+    def key(self) -> str:
+        """
+        Stable content hash identifying the grid (for on-disk caches).
+        """
+        h = hashlib.sha256()
+        for nodes in (self.mu, self.sigma):
+            h.update(np.asarray(nodes.size).tobytes())
+            h.update(nodes.astype("<f8").tobytes())
+        return h.hexdigest()[:16]
+
+
+# ---------------------------------------------------------------------
+# Operator
+# ---------------------------------------------------------------------
+class LaplaceBeltrami:
+    """
+    Finite-volume Laplace–Beltrami operator for a diagonal metric.
+
+    Parameters
+    ----------
+    grid : Grid
+        Discretization grid.
+    bc : {"dirichlet", "neumann"}, optional
+        Boundary condition.
+    precision : str or PrecisionPolicy, optional
+        Precision policy; coefficients are kept in ``storage`` dtype.
+    volume : callable, optional
+        ``volume(mu, sigma)`` returning √det G.
+    inverse_metric : callable, optional
+        ``inverse_metric(mu, sigma)`` returning G^{ij}, shape ``(..., 2, 2)``.
+        Off-diagonal terms must vanish.
+    """
+
+    def __init__(
+        self,
+        grid: Grid,
+        *,
+        bc: str = "dirichlet",
+        precision: str | PrecisionPolicy = "double",
+        volume: Callable = gaussian_volume,
+        inverse_metric: Callable = gaussian_inverse_metric,
+    ):
+        if bc not in BOUNDARY_CONDITIONS:
+            raise ValueError(
+                f"Unknown boundary condition '{bc}'. "
+                f"Supported: {list(BOUNDARY_CONDITIONS)}"
+            )
+        self.grid = grid
+        self.bc = bc
+        self.policy = get_policy(precision)
+
+        hm, hs = grid.h_mu, grid.h_sigma
+        mu_faces = np.concatenate([grid.mu - 0.5 * hm, grid.mu[-1:] + 0.5 * hm])
+        sigma_faces = np.concatenate(
+            [grid.sigma - 0.5 * hs, grid.sigma[-1:] + 0.5 * hs]
+        )
+
+        def flux_coefficient(axis, scale):
+            def coefficient(mu, sigma, out):
+                G_inv = inverse_metric(mu, sigma)
+                if np.any(G_inv[..., 0, 1] != 0.0):
+                    raise ValueError("Only diagonal metrics are supported")
+                return volume(mu, sigma) * G_inv[..., axis, axis] * scale
+
+            return coefficient
+
+        # Exact coefficients are kept in float64 only for refinement.
+        exact_dtype = self.policy.accumulate if self.policy.refine else self.policy.storage
+        # Tiles are written straight into ``exact_dtype``, so no full-size
+        # meshgrid or float64 temporary exists when it is float32.
+        # μ-faces: shape (n_sigma, n_mu + 1); σ-faces: shape (n_sigma + 1, n_mu)
+        cx = evaluate_grid(
+            flux_coefficient(0, hs / hm), (mu_faces, grid.sigma), dtype=exact_dtype
+        )
+        cy = evaluate_grid(
+            flux_coefficient(1, hm / hs), (grid.mu, sigma_faces), dtype=exact_dtype
+        )
+        mass = evaluate_grid(
+            lambda mu, sigma, out: volume(mu, sigma) * (hm * hs), grid, dtype=exact_dtype
+        )
+
+        if bc == "neumann":
+            cx[:, [0, -1]] = 0.0
+            cy[[0, -1], :] = 0.0
+
+        diagonal = np.add(cx[:, :-1], cx[:, 1:])
+        diagonal += cy[:-1, :]
+        diagonal += cy[1:, :]
+        exact = (cx, cy, mass, diagonal)
+        self._coefficients = {
+            self.policy.storage: tuple(self.policy.store(c) for c in exact)
+        }
+        if self.policy.refine:
+            # Refinement residuals need the operator itself to float64 accuracy.
+            self._coefficients[exact_dtype] = exact
+        self.cx, self.cy, self.mass, self._diagonal = self._coefficients[
+            self.policy.storage
+        ]
+
+    def coefficients(self, dtype=None) -> tuple[np.ndarray, ...]:
+        """
+        Return ``(cx, cy, mass, diagonal)`` best suited to a dtype.
+
+        Under a refining policy, ``accumulate`` dtype yields coefficients
+        kept at full precision; otherwise the storage copies are returned.
+        """
+        dtype = self.policy.storage if dtype is None else np.dtype(dtype)
+        return self._coefficients.get(dtype, self._coefficients[self.policy.storage])
+
+    # -----------------------------------------------------------------
+    # Matrix-free application
+    # -----------------------------------------------------------------
+    def stiffness(
+        self,
+        phi: np.ndarray,
+        dtype=None,
+        *,
+        out: np.ndarray | None = None,
+        work: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """
+        Apply the stiffness matrix: K φ (= −M Δ_G φ).
+
+        Parameters
+        ----------
+        phi : numpy.ndarray
+            Field of shape ``grid.shape``.
+        dtype : numpy dtype, optional
+            Arithmetic dtype; defaults to the policy's ``compute`` dtype.
+            Pass ``np.float64`` for refinement residuals (full-precision
+            coefficients are used when the policy keeps them).
+        out : numpy.ndarray, optional
+            Output buffer of shape ``grid.shape`` and dtype ``dtype``.
+        work : numpy.ndarray, optional
+            Scratch buffer like ``out``; with both buffers given the
+            application allocates no temporaries.
+
+        Returns
+        -------
+        numpy.ndarray
+            K φ with the same shape as ``phi``.
+        """
+        dtype = self.policy.compute if dtype is None else np.dtype(dtype)
+        cx, cy, _, diag = self.coefficients(dtype)
+        phi = np.asarray(phi, dtype=dtype).reshape(self.grid.shape)
+        out = np.multiply(diag, phi, out=out, dtype=dtype)
+        if work is None:
+            work = np.empty_like(out)
+
+        # Off-diagonal couplings across interior faces.
+        couplings = (
+            (cx[:, 1:-1], np.s_[:, 1:], np.s_[:, :-1]),
+            (cy[1:-1, :], np.s_[1:, :], np.s_[:-1, :]),
+        )
+        for c, upper, lower in couplings:
+            np.multiply(c, phi[lower], out=work[upper])
+            out[upper] -= work[upper]
+            np.multiply(c, phi[upper], out=work[lower])
+            out[lower] -= work[lower]
+        return out
+
+    def __call__(self, phi: np.ndarray) -> np.ndarray:
+        """
+        Apply the Laplace–Beltrami operator: Δ_G φ = −M⁻¹ K φ.
+        """
+        return -self.stiffness(phi) / self.mass
+
+    def diagonal(self) -> np.ndarray:
+        """
+        Diagonal of K, shape ``grid.shape``.
+        """
+        return self._diagonal
+
+    # -----------------------------------------------------------------
+    # Assembled form
+    # -----------------------------------------------------------------
+    def matrix(self, dtype=None) -> sp.csr_matrix:
+        """
+        Assemble K as a sparse CSR matrix.
+
+        Parameters
+        ----------
+        dtype : numpy dtype, optional
+            Matrix dtype; defaults to the policy's ``storage`` dtype.
+        """
+        dtype = self.policy.storage if dtype is None else np.dtype(dtype)
+        cx, cy, _, diag = self.coefficients(dtype)
+        idx = np.arange(self.grid.size).reshape(self.grid.shape)
+
+        wx = np.asarray(cx[:, 1:-1], dtype=dtype).ravel()
+        wy = np.asarray(cy[1:-1, :], dtype=dtype).ravel()
+        left, right = idx[:, :-1].ravel(), idx[:, 1:].ravel()
+        below, above = idx[:-1, :].ravel(), idx[1:, :].ravel()
+
+        rows = np.concatenate([left, right, below, above, idx.ravel()])
+        cols = np.concatenate([right, left, above, below, idx.ravel()])
+        vals = np.concatenate(
+            [-wx, -wx, -wy, -wy, np.asarray(diag, dtype=dtype).ravel()]
+        )
+        K = sp.coo_matrix((vals, (rows, cols)), shape=(self.grid.size,) * 2)
+        return K.tocsr()
+
+    def mass_matrix(self, dtype=None) -> sp.dia_matrix:
+        """
+        Diagonal Fisher-volume mass matrix M as a sparse matrix.
+        """
+        dtype = self.policy.storage if dtype is None else np.dtype(dtype)
+        mass = self.coefficients(dtype)[2]
+        return sp.diags(np.asarray(mass, dtype=dtype).ravel())
@@ -12,6 +12,8 @@ when accessed.
 
 from __future__ import annotations
 
+import os
+import threading
 from pathlib import Path
 from typing import Iterable, Iterator
 
@@ -43,6 +45,18 @@ Root directory containing all paper formats.
 """
 
 
+# ---------------------------------------------------------------------
+# Cache root
+# ---------------------------------------------------------------------
+CACHE_DIR: Path = ROOT_DIR / ".cache"
+"""
+Root directory for persisted numerical artifacts (e.g. eigenbases).
+
+Contents are derived data keyed by content hashes and can be deleted
+at any time.
+"""
+
+
 # ---------------------------------------------------------------------
 # Supported paper formats
 # ---------------------------------------------------------------------
@@ -86,6 +100,23 @@ def _paper_dir(format: str) -> Path:
     return PAPER_DIR / format
 
 
+def paper_dir(format: str) -> Path:
+    """
+    Return the root directory of a given paper format.
+
+    Parameters
+    ----------
+    format : str
+        Paper format identifier.
+
+    Returns
+    -------
+    Path
+        Path to the paper directory (not created).
+    """
+    return _paper_dir(format)
+
+
 def figures_dir(format: str) -> Path:
     """
     Return (and create if necessary) the figures directory
@@ -183,3 +214,49 @@ def figure_paths_all_formats(
 
     for fmt in formats:
         yield figure_path(name, format=fmt, ext=ext)
+
+
+def write_bytes_if_changed(path: Path, data: bytes) -> bool:
+    """
+    Write ``data`` to ``path`` unless the file already holds those bytes.
+
+    Skipping identical writes leaves the modification time untouched, so
+    mtime- or hash-based downstream builds (e.g. ``latexmk``) see that
+    nothing changed.
+
+    Parameters
+    ----------
+    path : Path
+        Destination file path.
+    data : bytes
+        Full file contents.
+
+    Returns
+    -------
+    bool
+        ``True`` if the file was (re)written, ``False`` if it was skipped.
+
+    Notes
+    -----
+    New contents are written to a sibling temporary file and moved into
+    place with :func:`os.replace`, so readers never observe a partially
+    written figure.
+    """
+    path = Path(path)
+
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+
+    tmp = path.with_name(
+        f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+    return True
@@ -5,9 +5,28 @@ All figures are guaranteed to satisfy:
 - minimum DPI: 300
 - minimum linear resolution: 1200 px
 - vector-safe output (PDF)
+- byte-stable output: identical content yields identical files
+
+Two figure-creation paths are available. :func:`setup_figure` creates a
+pyplot-managed figure and makes it current, for interactive use and
+``plt.*`` calls. :func:`new_figure` creates a standalone
+:class:`~matplotlib.figure.Figure` on its own Agg canvas, unknown to
+pyplot. Figures built this way through the explicit Figure/Axes API
+share no global state and can render concurrently in separate threads.
+All other helpers accept either kind.
 """
 
-import matplotlib.pyplot as plt
+import io
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+
+import matplotlib
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from src.utils.paths import write_bytes_if_changed
 
 
 # ---------------------------------------------------------------------
@@ -17,6 +36,85 @@ MIN_DPI = 300
 MIN_PIXELS = 1200
 
 
+# ---------------------------------------------------------------------
+# Reproducible output metadata
+# ---------------------------------------------------------------------
+CREATOR = "Fisher-Geometric Action figure pipeline"
+"""
+Fixed creator string embedded in every saved figure.
+"""
+
+SVG_HASHSALT = "fisher-geometric-action"
+"""
+Fixed salt for SVG element identifiers (otherwise randomized per run).
+"""
+
+_SVG_LOCK = threading.Lock()
+"""
+Serializes SVG saves, the only renders that read ``svg.hashsalt``.
+"""
+
+
+def source_date() -> datetime | None:
+    """
+    Return the reproducible build date, if any.
+
+    Follows the ``SOURCE_DATE_EPOCH`` convention
+    (https://reproducible-builds.org/specs/source-date-epoch/).
+
+    Returns
+    -------
+    datetime or None
+        UTC timestamp from ``SOURCE_DATE_EPOCH``, or ``None`` if the
+        variable is unset, in which case no date is embedded at all.
+
+    Raises
+    ------
+    ValueError
+        If ``SOURCE_DATE_EPOCH`` is set but is not an integer.
+    """
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if epoch is None or epoch == "":
+        return None
+    try:
+        return datetime.fromtimestamp(int(epoch), tz=timezone.utc)
+    except ValueError:
+        raise ValueError(
+            f"SOURCE_DATE_EPOCH must be an integer, got {epoch!r}"
+        ) from None
+
+
+def deterministic_metadata(fmt: str) -> dict | None:
+    """
+    Build backend metadata that does not vary between runs.
+
+    Parameters
+    ----------
+    fmt : str
+        Output format (e.g. ``"pdf"``, ``"svg"``, ``"png"``).
+
+    Returns
+    -------
+    dict or None
+        Metadata mapping for :meth:`Figure.savefig`, or ``None`` for
+        formats that embed no metadata.
+    """
+    date = source_date()
+
+    if fmt == "pdf":
+        return {"Creator": CREATOR, "CreationDate": date}
+    if fmt == "svg":
+        return {
+            "Creator": CREATOR,
+            "Date": date.isoformat() if date is not None else None,
+        }
+    if fmt == "png":
+        return {"Software": CREATOR}
+    if fmt in ("ps", "eps"):
+        return {"Creator": CREATOR}
+    return None
+
+
 # ---------------------------------------------------------------------
 # Figure creation
 # ---------------------------------------------------------------------
@@ -41,11 +139,67 @@ def setup_figure(
     -------
     matplotlib.figure.Figure
     """
+    import matplotlib.pyplot as plt
+
     dpi = max(dpi, MIN_DPI)
     fig = plt.figure(figsize=(width, height), dpi=dpi)
     return fig
 
 
+def new_figure(
+    width: float = 5.5,
+    height: float = 3.5,
+    dpi: int = MIN_DPI,
+) -> Figure:
+    """
+    Create a standalone figure on an Agg canvas, bypassing pyplot.
+
+    The figure is not registered with pyplot (no current-figure state,
+    no figure manager) and is released by garbage collection, so it is
+    safe to build and save from any thread.
+
+    Parameters
+    ----------
+    width : float
+        Figure width in inches.
+    height : float
+        Figure height in inches.
+    dpi : int
+        Dots per inch (minimum enforced).
+
+    Returns
+    -------
+    matplotlib.figure.Figure
+    """
+    fig = Figure(figsize=(width, height), dpi=max(dpi, MIN_DPI))
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def new_axes(
+    width: float = 5.5,
+    height: float = 3.5,
+    dpi: int = MIN_DPI,
+):
+    """
+    Create a standalone figure with a single axes (see :func:`new_figure`).
+
+    Returns
+    -------
+    tuple
+        ``(fig, ax)``.
+    """
+    fig = new_figure(width, height, dpi)
+    return fig, fig.add_subplot()
+
+
+def is_pyplot_figure(fig) -> bool:
+    """
+    Whether ``fig`` is managed by pyplot (created by ``plt.figure``).
+    """
+    return getattr(fig.canvas, "manager", None) is not None
+
+
 # ---------------------------------------------------------------------
 # Resolution enforcement
 # ---------------------------------------------------------------------
@@ -70,30 +224,63 @@ def ensure_min_resolution(fig, min_pixels: int = MIN_PIXELS):
 # ---------------------------------------------------------------------
 # Saving
 # ---------------------------------------------------------------------
+def _savefig_svg(fig, buffer, options: dict) -> None:
+    """
+    Save ``fig`` as SVG with the fixed :data:`SVG_HASHSALT`.
+
+    Matplotlib reads the salt only from the global ``rcParams`` (there is
+    no per-call option), so exactly that one key is swapped and restored
+    under :data:`_SVG_LOCK`. Unlike ``rc_context``, this never rewrites
+    other ``rcParams`` entries, so concurrent renders in other formats
+    are unaffected.
+    """
+    rc = matplotlib.rcParams
+    with _SVG_LOCK:
+        previous = rc["svg.hashsalt"]
+        rc["svg.hashsalt"] = SVG_HASHSALT
+        try:
+            fig.savefig(buffer, **options)
+        finally:
+            rc["svg.hashsalt"] = previous
+
+
 def finalize_figure(
     path,
     fig=None,
     dpi: int = MIN_DPI,
     tight: bool = True,
     close: bool = True,
-):
+) -> bool:
     """
     Finalize and save a figure with guaranteed editorial quality.
 
+    Output is byte-stable: creation timestamps are omitted (or taken
+    from ``SOURCE_DATE_EPOCH``) and the creator string is fixed. If the
+    rendered bytes equal the existing file, the write is skipped and
+    its modification time is preserved.
+
     Parameters
     ----------
     path : Path
         Output file path.
     fig : matplotlib.figure.Figure, optional
-        Figure object (defaults to current figure).
+        Figure object (defaults to the current pyplot figure).
     dpi : int
         Output DPI (minimum enforced).
     tight : bool
         Apply tight_layout before saving.
     close : bool
-        Close figure after saving.
+        Close the figure after saving if pyplot manages it (standalone
+        figures from :func:`new_figure` need no closing).
+
+    Returns
+    -------
+    bool
+        ``True`` if the file was written, ``False`` if it was unchanged.
     """
     if fig is None:
+        import matplotlib.pyplot as plt
+
         fig = plt.gcf()
 
     dpi = max(dpi, MIN_DPI)
@@ -103,29 +290,56 @@ def finalize_figure(
     if tight:
         fig.tight_layout()
 
-    fig.savefig(
-        path,
+    path = Path(path)
+    fmt = path.suffix[1:].lower() or matplotlib.rcParams["savefig.format"]
+
+    buffer = io.BytesIO()
+    options = dict(
+        format=fmt,
         dpi=dpi,
         bbox_inches="tight",
+        metadata=deterministic_metadata(fmt),
     )
+    if fmt == "svg":
+        _savefig_svg(fig, buffer, options)
+    else:
+        fig.savefig(buffer, **options)
+
+    written = write_bytes_if_changed(path, buffer.getvalue())
+
+    if close and is_pyplot_figure(fig):
+        import matplotlib.pyplot as plt
 
-    if close:
         plt.close(fig)
 
+    return written
+
 
 # ---------------------------------------------------------------------
 # Small helpers (semantic, not stylistic)
 # ---------------------------------------------------------------------
-def add_fisher_equilibrium_line(y: float = 1.0):
+def _current_axes(ax):
+    if ax is not None:
+        return ax
+    import matplotlib.pyplot as plt
+
+    return plt.gca()
+
+
+def add_fisher_equilibrium_line(y: float = 1.0, ax=None):
     """
     Add a reference line corresponding to Fisher equilibrium.
+
+    Draws on ``ax`` if given, otherwise on the current pyplot axes.
     """
-    plt.axhline(y, linestyle="--", linewidth=1.0)
+    ax = _current_axes(ax)
+    ax.axhline(y, linestyle="--", linewidth=1.0)
 
 
-def set_axis_labels(xlabel: str, ylabel: str):
+def set_axis_labels(xlabel: str, ylabel: str, ax=None):
     """
-    Standardized axis labeling.
+    Standardized axis labeling (on ``ax`` or the current pyplot axes).
     """
-    plt.xlabel(xlabel)
-    plt.ylabel(ylabel)
+    ax = _current_axes(ax)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
@@ -0,0 +1,609 @@
+"""
+Solvers for the Fisher–geometric field equation.
+
+This module solves the (optionally screened) field equation
+
+    (−Δ_G + m²) φ = −γ A(θ; q)
+
+on a uniform (μ, σ) grid, discretized by :class:`LaplaceBeltrami` as the
+symmetric system
+
+    (K + m² M) φ = −γ M A.
+
+Two methods are available:
+
+- ``"direct"``: sparse LU factorization (SuperLU);
+- ``"cg"``: Jacobi-preconditioned conjugate gradients, matrix-free.
+
+Both honour the operator's precision policy. Under ``"mixed"``, the
+inner solve runs in float32 (float32 factorization or float32 CG with
+float64 reductions) and is wrapped in iterative refinement: residuals
+are recomputed in float64 and corrections accumulated in float64, so
+the result matches the float64 path to storage precision.
+
+With Neumann boundaries and m = 0 the operator has a constant zero mode:
+the source is projected onto the compatible (zero Fisher-volume mean)
+subspace and the solution is normalized to zero Fisher-volume mean.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+
+from src.utils.field import DECAY_LENGTH, Field
+from src.utils.laplacian import LaplaceBeltrami
+from src.utils import telemetry
+from src.utils.precision import DOUBLE, PrecisionPolicy
+
+
+METHODS = ("direct", "cg")
+"""
+Supported solution methods.
+"""
+
+INNER_TOLERANCE = 1e-4
+"""
+Relative tolerance of each float32 inner solve during refinement.
+"""
+
+MAX_REFINEMENTS = 20
+"""
+Upper bound on iterative-refinement sweeps.
+"""
+
+
+# ---------------------------------------------------------------------
+# Conjugate gradients
+# ---------------------------------------------------------------------
+def conjugate_gradient(
+    apply: Callable[[np.ndarray], np.ndarray],
+    b: np.ndarray,
+    *,
+    x0: np.ndarray | None = None,
+    inverse_diagonal: np.ndarray | None = None,
+    tol: float = 1e-10,
+    maxiter: int | None = None,
+    policy: PrecisionPolicy = DOUBLE,
+    callback: Callable[[float], None] | None = None,
+) -> tuple[np.ndarray, int, bool]:
+    """
+    Preconditioned conjugate gradients for a symmetric positive operator.
+
+    Parameters
+    ----------
+    apply : callable
+        Matrix-free operator application.
+    b : numpy.ndarray
+        Right-hand side.
+    x0 : numpy.ndarray, optional
+        Initial guess (zero if ``None``).
+    inverse_diagonal : numpy.ndarray, optional
+        Jacobi preconditioner (inverse of the operator diagonal).
+    tol : float, optional
+        Relative residual tolerance ‖r‖ ≤ tol ‖b‖.
+    maxiter : int, optional
+        Iteration cap (default: ``10 * b.size``).
+    policy : PrecisionPolicy, optional
+        Vectors use ``compute`` dtype; inner products accumulate in
+        ``accumulate`` dtype.
+    callback : callable, optional
+        Called with the relative residual norm after every iteration.
+
+    Returns
+    -------
+    tuple
+        ``(x, iterations, converged)``.
+    """
+    dtype = policy.compute
+    b = np.asarray(b, dtype=dtype)
+    maxiter = 10 * b.size if maxiter is None else maxiter
+    # Iterations update x, r, z and p in place; apply(p) is the only
+    # further grid-sized allocation and doubles as scratch space.
+
+    if x0 is None:
+        x = np.zeros_like(b)
+        r = b.copy()
+    else:
+        x = np.array(x0, dtype=dtype).reshape(b.shape)
+        r = b - apply(x)
+
+    b_norm = policy.norm(b)
+    if b_norm == 0.0:
+        return np.zeros_like(b), 0, True
+
+    z = r if inverse_diagonal is None else np.multiply(r, inverse_diagonal, dtype=dtype)
+    p = z.copy()
+    rz = policy.dot(r, z)
+
+    for iteration in range(maxiter + 1):
+        r_norm = policy.norm(r)
+        if callback is not None and iteration > 0:
+            callback(r_norm / b_norm)
+        if r_norm <= tol * b_norm:
+            return x, iteration, True
+        if iteration == maxiter:
+            break
+        Ap = apply(p)
+        alpha = dtype.type(rz / policy.dot(p, Ap))
+        Ap *= alpha
+        r -= Ap
+        np.multiply(p, alpha, out=Ap)
+        x += Ap
+        del Ap
+        if inverse_diagonal is not None:
+            np.multiply(r, inverse_diagonal, out=z)
+        rz_next = policy.dot(r, z)
+        p *= dtype.type(rz_next / rz)
+        p += z
+        rz = rz_next
+
+    return x, maxiter, False
+
+
+# ---------------------------------------------------------------------
+# Field equation
+# ---------------------------------------------------------------------
+def is_singular(operator: LaplaceBeltrami, m: float) -> bool:
+    """
+    Whether (K + m² M) has a zero mode (Neumann boundaries, m = 0).
+    """
+    return operator.bc == "neumann" and m == 0.0
+
+
+def field_rhs(operator: LaplaceBeltrami, source, gamma: float = 1.0) -> np.ndarray:
+    """
+    Right-hand side −γ M A.
+
+    Built in ``accumulate`` precision when the policy refines (the
+    refinement residuals need it) and in ``compute`` precision otherwise,
+    so single-precision solves hold no float64 grid arrays.
+    """
+    policy = operator.policy
+    dtype = policy.accumulate if policy.refine else policy.compute
+    mass = operator.coefficients(dtype)[2]
+    source = np.asarray(source, dtype=dtype).reshape(operator.grid.shape)
+    b = np.multiply(mass, source, dtype=dtype)
+    b *= dtype.type(-gamma)
+    return b
+
+
+def project_compatible(operator: LaplaceBeltrami, b: np.ndarray) -> tuple[np.ndarray, float]:
+    """
+    Remove the zero-mode component of a right-hand side.
+
+    Returns
+    -------
+    tuple
+        ``(b_projected, compatibility_residual)``, where the residual is
+        Σ b / Σ M, i.e. the Fisher-volume mean of the raw source term.
+    """
+    mass = operator.coefficients(b.dtype)[2]
+    mean = float(b.sum(dtype=np.float64) / mass.sum(dtype=np.float64))
+    projected = np.multiply(mass, -mean, dtype=b.dtype)
+    projected += b
+    return projected, mean
+
+
+def remove_mean(operator: LaplaceBeltrami, phi: np.ndarray) -> np.ndarray:
+    """
+    Normalize a field to zero Fisher-volume mean (in place).
+    """
+    mass = operator.mass
+    phi -= phi.dtype.type(
+        np.add.reduce((mass * phi).ravel(), dtype=np.float64) / mass.sum(dtype=np.float64)
+    )
+    return phi
+
+
+def system_matrix(operator: LaplaceBeltrami, m: float = 0.0, dtype=None) -> sp.csc_matrix:
+    """
+    Assemble K + m² M in CSC format, pinning one node if singular.
+    """
+    A = operator.matrix(dtype=dtype)
+    if m != 0.0:
+        A = A + (m * m) * operator.mass_matrix(dtype=dtype)
+    A = A.tocsc()
+    if is_singular(operator, m):
+        A = A.tolil()
+        A[0, :] = 0.0
+        A[:, 0] = 0.0
+        A[0, 0] = 1.0
+        A = A.tocsc()
+    return A
+
+
+class FieldSolver:
+    """
+    Reusable solver for (−Δ_G + m²) φ = −γ A on a fixed operator.
+
+    Everything that depends only on the operator (the LU factorization
+    for ``"direct"``, the Jacobi preconditioner for ``"cg"``) is built
+    once and reused by every :meth:`solve` call, so repeated solves with
+    changing sources cost one back-substitution or a warm-started CG run.
+
+    Parameters
+    ----------
+    operator : LaplaceBeltrami
+        Discrete operator (fixes grid, boundary condition and precision).
+    m : float, optional
+        Screening mass (``0`` for the pure Poisson equation).
+    method : {"direct", "cg"}, optional
+        Linear solver.
+    tol : float, optional
+        Relative residual tolerance (CG and refinement).
+    maxiter : int, optional
+        CG iteration cap.
+
+    Raises
+    ------
+    ValueError
+        If ``method`` is unknown.
+    """
+
+    def __init__(
+        self,
+        operator: LaplaceBeltrami,
+        *,
+        m: float = 0.0,
+        method: str = "direct",
+        tol: float = 1e-10,
+        maxiter: int | None = None,
+    ):
+        if method not in METHODS:
+            raise ValueError(f"Unknown method '{method}'. Supported: {list(METHODS)}")
+        self.operator = operator
+        self.m = float(m)
+        self.method = method
+        self.tol = tol
+        self.maxiter = maxiter
+        self.singular = is_singular(operator, self.m)
+        self._lu = None
+        self._lu_bytes = 0
+        self._inverse_diagonal = None
+        self._work: dict[np.dtype, np.ndarray] = {}
+        self._record = None
+
+    # -----------------------------------------------------------------
+    # Operator application
+    # -----------------------------------------------------------------
+    def apply(self, v: np.ndarray, dtype=None) -> np.ndarray:
+        """
+        Apply K + m² M (matrix-free).
+        """
+        if self._record is not None:
+            self._record.operator_applications += 1
+        dtype = self.operator.policy.compute if dtype is None else np.dtype(dtype)
+        work = self._work.get(dtype)
+        if work is None:
+            work = self._work[dtype] = np.empty(self.operator.grid.shape, dtype=dtype)
+        out = self.operator.stiffness(v, dtype=dtype, work=work)
+        if self.m != 0.0:
+            mass = self.operator.coefficients(dtype)[2]
+            np.multiply(mass, v.reshape(out.shape), out=work, dtype=dtype)
+            work *= dtype.type(self.m * self.m)
+            out += work
+        return out
+
+    def factorize(self):
+        """
+        Return the (cached) sparse LU factorization of K + m² M.
+        """
+        if self._lu is None:
+            policy = self.operator.policy
+            started = time.perf_counter()
+            lu = spla.splu(system_matrix(self.operator, self.m, dtype=policy.storage))
+            if self._record is not None:
+                self._record.factorization_time += time.perf_counter() - started
+            # Values plus 32-bit row indices of both triangular factors.
+            self._lu_bytes = int((lu.L.nnz + lu.U.nnz) * (lu.L.dtype.itemsize + 4))
+            self._lu = lu
+        return self._lu
+
+    def _inner(self, rhs: np.ndarray, tolerance: float, guess=None) -> np.ndarray:
+        policy = self.operator.policy
+        shape = self.operator.grid.shape
+
+        if self.method == "direct":
+            rhs = np.array(rhs, dtype=policy.storage).reshape(-1)
+            if self.singular:
+                rhs[0] = 0.0
+            return self.factorize().solve(rhs).reshape(shape)
+
+        if self._inverse_diagonal is None:
+            op = self.operator
+            inverse = np.multiply(op.mass, self.m * self.m, dtype=policy.compute)
+            inverse += op.diagonal()
+            self._inverse_diagonal = np.reciprocal(inverse, out=inverse)
+        x, _, converged = conjugate_gradient(
+            self.apply,
+            rhs,
+            x0=guess,
+            inverse_diagonal=self._inverse_diagonal,
+            tol=tolerance,
+            maxiter=self.maxiter,
+            policy=policy,
+            callback=None if self._record is None else self._record.residual,
+        )
+        if not converged:
+            raise RuntimeError("Conjugate gradients did not converge")
+        return x
+
+    # -----------------------------------------------------------------
+    # Solve
+    # -----------------------------------------------------------------
+    def solve(self, source, *, gamma: float = 1.0, x0=None) -> np.ndarray:
+        """
+        Solve for φ given a source A.
+
+        Parameters
+        ----------
+        source : array_like
+            Alignment source A on ``operator.grid``.
+        gamma : float, optional
+            Coupling constant γ.
+        x0 : array_like, optional
+            Initial guess (warm start) for CG and refinement.
+
+        Returns
+        -------
+        numpy.ndarray
+            φ with shape ``grid.shape`` and the policy's ``storage`` dtype.
+
+        Raises
+        ------
+        RuntimeError
+            If CG or iterative refinement fails to converge.
+        """
+        operator = self.operator
+        policy = operator.policy
+        record = telemetry.start(
+            "field",
+            self.method,
+            operator.grid.shape,
+            m=self.m,
+            bc=operator.bc,
+            precision=policy.name,
+            tol=self.tol,
+        )
+        started = time.perf_counter()
+        self._record = record
+        try:
+            b = field_rhs(operator, source, gamma)
+            compatibility = None
+            if self.singular:
+                b, compatibility = project_compatible(operator, b)
+
+            if not policy.refine:
+                phi = self._inner(b, self.tol, guess=x0)
+            else:
+                phi = _refine(
+                    self._inner,
+                    lambda v: self.apply(v, dtype=policy.accumulate),
+                    b,
+                    tol=self.tol,
+                    x0=x0,
+                    project=(
+                        (lambda r: project_compatible(operator, r)[0])
+                        if self.singular
+                        else None
+                    ),
+                    callback=None if record is None else record.refinements.append,
+                )
+
+            phi = np.asarray(phi, dtype=policy.storage)
+            if self.singular:
+                remove_mean(operator, phi)
+        finally:
+            self._record = None
+
+        if record is not None:
+            elapsed = time.perf_counter() - started
+            # Reuse the residual the solve already computed; only direct
+            # solves pay for one, and only when the session asks.
+            history = record.refinements if policy.refine else record.residuals
+            extra = {}
+            if history:
+                extra["final_residual"] = history[-1]
+            elif telemetry.residuals_requested():
+                extra["final_residual"] = self._relative_residual(b, phi)
+            telemetry.finish(
+                record,
+                solve_time=elapsed,
+                factorization_bytes=self._lu_bytes,
+                compatibility_residual=compatibility,
+                converged=True,
+                extra=extra,
+            )
+        return phi
+
+    def _relative_residual(self, b: np.ndarray, phi: np.ndarray) -> float:
+        """
+        ‖b − (K + m² M) φ‖ / ‖b‖ in ``accumulate`` precision.
+        """
+        b = np.asarray(b, dtype=self.operator.policy.accumulate)
+        residual = b - self.apply(phi, dtype=self.operator.policy.accumulate)
+        if self.singular:
+            residual = project_compatible(self.operator, residual)[0]
+        b_norm = np.linalg.norm(b)
+        return float(np.linalg.norm(residual) / b_norm if b_norm > 0.0 else 0.0)
+
+    def solve_many(self, sources, *, gamma: float = 1.0) -> np.ndarray:
+        """
+        Solve for a block of sources (multiple right-hand sides).
+
+        With ``"direct"`` and a non-refining precision policy, all
+        right-hand sides share one back-substitution through the cached
+        factorization. Otherwise the sources are solved in turn, each CG
+        run warm-started from the previous solution.
+
+        Parameters
+        ----------
+        sources : array_like
+            Sources A, shape ``(B,) + grid.shape``.
+        gamma : float, optional
+            Coupling constant γ.
+
+        Returns
+        -------
+        numpy.ndarray
+            Fields φ, shape ``(B,) + grid.shape``, in ``storage`` dtype.
+        """
+        operator = self.operator
+        policy = operator.policy
+        shape = operator.grid.shape
+        sources = np.asarray(sources)
+        count = sources.shape[0] if sources.ndim else 0
+        sources = sources.reshape((count,) + shape)
+
+        if self.method != "direct" or policy.refine:
+            phi = np.empty((count,) + shape, dtype=policy.storage)
+            guess = None
+            for k in range(count):
+                guess = phi[k] = self.solve(sources[k], gamma=gamma, x0=guess)
+            return phi
+
+        record = telemetry.start(
+            "field",
+            "direct-block",
+            shape,
+            m=self.m,
+            bc=operator.bc,
+            precision=policy.name,
+            rhs=count,
+        )
+        started = time.perf_counter()
+        self._record = record
+        try:
+            acc = policy.accumulate
+            mass = operator.coefficients(acc)[2].astype(acc).reshape(-1)
+            b = (-gamma * mass) * sources.reshape(count, -1).astype(acc)
+            compatibility = None
+            if self.singular:
+                means = b.sum(axis=1) / mass.sum()
+                b -= means[:, None] * mass
+                compatibility = float(np.max(np.abs(means), initial=0.0))
+            rhs = np.asfortranarray(b.T, dtype=policy.storage)
+            if self.singular:
+                rhs[0, :] = 0.0
+            phi = np.ascontiguousarray(self.factorize().solve(rhs).T)
+            if self.singular:
+                mass_s = operator.mass.reshape(-1)
+                phi -= ((phi @ mass_s) / mass_s.sum())[:, None]
+        finally:
+            self._record = None
+        telemetry.finish(
+            record,
+            solve_time=time.perf_counter() - started,
+            factorization_bytes=self._lu_bytes,
+            compatibility_residual=compatibility,
+            converged=True,
+        )
+        return phi.reshape((count,) + shape)
+
+    def field(self, source, *, gamma: float = 1.0, x0=None, **options) -> Field:
+        """
+        Solve for φ and wrap it as a queryable :class:`Field`.
+
+        Parameters
+        ----------
+        source : array_like
+            Alignment source A on ``operator.grid``.
+        gamma : float, optional
+            Coupling constant γ.
+        x0 : array_like, optional
+            Initial guess (warm start) for CG and refinement.
+        **options
+            Forwarded to :class:`Field`. The extrapolation ``decay_length``
+            defaults to the screening length 1/m when m > 0.
+
+        Returns
+        -------
+        Field
+        """
+        if self.m > 0.0:
+            options.setdefault("decay_length", 1.0 / self.m)
+        else:
+            options.setdefault("decay_length", DECAY_LENGTH)
+        phi = self.solve(source, gamma=gamma, x0=x0)
+        return Field(self.operator.grid, phi, **options)
+
+
+def solve_field(
+    source,
+    operator: LaplaceBeltrami,
+    *,
+    gamma: float = 1.0,
+    m: float = 0.0,
+    method: str = "direct",
+    tol: float = 1e-10,
+    maxiter: int | None = None,
+    x0=None,
+) -> np.ndarray:
+    """
+    Solve (−Δ_G + m²) φ = −γ A on the operator's grid (one-shot).
+
+    Parameters
+    ----------
+    source : array_like
+        Alignment source A on ``operator.grid`` (shape ``grid.shape``).
+    operator : LaplaceBeltrami
+        Discrete operator (fixes grid, boundary condition and precision).
+    gamma : float, optional
+        Coupling constant γ.
+    m : float, optional
+        Screening mass (``0`` for the pure Poisson equation).
+    method : {"direct", "cg"}, optional
+        Linear solver.
+    tol : float, optional
+        Relative residual tolerance (CG and refinement).
+    maxiter : int, optional
+        CG iteration cap.
+    x0 : array_like, optional
+        Initial guess for CG.
+
+    Returns
+    -------
+    numpy.ndarray
+        φ with shape ``grid.shape`` and the policy's ``storage`` dtype.
+
+    Notes
+    -----
+    Use :class:`FieldSolver` directly to reuse factorizations across
+    repeated solves on the same operator.
+    """
+    solver = FieldSolver(operator, m=m, method=method, tol=tol, maxiter=maxiter)
+    return solver.solve(source, gamma=gamma, x0=x0)
+
+
+def _refine(inner, residual_apply, b, *, tol, x0=None, project=None, callback=None):
+    """
+    Iterative refinement: low-precision corrections, float64 residuals.
+
+    Residuals are rescaled to unit max-norm before each inner solve so
+    that float32 corrections neither underflow nor overflow. ``callback``
+    receives the relative residual after every sweep.
+    """
+    x = np.zeros_like(b) if x0 is None else np.array(x0, dtype=b.dtype).reshape(b.shape)
+    r = b - residual_apply(x) if x0 is not None else b.copy()
+    b_norm = np.linalg.norm(b)
+    if b_norm == 0.0:
+        return x
+
+    for _ in range(MAX_REFINEMENTS):
+        if project is not None:
+            r = project(r)
+        if np.linalg.norm(r) <= tol * b_norm:
+            return x
+        scale = np.max(np.abs(r))
+        x += scale * inner(r / scale, INNER_TOLERANCE)
+        r = b - residual_apply(x)
+        if callback is not None:
+            residual = r if project is None else project(r)
+            callback(float(np.linalg.norm(residual) / b_norm))
+
+    raise RuntimeError("Iterative refinement did not converge")
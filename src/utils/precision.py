@@ -0,0 +1,166 @@
+"""
+Floating-point precision policies for grid-scale field computations.
+
+A policy fixes three dtypes:
+
+- ``storage``: dtype of grid arrays kept in memory (sources, fields,
+  stencil coefficients, factorizations);
+- ``compute``: dtype of element-wise stencil arithmetic;
+- ``accumulate``: dtype of reductions (dot products, norms) and of the
+  residuals used for iterative refinement.
+
+Three presets are provided:
+
+- ``"double"``: everything in float64 (the reference path);
+- ``"single"``: everything in float32 except reductions;
+- ``"mixed"``: float32 storage and stencils, float64 accumulation and
+  float64 iterative refinement of linear solves.
+
+Single and mixed policies halve the memory and bandwidth of grid arrays.
+Operator construction and CG solves allocate no float64 grid arrays
+under ``"single"`` (coefficients are evaluated in row blocks, reductions
+in :data:`REDUCE_BLOCK`-sized pieces), so the peak memory of a CG solve
+drops by about 2× relative to ``"double"``: about twice as many grid
+points fit in the same memory. A 4× gain is out of reach with float32
+because the stencil coefficients and the Krylov vectors are themselves
+grid arrays. ``"mixed"`` keeps float64 copies of the coefficients for
+refinement residuals, so its peak is not lower than ``"double"``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+REDUCE_BLOCK = 65536
+"""
+Elements per block in accumulated reductions (bounds their temporaries).
+"""
+
+
+# ---------------------------------------------------------------------
+# Policy definition
+# ---------------------------------------------------------------------
+@dataclass(frozen=True)
+class PrecisionPolicy:
+    """
+    Dtypes used for storage, element-wise compute and accumulation.
+
+    Attributes
+    ----------
+    name : str
+        Policy identifier.
+    storage, compute, accumulate : numpy.dtype
+        See module docstring.
+    refine : bool
+        Whether linear solves are iteratively refined in ``accumulate``
+        precision.
+    """
+
+    name: str
+    storage: np.dtype
+    compute: np.dtype
+    accumulate: np.dtype
+    refine: bool
+
+    def store(self, a) -> np.ndarray:
+        """
+        Return ``a`` as a storage-precision array (no copy if possible).
+        """
+        return np.asarray(a, dtype=self.storage)
+
+    def dot(self, a: np.ndarray, b: np.ndarray) -> float:
+        """
+        Inner product accumulated in ``accumulate`` precision.
+
+        Computed in blocks, so no grid-sized product array is allocated.
+        """
+        a, b = np.ravel(a), np.ravel(b)
+        total = 0.0
+        for start in range(0, a.size, REDUCE_BLOCK):
+            block = slice(start, start + REDUCE_BLOCK)
+            total += float(np.add.reduce(a[block] * b[block], dtype=self.accumulate))
+        return total
+
+    def norm(self, a: np.ndarray) -> float:
+        """
+        Euclidean norm accumulated in ``accumulate`` precision.
+        """
+        return float(np.sqrt(self.dot(a, a)))
+
+
+DOUBLE = PrecisionPolicy(
+    "double", np.dtype(np.float64), np.dtype(np.float64), np.dtype(np.float64), False
+)
+SINGLE = PrecisionPolicy(
+    "single", np.dtype(np.float32), np.dtype(np.float32), np.dtype(np.float64), False
+)
+MIXED = PrecisionPolicy(
+    "mixed", np.dtype(np.float32), np.dtype(np.float32), np.dtype(np.float64), True
+)
+
+POLICIES: dict[str, PrecisionPolicy] = {
+    p.name: p for p in (DOUBLE, SINGLE, MIXED)
+}
+"""
+Registered precision policies by name.
+"""
+
+
+def get_policy(precision: str | PrecisionPolicy) -> PrecisionPolicy:
+    """
+    Resolve a policy name or instance.
+
+    Raises
+    ------
+    ValueError
+        If the name is not a registered policy.
+    """
+    if isinstance(precision, PrecisionPolicy):
+        return precision
+    try:
+        return POLICIES[precision]
+    except KeyError:
+        raise ValueError(
+            f"Unknown precision '{precision}'. "
+            f"Supported precisions: {sorted(POLICIES)}"
+        ) from None
+
+
+# ---------------------------------------------------------------------
+# Accuracy reporting
+# ---------------------------------------------------------------------
+def accuracy_report(result, reference, weights=None) -> dict[str, float]:
+    """
+    Compare a reduced-precision result against the float64 reference.
+
+    Parameters
+    ----------
+    result : array_like
+        Field computed under a reduced-precision policy.
+    reference : array_like
+        Same field computed under :data:`DOUBLE`.
+    weights : array_like, optional
+        Quadrature weights (e.g. Fisher volume) for the L2 norms.
+
+    Returns
+    -------
+    dict
+        ``max_abs_error``, ``rel_l2_error`` and ``bytes_ratio`` (memory of
+        ``result`` relative to ``reference``).
+    """
+    result = np.asarray(result)
+    reference = np.asarray(reference, dtype=np.float64)
+    diff = result.astype(np.float64) - reference
+    w = 1.0 if weights is None else np.asarray(weights, dtype=np.float64)
+
+    ref_norm = np.sqrt(np.sum(w * reference**2))
+    err_norm = np.sqrt(np.sum(w * diff**2))
+
+    return {
+        "max_abs_error": float(np.max(np.abs(diff))) if diff.size else 0.0,
+        "rel_l2_error": float(err_norm / ref_norm) if ref_norm > 0 else float(err_norm),
+        "bytes_ratio": result.nbytes / reference.nbytes if reference.nbytes else 1.0,
+    }
@@ -0,0 +1,630 @@
+"""
+Adaptive quadtree discretization of the (μ, σ) half-plane.
+
+Fisher distances scale like 1/σ, so uniform grids over-resolve large σ
+and under-resolve small σ. A :class:`QuadtreeMesh` starts from a coarse
+grid of equal rectangular root cells and recursively splits cells whose
+
+- Fisher size sqrt(G_μμ h_μ² + G_σσ h_σ²) exceeds a target, and/or
+- source variation across the cell exceeds a fraction of max |A|,
+
+then enforces 2:1 balance (face neighbours differ by at most one level).
+
+:class:`QuadtreeLaplaceBeltrami` is the conservative cell-centred
+finite-volume operator on the leaves, written like its uniform
+counterpart as −Δ_G φ ≈ M⁻¹ K φ with symmetric K assembled from
+two-point face fluxes
+
+    c_f = √det G · G^{nn}(x_f) · |f| / d_f,
+
+where |f| is the face length and d_f the normal distance between the
+adjacent cell centres (or from the centre to the boundary). The
+approximation is second order on uniform patches and first order at
+coarse–fine interfaces. Dirichlet conditions impose φ = 0 on the box
+boundary; Neumann conditions set boundary fluxes to zero.
+
+The operator exposes the same interface as
+:class:`~src.utils.laplacian.LaplaceBeltrami` (``grid``, ``bc``,
+``policy``, ``coefficients``, ``stiffness``, ``matrix``,
+``mass_matrix``), so :class:`~src.utils.poisson.FieldSolver`, the
+spectral and action solvers run on adaptive meshes unchanged. Fields are
+vectors over the leaves; :meth:`QuadtreeMesh.resample` maps them back to
+uniform grids for plotting.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Callable
+
+import numpy as np
+import scipy.sparse as sp
+
+from src.utils.fisher import gaussian_inverse_metric, gaussian_metric, gaussian_volume
+from src.utils.laplacian import BOUNDARY_CONDITIONS, Grid
+from src.utils.precision import PrecisionPolicy, get_policy
+
+
+MAX_LEVEL = 8
+"""
+Default maximum refinement depth below the root cells.
+"""
+
+# Directions as (axis, sign); axis 0 is μ (index j), axis 1 is σ (index i).
+_DIRECTIONS = ((0, 1), (1, 1), (0, -1), (1, -1))
+
+
+def _encode(level, i, j) -> np.ndarray:
+    return (np.asarray(level, np.int64) << 52) | (np.asarray(i, np.int64) << 26) | j
+
+
+# ---------------------------------------------------------------------
+# Mesh
+# ---------------------------------------------------------------------
+@dataclass(frozen=True, eq=False)
+class QuadtreeMesh:
+    """
+    Leaves of a balanced quadtree over a (μ, σ) box.
+
+    Attributes
+    ----------
+    mu_range, sigma_range : tuple of float
+        Box [μ_min, μ_max] × [σ_min, σ_max] with σ_min > 0.
+    base : tuple of int
+        Root cells ``(n_sigma, n_mu)``.
+    level, i, j : numpy.ndarray
+        Refinement level and (σ, μ) cell indices at that level of every
+        leaf, sorted by level, then i, then j.
+    """
+
+    mu_range: tuple[float, float]
+    sigma_range: tuple[float, float]
+    base: tuple[int, int]
+    level: np.ndarray
+    i: np.ndarray
+    j: np.ndarray
+
+    def __post_init__(self):
+        if not self.sigma_range[0] > 0.0:
+            raise ValueError("The mesh must lie in the half-plane sigma > 0")
+        if self.mu_range[1] <= self.mu_range[0] or self.sigma_range[1] <= self.sigma_range[0]:
+            raise ValueError("Ranges must be increasing")
+        keys = _encode(self.level, self.i, self.j)
+        order = np.argsort(keys)
+        for name in ("level", "i", "j"):
+            array = np.ascontiguousarray(np.asarray(getattr(self, name), np.int64)[order])
+            array.setflags(write=False)
+            object.__setattr__(self, name, array)
+        object.__setattr__(self, "_keys", keys[order])
+
+    # -----------------------------------------------------------------
+    # Construction
+    # -----------------------------------------------------------------
+    @classmethod
+    def uniform(cls, mu_range, sigma_range, base) -> "QuadtreeMesh":
+        """
+        Unrefined mesh of ``base = (n_sigma, n_mu)`` root cells.
+        """
+        n_sigma, n_mu = base
+        i, j = np.meshgrid(np.arange(n_sigma), np.arange(n_mu), indexing="ij")
+        return cls(
+            tuple(map(float, mu_range)),
+            tuple(map(float, sigma_range)),
+            (int(n_sigma), int(n_mu)),
+            np.zeros(i.size, np.int64),
+            i.ravel(),
+            j.ravel(),
+        )
+
+    @classmethod
+    def adapt(
+        cls,
+        mu_range,
+        sigma_range,
+        *,
+        base=(4, 4),
+        max_level: int = MAX_LEVEL,
+        fisher_size: float | None = None,
+        source: Callable | None = None,
+        source_tol: float = 0.05,
+        metric: Callable = gaussian_metric,
+    ) -> "QuadtreeMesh":
+        """
+        Build a mesh refined on metric scale and/or source variation.
+
+        Parameters
+        ----------
+        mu_range, sigma_range : tuple of float
+            Domain box.
+        base : tuple of int, optional
+            Root cells ``(n_sigma, n_mu)``.
+        max_level : int, optional
+            Maximum refinement depth.
+        fisher_size : float, optional
+            Split cells whose Fisher size exceeds this value.
+        source : callable, optional
+            ``source(mu, sigma)``; split cells where the variation of the
+            source between the centre and the corners exceeds
+            ``source_tol · max |A|``.
+        source_tol : float, optional
+            Relative source-variation threshold.
+        metric : callable, optional
+            ``metric(mu, sigma)`` returning G, shape ``(..., 2, 2)``.
+
+        Returns
+        -------
+        QuadtreeMesh
+        """
+        mesh = cls.uniform(mu_range, sigma_range, base)
+        for _ in range(max_level):
+            marks = np.zeros(mesh.size, dtype=bool)
+            mu, sigma = mesh.centers()
+            h_mu, h_sigma = mesh.h_mu, mesh.h_sigma
+            if fisher_size is not None:
+                G = metric(mu, sigma)
+                size = np.sqrt(G[:, 0, 0] * h_mu**2 + G[:, 1, 1] * h_sigma**2)
+                marks |= size > fisher_size
+            if source is not None:
+                center = source(mu, sigma)
+                corners = np.stack(
+                    [
+                        source(mu + a * h_mu / 2, sigma + b * h_sigma / 2)
+                        for a in (-1, 1)
+                        for b in (-1, 1)
+                    ]
+                )
+                variation = np.max(np.abs(corners - center), axis=0)
+                scale = max(np.max(np.abs(center)), np.max(np.abs(corners)))
+                marks |= variation > source_tol * scale
+            marks &= mesh.level < max_level
+            if not marks.any():
+                break
+            mesh = mesh.refine(marks)
+        return mesh
+
+    def refine(self, marks) -> "QuadtreeMesh":
+        """
+        Split the marked leaves into four children and rebalance.
+        """
+        return self._split(np.asarray(marks, dtype=bool)).balance()
+
+    def _split(self, marks: np.ndarray) -> "QuadtreeMesh":
+        level, i, j = self.level, self.i, self.j
+        keep = ~marks
+        children = [
+            (level[marks] + 1, 2 * i[marks] + a, 2 * j[marks] + b)
+            for a in (0, 1)
+            for b in (0, 1)
+        ]
+        return QuadtreeMesh(
+            self.mu_range,
+            self.sigma_range,
+            self.base,
+            np.concatenate([level[keep]] + [c[0] for c in children]),
+            np.concatenate([i[keep]] + [c[1] for c in children]),
+            np.concatenate([j[keep]] + [c[2] for c in children]),
+        )
+
+    def balance(self) -> "QuadtreeMesh":
+        """
+        Enforce 2:1 balance across faces by splitting coarse leaves.
+        """
+        mesh = self
+        while True:
+            marks = np.zeros(mesh.size, dtype=bool)
+            for axis, sign in _DIRECTIONS:
+                ni, nj = mesh._shifted(axis, sign)
+                for k in range(2, int(mesh.level.max(initial=0)) + 1):
+                    deep = mesh.level >= k
+                    found = mesh.find(
+                        mesh.level[deep] - k, ni[deep] >> k, nj[deep] >> k
+                    )
+                    marks[found[found >= 0]] = True
+            if not marks.any():
+                return mesh
+            mesh = mesh._split(marks)
+
+    # -----------------------------------------------------------------
+    # Geometry
+    # -----------------------------------------------------------------
+    @property
+    def shape(self) -> tuple[int]:
+        """
+        Array shape of fields on the mesh: ``(n_leaves,)``.
+        """
+        return (self.level.size,)
+
+    @property
+    def size(self) -> int:
+        return self.level.size
+
+    @property
+    def max_level(self) -> int:
+        return int(self.level.max(initial=0))
+
+    @cached_property
+    def h_mu(self) -> np.ndarray:
+        """
+        Leaf widths along μ.
+        """
+        root = (self.mu_range[1] - self.mu_range[0]) / self.base[1]
+        return root / 2.0**self.level
+
+    @cached_property
+    def h_sigma(self) -> np.ndarray:
+        """
+        Leaf heights along σ.
+        """
+        root = (self.sigma_range[1] - self.sigma_range[0]) / self.base[0]
+        return root / 2.0**self.level
+
+    def centers(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Leaf centres ``(mu, sigma)``, each of shape ``(n_leaves,)``.
+        """
+        mu = self.mu_range[0] + (self.j + 0.5) * self.h_mu
+        sigma = self.sigma_range[0] + (self.i + 0.5) * self.h_sigma
+        return mu, sigma
+
+    def mesh(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Alias of :meth:`centers` (sampling points of fields and sources).
+        """
+        return self.centers()
+
+    @cached_property
+    def key(self) -> str:
+        """
+        Stable content hash identifying the mesh (for on-disk caches).
+        """
+        h = hashlib.sha256()
+        h.update(np.asarray(self.mu_range + self.sigma_range, "<f8").tobytes())
+        h.update(np.asarray(self.base, "<i8").tobytes())
+        h.update(self._keys.astype("<i8").tobytes())
+        return h.hexdigest()[:16]
+
+    # -----------------------------------------------------------------
+    # Topology
+    # -----------------------------------------------------------------
+    def find(self, level, i, j) -> np.ndarray:
+        """
+        Leaf indices of cells ``(level, i, j)``, or −1 where not a leaf.
+        """
+        keys = _encode(level, i, j)
+        pos = np.searchsorted(self._keys, keys)
+        pos = np.minimum(pos, self._keys.size - 1)
+        return np.where(self._keys[pos] == keys, pos, -1)
+
+    def _extent(self, axis: int) -> np.ndarray:
+        """
+        Number of cells along ``axis`` at each leaf's level.
+        """
+        return self.base[1 - axis] << self.level
+
+    def _shifted(self, axis: int, sign: int) -> tuple[np.ndarray, np.ndarray]:
+        if axis == 0:
+            return self.i, self.j + sign
+        return self.i + sign, self.j
+
+    @cached_property
+    def faces(self) -> dict[str, np.ndarray]:
+        """
+        Interior and boundary faces.
+
+        Returns
+        -------
+        dict
+            ``"cells"``: (F, 2) adjacent leaves; ``"axis"``: normal axis
+            (0 = μ, 1 = σ); ``"length"``, ``"distance"``: face length and
+            centre distance; ``"midpoint"``: (F, 2) face midpoints;
+            ``"boundary_cells"``, ``"boundary_axis"``, ``"boundary_sign"``,
+            ``"boundary_length"``, ``"boundary_distance"``,
+            ``"boundary_midpoint"`` likewise for boundary faces.
+        """
+        mu, sigma = self.centers()
+        h = (self.h_mu, self.h_sigma)
+        idx = np.arange(self.size)
+        cells, axes, lengths, distances, midpoints = [], [], [], [], []
+        b_cells, b_axes, b_signs, b_lengths, b_distances, b_midpoints = [], [], [], [], [], []
+
+        for axis, sign in _DIRECTIONS:
+            ni, nj = self._shifted(axis, sign)
+            n = nj if axis == 0 else ni
+            inside = (n >= 0) & (n < self._extent(axis))
+            tangential = h[1 - axis]
+            half = 0.5 * h[axis]
+            mid = np.stack([mu, sigma], axis=1)
+            mid[:, axis] += sign * half
+
+            # Boundary faces.
+            out = ~inside
+            b_cells.append(idx[out])
+            b_axes.append(np.full(out.sum(), axis))
+            b_signs.append(np.full(out.sum(), sign))
+            b_lengths.append(tangential[out])
+            b_distances.append(half[out])
+            b_midpoints.append(mid[out])
+
+            # Same-level neighbours, recorded once (positive directions).
+            same = np.where(inside, self.find(self.level, ni, nj), -1)
+            if sign > 0:
+                hit = same >= 0
+                cells.append(np.stack([idx[hit], same[hit]], axis=1))
+                axes.append(np.full(hit.sum(), axis))
+                lengths.append(tangential[hit])
+                distances.append(h[axis][hit])
+                midpoints.append(mid[hit])
+
+            # Coarser neighbours, recorded from the fine side.
+            probe = inside & (same < 0) & (self.level > 0)
+            coarse = np.full(self.size, -1)
+            coarse[probe] = self.find(self.level[probe] - 1, ni[probe] >> 1, nj[probe] >> 1)
+            hit = coarse >= 0
+            cells.append(np.stack([idx[hit], coarse[hit]], axis=1))
+            axes.append(np.full(hit.sum(), axis))
+            lengths.append(tangential[hit])
+            distances.append(1.5 * h[axis][hit])
+            midpoints.append(mid[hit])
+
+        return {
+            "cells": np.concatenate(cells),
+            "axis": np.concatenate(axes),
+            "length": np.concatenate(lengths),
+            "distance": np.concatenate(distances),
+            "midpoint": np.concatenate(midpoints),
+            "boundary_cells": np.concatenate(b_cells),
+            "boundary_axis": np.concatenate(b_axes),
+            "boundary_sign": np.concatenate(b_signs),
+            "boundary_length": np.concatenate(b_lengths),
+            "boundary_distance": np.concatenate(b_distances),
+            "boundary_midpoint": np.concatenate(b_midpoints),
+        }
+
+    # -----------------------------------------------------------------
+    # Resampling
+    # -----------------------------------------------------------------
+    @cached_property
+    def _lookup(self) -> np.ndarray:
+        """
+        Leaf index of every cell at the finest level.
+        """
+        top = self.max_level
+        table = np.full((self.base[0] << top, self.base[1] << top), -1, dtype=np.int64)
+        for level in range(top + 1):
+            on = np.flatnonzero(self.level == level)
+            if on.size == 0:
+                continue
+            coarse = np.full((self.base[0] << level, self.base[1] << level), -1, dtype=np.int64)
+            coarse[self.i[on], self.j[on]] = on
+            scale = 1 << (top - level)
+            fine = coarse.repeat(scale, axis=0).repeat(scale, axis=1)
+            np.copyto(table, fine, where=fine >= 0)
+        return table
+
+    def locate(self, mu, sigma) -> np.ndarray:
+        """
+        Leaf containing each point (points are clamped to the box).
+        """
+        table = self._lookup
+        s = (np.asarray(mu, float) - self.mu_range[0]) / (
+            self.mu_range[1] - self.mu_range[0]
+        )
+        t = (np.asarray(sigma, float) - self.sigma_range[0]) / (
+            self.sigma_range[1] - self.sigma_range[0]
+        )
+        col = np.clip((s * table.shape[1]).astype(np.int64), 0, table.shape[1] - 1)
+        row = np.clip((t * table.shape[0]).astype(np.int64), 0, table.shape[0] - 1)
+        return table[row, col]
+
+    def gradients(self, values, *, bc: str = "dirichlet") -> np.ndarray:
+        """
+        Least-squares cell gradients of a leaf field, shape ``(n_leaves, 2)``.
+
+        Face neighbours enter with their centre offsets; with Dirichlet
+        conditions boundary faces contribute the value 0 at the face.
+        """
+        values = np.asarray(values, dtype=float)
+        faces = self.faces
+        mu, sigma = self.centers()
+        x = np.stack([mu, sigma], axis=1)
+
+        a, b = faces["cells"].T
+        d = x[b] - x[a]
+        dv = values[b] - values[a]
+        normal = np.zeros((self.size, 2, 2))
+        rhs = np.zeros((self.size, 2))
+        outer = d[:, :, None] * d[:, None, :]
+        np.add.at(normal, a, outer)
+        np.add.at(normal, b, outer)
+        np.add.at(rhs, a, d * dv[:, None])
+        np.add.at(rhs, b, d * dv[:, None])
+
+        if bc == "dirichlet":
+            c = faces["boundary_cells"]
+            db = faces["boundary_midpoint"] - x[c]
+            np.add.at(normal, c, db[:, :, None] * db[:, None, :])
+            np.add.at(rhs, c, db * (-values[c])[:, None])
+
+        # Regularize cells whose stencil is degenerate along an axis.
+        normal += 1e-12 * np.eye(2) * np.trace(normal, axis1=1, axis2=2)[:, None, None]
+        return np.linalg.solve(normal, rhs[:, :, None])[:, :, 0]
+
+    def resample(self, values, mu, sigma, *, bc: str = "dirichlet") -> np.ndarray:
+        """
+        Piecewise-linear reconstruction of a leaf field at arbitrary points.
+
+        Parameters
+        ----------
+        values : array_like
+            Field over the leaves.
+        mu, sigma : array_like
+            Query coordinates (broadcast against each other).
+        bc : {"dirichlet", "neumann"}, optional
+            Boundary condition used for the gradient reconstruction.
+
+        Returns
+        -------
+        numpy.ndarray
+            Values with the broadcast shape of ``mu`` and ``sigma``.
+        """
+        mu, sigma = np.broadcast_arrays(np.asarray(mu, float), np.asarray(sigma, float))
+        leaf = self.locate(mu, sigma)
+        grad = self.gradients(values, bc=bc)
+        cmu, csigma = self.centers()
+        values = np.asarray(values, dtype=float)
+        return (
+            values[leaf]
+            + grad[leaf, 0] * (mu - cmu[leaf])
+            + grad[leaf, 1] * (sigma - csigma[leaf])
+        )
+
+    def to_grid(self, values, grid: Grid, *, bc: str = "dirichlet") -> np.ndarray:
+        """
+        Resample a leaf field onto a uniform :class:`Grid` (for plotting).
+        """
+        MU, SIGMA = grid.mesh()
+        return self.resample(values, MU, SIGMA, bc=bc)
+
+
+# ---------------------------------------------------------------------
+# Operator
+# ---------------------------------------------------------------------
+class QuadtreeLaplaceBeltrami:
+    """
+    Finite-volume Laplace–Beltrami operator on a quadtree mesh.
+
+    Parameters
+    ----------
+    mesh : QuadtreeMesh
+        Adaptive mesh (exposed as ``grid`` for solver compatibility).
+    bc : {"dirichlet", "neumann"}, optional
+        Boundary condition.
+    precision : str or PrecisionPolicy, optional
+        Precision policy; coefficients are kept in ``storage`` dtype.
+    volume : callable, optional
+        ``volume(mu, sigma)`` returning √det G.
+    inverse_metric : callable, optional
+        ``inverse_metric(mu, sigma)`` returning G^{ij}; off-diagonal terms
+        must vanish.
+    """
+
+    def __init__(
+        self,
+        mesh: QuadtreeMesh,
+        *,
+        bc: str = "dirichlet",
+        precision: str | PrecisionPolicy = "double",
+        volume: Callable = gaussian_volume,
+        inverse_metric: Callable = gaussian_inverse_metric,
+    ):
+        if bc not in BOUNDARY_CONDITIONS:
+            raise ValueError(
+                f"Unknown boundary condition '{bc}'. "
+                f"Supported: {list(BOUNDARY_CONDITIONS)}"
+            )
+        self.grid = mesh
+        self.mesh = mesh
+        self.bc = bc
+        self.policy = get_policy(precision)
+
+        faces = mesh.faces
+
+        def flux_coefficient(midpoint, axis):
+            G_inv = inverse_metric(midpoint[:, 0], midpoint[:, 1])
+            if np.any(G_inv[..., 0, 1] != 0.0):
+                raise ValueError("Only diagonal metrics are supported")
+            return (
+                volume(midpoint[:, 0], midpoint[:, 1])
+                * G_inv[np.arange(axis.size), axis, axis]
+            )
+
+        face = (
+            flux_coefficient(faces["midpoint"], faces["axis"])
+            * faces["length"]
+            / faces["distance"]
+        )
+        boundary = (
+            flux_coefficient(faces["boundary_midpoint"], faces["boundary_axis"])
+            * faces["boundary_length"]
+            / faces["boundary_distance"]
+        )
+        if bc == "neumann":
+            boundary = np.zeros_like(boundary)
+
+        a, b = faces["cells"].T
+        diag = np.zeros(mesh.size)
+        np.add.at(diag, a, face)
+        np.add.at(diag, b, face)
+        np.add.at(diag, faces["boundary_cells"], boundary)
+
+        mu, sigma = mesh.centers()
+        exact = (face, boundary, volume(mu, sigma) * mesh.h_mu * mesh.h_sigma, diag)
+        self._coefficients = {
+            self.policy.storage: tuple(self.policy.store(c) for c in exact)
+        }
+        if self.policy.refine:
+            acc = self.policy.accumulate
+            self._coefficients[acc] = tuple(np.asarray(c, dtype=acc) for c in exact)
+        self.mass = self._coefficients[self.policy.storage][2]
+        self._matrices = {}
+
+    def coefficients(self, dtype=None) -> tuple[np.ndarray, ...]:
+        """
+        Return ``(face, boundary, mass, diagonal)`` best suited to a dtype.
+
+        ``face`` and ``boundary`` hold the interior and boundary flux
+        coefficients; the last two entries match
+        :meth:`LaplaceBeltrami.coefficients`.
+        """
+        dtype = self.policy.storage if dtype is None else np.dtype(dtype)
+        return self._coefficients.get(dtype, self._coefficients[self.policy.storage])
+
+    def diagonal(self) -> np.ndarray:
+        """
+        Diagonal of K, shape ``(n_leaves,)``.
+        """
+        return self.coefficients()[3]
+
+    def matrix(self, dtype=None) -> sp.csr_matrix:
+        """
+        Assemble K as a sparse CSR matrix (cached per dtype).
+        """
+        dtype = self.policy.storage if dtype is None else np.dtype(dtype)
+        if dtype not in self._matrices:
+            face, _, _, diag = self.coefficients(dtype)
+            a, b = self.mesh.faces["cells"].T
+            idx = np.arange(self.mesh.size)
+            rows = np.concatenate([a, b, idx])
+            cols = np.concatenate([b, a, idx])
+            vals = np.concatenate([-face, -face, diag]).astype(dtype)
+            K = sp.coo_matrix((vals, (rows, cols)), shape=(self.mesh.size,) * 2)
+            self._matrices[dtype] = K.tocsr()
+        return self._matrices[dtype]
+
+    def mass_matrix(self, dtype=None) -> sp.dia_matrix:
+        """
+        Diagonal Fisher-volume mass matrix M as a sparse matrix.
+        """
+        dtype = self.policy.storage if dtype is None else np.dtype(dtype)
+        return sp.diags(np.asarray(self.coefficients(dtype)[2], dtype=dtype))
+
+    def stiffness(self, phi, dtype=None, *, out=None, work=None) -> np.ndarray:
+        """
+        Apply the stiffness matrix: K φ (``work`` is accepted for
+        interface compatibility and unused).
+        """
+        dtype = self.policy.compute if dtype is None else np.dtype(dtype)
+        phi = np.asarray(phi, dtype=dtype).reshape(self.mesh.shape)
+        result = self.matrix(dtype) @ phi
+        if out is None:
+            return result
+        out[...] = result
+        return out
+
+    def __call__(self, phi) -> np.ndarray:
+        """
+        Apply the Laplace–Beltrami operator: Δ_G φ = −M⁻¹ K φ.
+        """
+        return -self.stiffness(phi) / self.mass
@@ -0,0 +1,243 @@
+"""
+Lightweight solver telemetry.
+
+Field solvers report what they did — iterations, residual histories,
+operator applications, factorization cost and zero-mode compatibility
+residuals — to the :class:`Telemetry` session active in the current
+context:
+
+    with Telemetry() as telemetry:
+        phi = solve_field(A, operator, method="cg")
+    telemetry.write_json(path)
+
+Without an active session, :func:`start` returns ``None`` and solvers skip
+all bookkeeping, so instrumentation costs one context-variable lookup
+per solve. With a session, per-iteration cost is one list append of a
+residual norm the solver already computed. Final residuals are taken
+from those histories; solves that compute none (direct factorizations)
+spend an extra operator application on one only when the session asks
+for it with ``Telemetry(residuals=True)``.
+
+Reports use the same JSON layout as the build state written by
+:mod:`src.build` (sorted keys, two-space indentation).
+"""
+
+from __future__ import annotations
+
+import json
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+
+# ---------------------------------------------------------------------
+# Records
+# ---------------------------------------------------------------------
+@dataclass
+class SolveRecord:
+    """
+    Telemetry of a single solve.
+
+    Attributes
+    ----------
+    solver : str
+        Solver family (e.g. ``"field"``, ``"spectral"``, ``"action"``).
+    method : str
+        Method within the family (e.g. ``"direct"``, ``"cg"``).
+    shape : tuple of int
+        Grid shape.
+    parameters : dict
+        Solver settings (screening mass, boundary condition, precision, ...).
+    iterations : int
+        Iterations of the (inner) iterative method.
+    residuals : list of float
+        Relative residual norm after each iteration.
+    refinements : list of float
+        Relative float64 residual after each iterative-refinement sweep.
+    operator_applications : int
+        Matrix-free operator (or objective) evaluations.
+    factorization_time : float
+        Seconds spent factorizing in this solve (``0`` when reused).
+    factorization_bytes : int
+        Memory held by the factorization or basis.
+    solve_time : float
+        Wall time of the solve in seconds.
+    compatibility_residual : float or None
+        Fisher-volume mean removed from the source (singular problems).
+    converged : bool or None
+        Convergence status reported by the solver.
+    extra : dict
+        Solver-specific diagnostics (e.g. truncation-error bounds).
+    """
+
+    solver: str
+    method: str
+    shape: tuple[int, ...]
+    parameters: dict[str, Any] = field(default_factory=dict)
+    iterations: int = 0
+    residuals: list[float] = field(default_factory=list)
+    refinements: list[float] = field(default_factory=list)
+    operator_applications: int = 0
+    factorization_time: float = 0.0
+    factorization_bytes: int = 0
+    solve_time: float = 0.0
+    compatibility_residual: float | None = None
+    converged: bool | None = None
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    def residual(self, norm: float) -> None:
+        """
+        Append one iteration's relative residual.
+        """
+        self.iterations += 1
+        self.residuals.append(float(norm))
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["shape"] = list(self.shape)
+        return data
+
+
+Callback = Callable[[SolveRecord, str], None]
+"""
+Telemetry callback ``callback(record, event)`` with ``event`` one of
+``"start"`` or ``"finish"``.
+"""
+
+
+# ---------------------------------------------------------------------
+# Session
+# ---------------------------------------------------------------------
+_ACTIVE: ContextVar["Telemetry | None"] = ContextVar("telemetry", default=None)
+
+
+class Telemetry:
+    """
+    Collector of :class:`SolveRecord` entries for a context.
+
+    Parameters
+    ----------
+    callbacks : iterable of callable, optional
+        Functions called as ``callback(record, event)`` when a solve
+        starts and finishes (e.g. for live logging).
+    residuals : bool, optional
+        Also record final residuals of solves that do not compute one as
+        a by-product, at the cost of an extra operator application.
+    """
+
+    def __init__(self, callbacks=(), *, residuals: bool = False):
+        self.records: list[SolveRecord] = []
+        self.callbacks: list[Callback] = list(callbacks)
+        self.residuals = residuals
+        self._tokens = []
+
+    def __enter__(self) -> "Telemetry":
+        self._tokens.append(_ACTIVE.set(self))
+        return self
+
+    def __exit__(self, *exc) -> None:
+        _ACTIVE.reset(self._tokens.pop())
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def notify(self, record: SolveRecord, event: str) -> None:
+        for callback in self.callbacks:
+            callback(record, event)
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """
+        Aggregate counters per ``solver/method``.
+        """
+        out: dict[str, dict[str, Any]] = {}
+        for record in self.records:
+            entry = out.setdefault(
+                f"{record.solver}/{record.method}",
+                {
+                    "solves": 0,
+                    "iterations": 0,
+                    "max_iterations": 0,
+                    "operator_applications": 0,
+                    "factorization_time": 0.0,
+                    "solve_time": 0.0,
+                    "unconverged": 0,
+                },
+            )
+            entry["solves"] += 1
+            entry["iterations"] += record.iterations
+            entry["max_iterations"] = max(entry["max_iterations"], record.iterations)
+            entry["operator_applications"] += record.operator_applications
+            entry["factorization_time"] += record.factorization_time
+            entry["solve_time"] += record.solve_time
+            entry["unconverged"] += record.converged is False
+        return out
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        JSON-serializable report: per-solve records and a summary.
+        """
+        return {
+            "records": [record.to_dict() for record in self.records],
+            "summary": self.summary(),
+        }
+
+    def write_json(self, path: Path) -> Path:
+        """
+        Write :meth:`to_dict` as JSON.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps(self.to_dict(), indent=2, sort_keys=True) + "\n",
+            encoding="utf-8",
+        )
+        return path
+
+
+def active() -> Telemetry | None:
+    """
+    Return the session active in the current context, if any.
+    """
+    return _ACTIVE.get()
+
+
+def residuals_requested() -> bool:
+    """
+    Whether the active session asks for explicitly computed residuals.
+    """
+    session = _ACTIVE.get()
+    return session is not None and session.residuals
+
+
+def start(solver: str, method: str, shape, **parameters) -> SolveRecord | None:
+    """
+    Open a record in the active session (``None`` when telemetry is off).
+    """
+    session = _ACTIVE.get()
+    if session is None:
+        return None
+    record = SolveRecord(solver, method, tuple(shape), parameters)
+    session.records.append(record)
+    session.notify(record, "start")
+    return record
+
+
+def finish(record: SolveRecord | None, **fields) -> None:
+    """
+    Close a record: set its final fields and notify callbacks.
+
+    Parameters
+    ----------
+    record : SolveRecord or None
+        Record from :func:`start` (no-op if ``None``).
+    **fields
+        Record attributes to set (e.g. ``solve_time=…``, ``converged=True``).
+    """
+    if record is None:
+        return
+    for name, value in fields.items():
+        setattr(record, name, value)
+    session = _ACTIVE.get()
+    if session is not None:
+        session.notify(record, "finish")
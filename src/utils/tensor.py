@@ -0,0 +1,319 @@
+"""
+Packed symmetric tensor fields and anisotropic alignment diagnostics.
+
+The isotropic diagnostic A = Tr(G⁻¹ C) − D keeps only the trace of the
+alignment operator. Its traceless part carries the shear-like
+information of Section 3: in which directions the data over- or
+under-disperse the model scores. In an orthonormal frame of G
+(G = L Lᵀ), the alignment operator is represented by the symmetric
+tensor
+
+    S = L⁻¹ C L⁻ᵀ − I,   Tr S = A,
+
+with the same eigenvalues as G⁻¹ C − I.
+
+:class:`SymmetricTensorField` stores symmetric D×D fields over arbitrary
+grids in packed upper-triangular form, ``grid_shape + (D(D+1)/2,)``,
+so memory grows as D(D+1)/2 per point rather than D². All operations
+are batched over the grid; eigen-decompositions run in blocks of
+:data:`CHUNK_SIZE` points (closed form for D = 2).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+
+CHUNK_SIZE = 65536
+"""
+Grid points per block in :meth:`SymmetricTensorField.eigh`, bounding the
+dense ``(block, D, D)`` temporaries.
+"""
+
+
+# ---------------------------------------------------------------------
+# Packed layout
+# ---------------------------------------------------------------------
+def packed_size(dim: int) -> int:
+    """
+    Number of stored components D(D+1)/2 of a symmetric D×D tensor.
+    """
+    return dim * (dim + 1) // 2
+
+
+def packed_dim(size: int) -> int:
+    """
+    Dimension D of a packed symmetric tensor with ``size`` components.
+    """
+    dim = int(round((np.sqrt(8 * size + 1) - 1) / 2))
+    if packed_size(dim) != size:
+        raise ValueError(f"{size} is not a packed symmetric tensor size")
+    return dim
+
+
+@lru_cache(maxsize=None)
+def packed_indices(dim: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Row and column of each packed component (row-major upper triangle).
+    """
+    rows, cols = np.triu_indices(dim)
+    rows.setflags(write=False)
+    cols.setflags(write=False)
+    return rows, cols
+
+
+@lru_cache(maxsize=None)
+def _diagonal_slots(dim: int) -> np.ndarray:
+    rows, cols = packed_indices(dim)
+    slots = np.flatnonzero(rows == cols)
+    slots.setflags(write=False)
+    return slots
+
+
+@lru_cache(maxsize=None)
+def _frobenius_weights(dim: int) -> np.ndarray:
+    rows, cols = packed_indices(dim)
+    weights = np.where(rows == cols, 1.0, 2.0)
+    weights.setflags(write=False)
+    return weights
+
+
+# ---------------------------------------------------------------------
+# Field container
+# ---------------------------------------------------------------------
+@dataclass(frozen=True)
+class SymmetricTensorField:
+    """
+    Symmetric D×D tensor field over a grid, stored packed.
+
+    Attributes
+    ----------
+    data : numpy.ndarray
+        Packed components, shape ``grid_shape + (D(D+1)/2,)``, ordered as
+        ``packed_indices(D)`` (row-major upper triangle).
+    """
+
+    data: np.ndarray
+
+    def __post_init__(self):
+        data = np.asarray(self.data)
+        if data.ndim == 0:
+            raise ValueError("Packed data needs a component axis")
+        packed_dim(data.shape[-1])
+        object.__setattr__(self, "data", data)
+
+    # -----------------------------------------------------------------
+    # Construction
+    # -----------------------------------------------------------------
+    @classmethod
+    def from_dense(cls, T, *, dtype=None) -> "SymmetricTensorField":
+        """
+        Pack dense tensors of shape ``(..., D, D)``, symmetrizing them.
+        """
+        T = np.asarray(T)
+        if T.ndim < 2 or T.shape[-1] != T.shape[-2]:
+            raise ValueError(f"Expected square tensors, got shape {T.shape}")
+        rows, cols = packed_indices(T.shape[-1])
+        data = 0.5 * (T[..., rows, cols] + T[..., cols, rows])
+        return cls(data.astype(dtype or data.dtype, copy=False))
+
+    @classmethod
+    def isotropic(cls, scalar, dim: int) -> "SymmetricTensorField":
+        """
+        Field ``scalar · I`` of dimension ``dim``.
+        """
+        scalar = np.asarray(scalar)
+        data = np.zeros(scalar.shape + (packed_size(dim),), dtype=np.result_type(scalar, float))
+        data[..., _diagonal_slots(dim)] = scalar[..., None]
+        return cls(data)
+
+    @classmethod
+    def alignment(cls, G, C, *, dtype=None) -> "SymmetricTensorField":
+        """
+        Alignment tensor S = L⁻¹ C L⁻ᵀ − I in an orthonormal frame of G.
+
+        Parameters
+        ----------
+        G : array_like
+            Fisher–Rao metric, shape ``(..., D, D)``.
+        C : array_like
+            Score covariance, shape ``(..., D, D)``.
+        dtype : numpy dtype, optional
+            Storage dtype of the packed result.
+
+        Returns
+        -------
+        SymmetricTensorField
+            Field whose trace is the isotropic diagnostic A.
+        """
+        G = np.asarray(G, dtype=float)
+        C = np.asarray(C, dtype=float)
+        L = np.linalg.cholesky(G)
+        X = np.linalg.solve(L, C)
+        S = np.linalg.solve(L, np.swapaxes(X, -1, -2))
+        S -= np.eye(G.shape[-1])
+        return cls.from_dense(S, dtype=dtype)
+
+    # -----------------------------------------------------------------
+    # Layout
+    # -----------------------------------------------------------------
+    @property
+    def dim(self) -> int:
+        """
+        Tensor dimension D.
+        """
+        return packed_dim(self.data.shape[-1])
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """
+        Grid shape.
+        """
+        return self.data.shape[:-1]
+
+    @property
+    def nbytes(self) -> int:
+        return self.data.nbytes
+
+    def component(self, i: int, j: int) -> np.ndarray:
+        """
+        Component T_ij over the grid (a view).
+        """
+        i, j = min(i, j), max(i, j)
+        dim = self.dim
+        slot = i * dim - i * (i - 1) // 2 + (j - i)
+        return self.data[..., slot]
+
+    def to_dense(self) -> np.ndarray:
+        """
+        Unpack to dense tensors of shape ``grid_shape + (D, D)``.
+        """
+        dim = self.dim
+        rows, cols = packed_indices(dim)
+        T = np.empty(self.shape + (dim, dim), dtype=self.data.dtype)
+        T[..., rows, cols] = self.data
+        T[..., cols, rows] = self.data
+        return T
+
+    def __getitem__(self, index) -> "SymmetricTensorField":
+        """
+        Restrict the field to part of the grid (component axis kept).
+        """
+        if not isinstance(index, tuple):
+            index = (index,)
+        return SymmetricTensorField(self.data[index + (Ellipsis, slice(None))])
+
+    # -----------------------------------------------------------------
+    # Arithmetic
+    # -----------------------------------------------------------------
+    def __add__(self, other: "SymmetricTensorField") -> "SymmetricTensorField":
+        return SymmetricTensorField(self.data + other.data)
+
+    def __sub__(self, other: "SymmetricTensorField") -> "SymmetricTensorField":
+        return SymmetricTensorField(self.data - other.data)
+
+    def __mul__(self, scalar) -> "SymmetricTensorField":
+        """
+        Multiply by a scalar or a scalar field of shape ``grid_shape``.
+        """
+        return SymmetricTensorField(self.data * np.asarray(scalar)[..., None])
+
+    __rmul__ = __mul__
+
+    # -----------------------------------------------------------------
+    # Diagnostics
+    # -----------------------------------------------------------------
+    def trace(self) -> np.ndarray:
+        """
+        Tr T over the grid.
+        """
+        return self.data[..., _diagonal_slots(self.dim)].sum(axis=-1)
+
+    def traceless(self) -> "SymmetricTensorField":
+        """
+        Deviatoric part T − (Tr T / D) I.
+        """
+        dim = self.dim
+        data = self.data.copy()
+        data[..., _diagonal_slots(dim)] -= (self.trace() / dim)[..., None]
+        return SymmetricTensorField(data)
+
+    def split(self) -> tuple[np.ndarray, "SymmetricTensorField"]:
+        """
+        Return ``(Tr T, T − (Tr T / D) I)``.
+        """
+        return self.trace(), self.traceless()
+
+    def frobenius(self) -> np.ndarray:
+        """
+        Frobenius norm ‖T‖_F over the grid.
+        """
+        weights = _frobenius_weights(self.dim).astype(self.data.dtype)
+        return np.sqrt(np.einsum("...k,k,...k->...", self.data, weights, self.data))
+
+    def shear(self) -> np.ndarray:
+        """
+        Shear magnitude: Frobenius norm of the traceless part.
+        """
+        return self.traceless().frobenius()
+
+    def eigh(self, *, chunk_size: int = CHUNK_SIZE) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Principal values and directions.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            Eigenvalues in ascending order, shape ``grid_shape + (D,)``,
+            and unit eigenvectors as columns, shape
+            ``grid_shape + (D, D)``.
+        """
+        dim = self.dim
+        if dim == 2:
+            return self._eigh_2d()
+        flat = self.data.reshape(-1, self.data.shape[-1])
+        values = np.empty((flat.shape[0], dim), dtype=self.data.dtype)
+        vectors = np.empty((flat.shape[0], dim, dim), dtype=self.data.dtype)
+        for start in range(0, flat.shape[0], chunk_size):
+            block = slice(start, start + chunk_size)
+            values[block], vectors[block] = np.linalg.eigh(
+                SymmetricTensorField(flat[block]).to_dense()
+            )
+        return values.reshape(self.shape + (dim,)), vectors.reshape(self.shape + (dim, dim))
+
+    def _eigh_2d(self) -> tuple[np.ndarray, np.ndarray]:
+        a, b, c = np.moveaxis(self.data, -1, 0)
+        mean = 0.5 * (a + c)
+        radius = np.hypot(0.5 * (a - c), b)
+        angle = 0.5 * np.arctan2(2.0 * b, a - c)
+        values = np.stack([mean - radius, mean + radius], axis=-1)
+        cos, sin = np.cos(angle), np.sin(angle)
+        # Columns: minor direction, then major direction.
+        vectors = np.stack(
+            [np.stack([-sin, cos], axis=-1), np.stack([cos, sin], axis=-1)], axis=-1
+        )
+        return values, vectors
+
+    def principal_angle(self) -> np.ndarray:
+        """
+        Angle of the major principal direction to the first axis (D = 2).
+
+        Returns
+        -------
+        numpy.ndarray
+            Angles in (−π/2, π/2], shape ``grid_shape``.
+        """
+        if self.dim != 2:
+            raise ValueError("Principal angles are defined for D = 2 only")
+        a, b, c = np.moveaxis(self.data, -1, 0)
+        return 0.5 * np.arctan2(2.0 * b, a - c)
+
+    def anisotropy(self) -> np.ndarray:
+        """
+        Eigenvalue spread λ_max − λ_min over the grid.
+        """
+        values, _ = self.eigh()
+        return values[..., -1] - values[..., 0]
@@ -0,0 +1,321 @@
+"""
+Tiled, multi-threaded evaluation of grid kernels.
+
+Expressions such as ``np.exp(-MU**2) * np.exp(-(SIGMA - 1.0) ** 2)``
+create several full-size temporaries and run on one core. A
+:class:`TiledExecutor` instead splits the output into cache-sized tiles
+and evaluates a kernel on each tile from a thread pool:
+
+    def kernel(mu, sigma, out):
+        np.multiply(mu, mu, out=out)
+        out += (sigma - 1.0) ** 2
+        np.negative(out, out=out)
+        np.exp(out, out=out)
+
+    A = evaluate_grid(kernel, grid)
+
+Kernels receive read-only coordinate views of the tile (broadcast from
+the 1D axes, so no meshgrid is materialized) and the tile of the
+preallocated output. They either write into ``out`` in place or return
+an array that is copied into it. Peak memory is one output array plus
+a few tile-sized temporaries per worker. NumPy ufuncs release the GIL on
+large tiles, so the tiles run in parallel.
+
+Callers that already run on a thread pool (e.g. the parallel figure
+build) bound the threads of every executor they create with
+:func:`limit_workers`; tile kernels themselves run under a limit of one,
+so nested evaluations never oversubscribe the cores.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Iterator
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from src.utils.laplacian import Grid
+
+
+TILE_SIZE = 32768
+"""
+Target number of output points per tile (256 KiB of float64).
+"""
+
+Kernel = Callable[..., "np.ndarray | None"]
+"""
+Tile kernel ``kernel(*coords, out)``; writes into ``out`` or returns the tile.
+"""
+
+
+_limits = threading.local()
+
+
+def default_workers() -> int:
+    """
+    Number of worker threads used when none is requested.
+
+    All cores, unless the calling thread runs under :func:`limit_workers`.
+    """
+    limit = getattr(_limits, "workers", None)
+    return limit if limit is not None else os.cpu_count() or 1
+
+
+@contextmanager
+def limit_workers(workers: int = 1) -> Iterator[None]:
+    """
+    Bound :func:`default_workers` in the calling thread.
+
+    Parameters
+    ----------
+    workers : int, optional
+        Threads granted to executors created without an explicit
+        ``workers`` inside the block.
+    """
+    if workers < 1:
+        raise ValueError("workers must be positive")
+    previous = getattr(_limits, "workers", None)
+    _limits.workers = int(workers)
+    try:
+        yield
+    finally:
+        _limits.workers = previous
+
+
+def _axes(grid) -> tuple[np.ndarray, np.ndarray]:
+    if isinstance(grid, tuple):
+        mu, sigma = grid
+        return np.asarray(mu, dtype=float), np.asarray(sigma, dtype=float)
+    return grid.mu, grid.sigma
+
+
+# ---------------------------------------------------------------------
+# Tiling
+# ---------------------------------------------------------------------
+def tiles(shape: tuple[int, ...], tile_size: int = TILE_SIZE) -> Iterator[tuple[slice, ...]]:
+    """
+    Split the leading (at most two) axes of ``shape`` into tiles.
+
+    Tiles span whole rows where possible; rows longer than ``tile_size``
+    are also split along the second axis. Any further axes are kept
+    whole and count towards the tile size.
+
+    Yields
+    ------
+    tuple of slice
+        Index of each tile into an array of shape ``shape``.
+    """
+    if len(shape) == 0:
+        yield ()
+        return
+    if len(shape) == 1:
+        for start in range(0, shape[0], tile_size):
+            yield (slice(start, min(start + tile_size, shape[0])),)
+        return
+    n_rows, n_cols = shape[0], shape[1]
+    row_size = max(int(np.prod(shape[1:], dtype=np.int64)), 1)
+    if row_size <= tile_size:
+        step = max(tile_size // row_size, 1)
+        for start in range(0, n_rows, step):
+            yield (slice(start, min(start + step, n_rows)), slice(0, n_cols))
+        return
+    inner = max(row_size // max(n_cols, 1), 1)
+    step = max(tile_size // inner, 1)
+    for row in range(n_rows):
+        for start in range(0, n_cols, step):
+            yield (slice(row, row + 1), slice(start, min(start + step, n_cols)))
+
+
+# ---------------------------------------------------------------------
+# Executor
+# ---------------------------------------------------------------------
+class TiledExecutor:
+    """
+    Thread pool evaluating kernels tile by tile into preallocated output.
+
+    Parameters
+    ----------
+    workers : int, optional
+        Worker threads (all cores if ``None``). With one worker, tiles are
+        evaluated in the calling thread.
+    tile_size : int, optional
+        Target output points per tile.
+
+    Notes
+    -----
+    The pool is created lazily and shut down by :meth:`close` or when
+    leaving a ``with`` block, so one executor can serve many calls.
+    """
+
+    def __init__(self, workers: int | None = None, *, tile_size: int = TILE_SIZE):
+        self.workers = default_workers() if workers is None else int(workers)
+        if self.workers < 1:
+            raise ValueError("workers must be positive")
+        self.tile_size = int(tile_size)
+        self._pool: ThreadPoolExecutor | None = None
+
+    def __enter__(self) -> "TiledExecutor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Shut down the worker threads.
+        """
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _run(self, task: Callable[[tuple[slice, ...]], None], shape) -> None:
+        blocks = list(tiles(shape, self.tile_size))
+        if self.workers == 1 or len(blocks) == 1:
+            for block in blocks:
+                task(block)
+            return
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix="tile")
+
+        def nested(block):
+            with limit_workers(1):
+                task(block)
+
+        # list() propagates the first kernel exception.
+        list(self._pool.map(nested, blocks))
+
+    @staticmethod
+    def _output(out, shape, components, dtype) -> np.ndarray:
+        full = tuple(shape) + tuple(components)
+        if out is None:
+            return np.empty(full, dtype=dtype)
+        if out.shape != full:
+            raise ValueError(f"Output has shape {out.shape}, expected {full}")
+        return out
+
+    @staticmethod
+    def _call(kernel: Kernel, coords, out: np.ndarray) -> None:
+        result = kernel(*coords, out=out)
+        if result is not None and result is not out:
+            out[...] = result
+
+    def map(
+        self,
+        kernel: Kernel,
+        *arrays,
+        out: np.ndarray | None = None,
+        dtype=np.float64,
+        components: tuple[int, ...] = (),
+    ) -> np.ndarray:
+        """
+        Evaluate ``kernel`` over broadcast arrays.
+
+        Parameters
+        ----------
+        kernel : callable
+            ``kernel(*tiles, out)`` for the corresponding tiles of
+            ``arrays``.
+        *arrays : array_like
+            Inputs broadcast together (without copying).
+        out : numpy.ndarray, optional
+            Output of shape ``broadcast_shape + components``.
+        dtype : numpy dtype, optional
+            Output dtype when ``out`` is not given.
+        components : tuple of int, optional
+            Trailing per-point output axes (e.g. ``(2, 2)`` for metrics).
+
+        Returns
+        -------
+        numpy.ndarray
+            The filled output array.
+        """
+        views = np.broadcast_arrays(*(np.asarray(a) for a in arrays))
+        shape = views[0].shape if views else ()
+        result = self._output(out, shape, components, dtype)
+
+        def task(block):
+            # The trailing Ellipsis keeps 0-d tiles as writable array views.
+            block = block + (Ellipsis,)
+            self._call(kernel, [v[block] for v in views], result[block])
+
+        self._run(task, shape)
+        return result
+
+    def grid(
+        self,
+        kernel: Kernel,
+        grid: Grid | tuple[np.ndarray, np.ndarray],
+        *,
+        out: np.ndarray | None = None,
+        dtype=np.float64,
+        components: tuple[int, ...] = (),
+    ) -> np.ndarray:
+        """
+        Evaluate ``kernel(mu, sigma, out)`` over a tensor grid.
+
+        The coordinate tiles are broadcast views of 1D slices of the
+        ``mu`` and ``sigma`` axes with the tile's ``(rows, cols)`` shape,
+        so the full ``meshgrid`` is never built.
+
+        Parameters
+        ----------
+        grid : Grid or tuple of numpy.ndarray
+            A :class:`~src.utils.laplacian.Grid`, or its 1D ``(mu, sigma)``
+            axes (e.g. cell faces, which need not form a valid grid).
+
+        Returns
+        -------
+        numpy.ndarray
+            Output of shape ``(sigma.size, mu.size) + components``.
+        """
+        mu_axis, sigma_axis = _axes(grid)
+        shape = (sigma_axis.size, mu_axis.size)
+        result = self._output(out, shape, components, dtype)
+
+        def task(block):
+            rows, cols = block
+            tile = (rows.stop - rows.start, cols.stop - cols.start)
+            mu = np.broadcast_to(mu_axis[cols], tile)
+            sigma = np.broadcast_to(sigma_axis[rows, None], tile)
+            self._call(kernel, (mu, sigma), result[block])
+
+        self._run(task, shape)
+        return result
+
+
+# ---------------------------------------------------------------------
+# Convenience wrappers
+# ---------------------------------------------------------------------
+def evaluate(
+    kernel: Kernel,
+    *arrays,
+    out: np.ndarray | None = None,
+    workers: int | None = None,
+    tile_size: int = TILE_SIZE,
+    **options,
+) -> np.ndarray:
+    """
+    One-shot :meth:`TiledExecutor.map`.
+    """
+    with TiledExecutor(workers, tile_size=tile_size) as executor:
+        return executor.map(kernel, *arrays, out=out, **options)
+
+
+def evaluate_grid(
+    kernel: Kernel,
+    grid: Grid | tuple[np.ndarray, np.ndarray],
+    *,
+    out: np.ndarray | None = None,
+    workers: int | None = None,
+    tile_size: int = TILE_SIZE,
+    **options,
+) -> np.ndarray:
+    """
+    One-shot :meth:`TiledExecutor.grid`.
+    """
+    with TiledExecutor(workers, tile_size=tile_size) as executor:
+        return executor.grid(kernel, grid, out=out, **options)
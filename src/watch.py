@@ -0,0 +1,302 @@
+"""
+Polling watch mode for incremental figure regeneration.
+
+This module keeps a warm Python process (Matplotlib and NumPy already
+imported) and polls the figure and utility sources for changes. Each
+burst of edits is debounced into a single update; only the figures
+whose module, or any ``src`` module it imports, changed are reloaded
+and regenerated.
+
+No external services or filesystem-notification libraries are used:
+change detection relies solely on ``stat`` polling, so it behaves the
+same on every platform.
+
+Usage::
+
+    python -m src.run_figures --watch
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import time
+import traceback
+from pathlib import Path
+from typing import Callable, Iterable
+
+from src.build import figure_module, imported_modules, module_dependencies
+from src.run_figures import FIGURES
+from src.utils.paths import ROOT_DIR, SUPPORTED_FORMATS
+
+
+# ---------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------
+WATCHED_DIRS: tuple[Path, ...] = (
+    ROOT_DIR / "src" / "figures",
+    ROOT_DIR / "src" / "utils",
+)
+"""
+Directories whose ``*.py`` files are polled for changes.
+"""
+
+Snapshot = dict[Path, tuple[int, int]]
+
+
+# ---------------------------------------------------------------------
+# Change detection
+# ---------------------------------------------------------------------
+def watched_files(dirs: Iterable[Path] = WATCHED_DIRS) -> list[Path]:
+    """
+    Return all Python sources under the watched directories.
+    """
+    return sorted(p for d in dirs for p in Path(d).glob("*.py"))
+
+
+def snapshot(files: Iterable[Path]) -> Snapshot:
+    """
+    Record ``(mtime_ns, size)`` for each existing file.
+    """
+    state: Snapshot = {}
+    for path in files:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            continue
+        state[path] = (st.st_mtime_ns, st.st_size)
+    return state
+
+
+def changed_files(before: Snapshot, after: Snapshot) -> set[Path]:
+    """
+    Return files added, removed or modified between two snapshots.
+    """
+    return {
+        path
+        for path in before.keys() | after.keys()
+        if before.get(path) != after.get(path)
+    }
+
+
+def affected_figures(changed: Iterable[Path]) -> list[str]:
+    """
+    Map changed source files to the figures that depend on them.
+
+    Parameters
+    ----------
+    changed : iterable of Path
+        Modified source files.
+
+    Returns
+    -------
+    list of str
+        Affected figure names in registry order.
+    """
+    changed = {Path(p).resolve() for p in changed}
+    return [
+        name
+        for name in FIGURES
+        if changed.intersection(module_dependencies(figure_module(name)))
+    ]
+
+
+# ---------------------------------------------------------------------
+# Module reloading
+# ---------------------------------------------------------------------
+def _module_name(path: Path) -> str:
+    return ".".join(path.resolve().relative_to(ROOT_DIR).with_suffix("").parts)
+
+
+def reload_order(changed: Iterable[Path]) -> list[str]:
+    """
+    Return the loaded ``src`` modules to reload, dependencies first.
+
+    A module must be reloaded if it changed itself or if it imports,
+    directly or transitively, a module that changed; otherwise it would
+    keep references to stale objects (e.g. ``from ... import name``).
+    Only modules under :data:`WATCHED_DIRS` are considered; the
+    orchestration modules running the watcher are never reloaded.
+    """
+    watched = {Path(d).resolve() for d in WATCHED_DIRS}
+    loaded = {
+        name: Path(module.__file__).resolve()
+        for name, module in list(sys.modules.items())
+        if name.startswith("src.")
+        and getattr(module, "__file__", None)
+        and Path(module.__file__).resolve().parent in watched
+    }
+    graph = {
+        name: {dep for dep in imported_modules(path) if dep in loaded}
+        for name, path in loaded.items()
+        if path.exists()
+    }
+
+    dirty = {_module_name(p) for p in changed} & graph.keys()
+    grew = True
+    while grew:
+        grew = False
+        for name, deps in graph.items():
+            if name not in dirty and deps & dirty:
+                dirty.add(name)
+                grew = True
+
+    order: list[str] = []
+    visiting: set[str] = set()
+
+    def visit(name: str) -> None:
+        if name in order or name in visiting:
+            return
+        visiting.add(name)
+        for dep in sorted(graph[name] & dirty):
+            visit(dep)
+        order.append(name)
+
+    for name in sorted(dirty):
+        visit(name)
+    return order
+
+
+def regenerate(
+    names: Iterable[str],
+    changed: Iterable[Path] = (),
+    *,
+    formats: Iterable[str] | None = None,
+) -> list[str]:
+    """
+    Reload changed modules and regenerate the given figures in-process.
+
+    Parameters
+    ----------
+    names : iterable of str
+        Figures to regenerate.
+    changed : iterable of Path, optional
+        Changed source files whose modules must be reloaded first.
+    formats : iterable of str or None, optional
+        Paper formats. If ``None``, all supported formats are used.
+
+    Returns
+    -------
+    list of str
+        Figures that were regenerated successfully.
+
+    Notes
+    -----
+    Errors (including syntax errors from a half-saved file) are printed
+    and do not stop the remaining figures or the watcher.
+    """
+    if formats is None:
+        formats = SUPPORTED_FORMATS
+    formats = tuple(formats)
+
+    for module in reload_order(changed):
+        try:
+            importlib.reload(sys.modules[module])
+        except Exception:
+            traceback.print_exc()
+            return []
+
+    done = []
+    for name in names:
+        try:
+            module = importlib.import_module(figure_module(name))
+            module.generate(formats=formats)
+        except Exception:
+            traceback.print_exc()
+            continue
+        done.append(name)
+    return done
+
+
+# ---------------------------------------------------------------------
+# Watch loop
+# ---------------------------------------------------------------------
+def wait_for_changes(
+    previous: Snapshot,
+    *,
+    files: Callable[[], list[Path]] = watched_files,
+    interval: float = 0.25,
+    debounce: float = 0.3,
+    sleep: Callable[[float], None] = time.sleep,
+    clock: Callable[[], float] = time.monotonic,
+) -> tuple[Snapshot, set[Path]]:
+    """
+    Block until files change and stay quiet for ``debounce`` seconds.
+
+    Parameters
+    ----------
+    previous : dict
+        Snapshot to compare against.
+    files : callable, optional
+        Returns the files to poll.
+    interval : float, optional
+        Polling period in seconds.
+    debounce : float, optional
+        Quiet period that ends a burst of edits.
+    sleep, clock : callable, optional
+        Injectable time functions (for testing).
+
+    Returns
+    -------
+    tuple
+        ``(snapshot, changed)`` where ``changed`` accumulates every file
+        touched during the burst.
+    """
+    changed: set[Path] = set()
+    last_change = None
+    while True:
+        current = snapshot(files())
+        delta = changed_files(previous, current)
+        if delta:
+            changed |= delta
+            last_change = clock()
+            previous = current
+        elif last_change is not None and clock() - last_change >= debounce:
+            return current, changed
+        sleep(interval)
+
+
+def watch(
+    formats: Iterable[str] | None = None,
+    *,
+    interval: float = 0.25,
+    debounce: float = 0.3,
+    max_updates: int | None = None,
+) -> None:
+    """
+    Watch figure and utility sources and regenerate affected figures.
+
+    Parameters
+    ----------
+    formats : iterable of str or None, optional
+        Paper formats. If ``None``, all supported formats are used.
+    interval : float, optional
+        Polling period in seconds.
+    debounce : float, optional
+        Quiet period that ends a burst of edits.
+    max_updates : int or None, optional
+        Stop after this many updates (``None`` runs until interrupted).
+    """
+    state = snapshot(watched_files())
+    print(f"Watching {len(state)} files (Ctrl-C to stop)", flush=True)
+
+    updates = 0
+    try:
+        while max_updates is None or updates < max_updates:
+            state, changed = wait_for_changes(
+                state, interval=interval, debounce=debounce
+            )
+            names = affected_figures(changed)
+            if not names:
+                continue
+            start = time.perf_counter()
+            done = regenerate(names, changed, formats=formats)
+            elapsed = time.perf_counter() - start
+            print(
+                f"Regenerated {len(done)}/{len(names)} figure(s) "
+                f"in {elapsed:.2f} s: {', '.join(done) or '-'}",
+                flush=True,
+            )
+            updates += 1
+    except KeyboardInterrupt:
+        pass
@@ -6,9 +6,10 @@ and produces output files for the requested paper formats.
 """
 
 import matplotlib
+import numpy as np
 import pytest
 
-from src.figures.fig_univariate_gaussian_alignment_field import generate
+from src.figures.fig_univariate_gaussian_alignment_field import compute_bands, generate
 
 
 # ---------------------------------------------------------------------
@@ -69,3 +70,17 @@ def test_generate_supports_multiple_formats(tmp_path, monkeypatch):
     )
 
     assert output.exists()
+
+
+def test_compute_bands_on_coarse_grid():
+    """
+    compute_bands must return ordered bands on the requested grid.
+    """
+    MU, SIGMA, result = compute_bands(
+        sample_size=200, replicates=20, grid_shape=(20, 24), seed=1
+    )
+
+    assert MU.shape == SIGMA.shape == (20, 24)
+    assert result.field.estimate.shape == (20, 24)
+    assert np.all(result.field.lower <= result.field.upper)
+    assert np.all(result.source.width >= 0.0)
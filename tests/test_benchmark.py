@@ -0,0 +1,148 @@
+"""
+Tests for the manufactured-solution solver benchmark.
+"""
+
+import dataclasses
+
+import matplotlib
+import numpy as np
+import pytest
+
+from src.benchmark import (
+    TIME_FLOOR,
+    BenchmarkRun,
+    ManufacturedSolution,
+    benchmark_grid,
+    convergence_orders,
+    load_runs,
+    pareto_table,
+    regressions,
+    run_benchmark,
+    write_reports,
+)
+
+
+# ---------------------------------------------------------------------
+# Global test configuration
+# ---------------------------------------------------------------------
+@pytest.fixture(autouse=True)
+def use_headless_backend():
+    """
+    Force a non-interactive Matplotlib backend for tests.
+    """
+    matplotlib.use("Agg")
+
+
+def test_manufactured_laplacian_matches_finite_differences():
+    """
+    The closed-form Δ_G φ must match a finite-difference evaluation.
+    """
+    exact = ManufacturedSolution()
+    mu, sigma, h = 0.3, 1.1, 1e-4
+
+    def phi(m, s):
+        return exact.phi(np.float64(m), np.float64(s))
+
+    d_mumu = (phi(mu + h, sigma) - 2 * phi(mu, sigma) + phi(mu - h, sigma)) / h**2
+    d_sigsig = (phi(mu, sigma + h) - 2 * phi(mu, sigma) + phi(mu, sigma - h)) / h**2
+
+    expected = sigma**2 * d_mumu + 0.5 * sigma**2 * d_sigsig
+    assert exact.laplacian(mu, sigma) == pytest.approx(expected, rel=1e-5)
+
+
+@pytest.mark.parametrize("n", [9, 17, 33])
+def test_manufactured_solution_vanishes_on_ghost_layer(n):
+    """
+    φ must vanish one spacing outside every benchmark grid (Dirichlet ghost nodes).
+    """
+    grid = benchmark_grid(n)
+    exact = ManufacturedSolution()
+
+    assert exact.phi(grid.mu[0] - grid.h_mu, 1.0) == pytest.approx(0.0, abs=1e-15)
+    assert exact.phi(grid.mu[-1] + grid.h_mu, 1.0) == pytest.approx(0.0, abs=1e-15)
+    assert exact.phi(0.0, grid.sigma[0] - grid.h_sigma) == pytest.approx(0.0, abs=1e-15)
+    assert exact.phi(0.0, grid.sigma[-1] + grid.h_sigma) == pytest.approx(0.0, abs=1e-15)
+
+
+def test_direct_solver_converges_at_second_order():
+    """
+    On the fixed box, the direct solver must show an observed order of 2 on every refinement.
+    """
+    runs = run_benchmark((17, 33, 65), solvers=["direct"])
+
+    assert [r.status for r in runs] == ["ok"] * 3
+    for run in runs[1:]:
+        assert run.order == pytest.approx(2.0, abs=0.05)
+        assert not run.stalled
+
+
+def test_stalled_series_is_flagged():
+    """
+    A series whose error stops decreasing must be flagged and listed in the table.
+    """
+    runs = [
+        BenchmarkRun("spectral-k64", 17, 0.2, None, error_l2=5.0e-3),
+        BenchmarkRun("spectral-k64", 33, 0.1, None, error_l2=4.8e-3),
+    ]
+    convergence_orders(runs)
+
+    assert runs[1].stalled
+    assert "Stalled convergence" in pareto_table(runs)
+
+
+def test_pareto_front_is_non_dominated():
+    """
+    No run may beat a Pareto run in both time and error.
+    """
+    runs = run_benchmark((9, 17), (1e-4, 1e-8), solvers=["direct", "cg", "action-lbfgs"])
+    front = [r for r in runs if r.pareto]
+
+    assert front
+    for p in front:
+        assert not any(r.time < p.time and r.error_l2 < p.error_l2 for r in runs)
+
+
+def test_reports_and_regression_check(tmp_path):
+    """
+    Reports must round-trip and slower or less accurate runs be flagged.
+    """
+    runs = run_benchmark((9, 17), (1e-6,), solvers=["direct", "cg"])
+    results = write_reports(runs, tmp_path)
+
+    assert (tmp_path / "solver_benchmark.md").read_text().startswith("| |")
+    assert (tmp_path / "solver_pareto.pdf").exists()
+
+    baseline = load_runs(results)
+    assert regressions(runs, baseline) == []
+
+    worse = [dataclasses.replace(r, error_l2=2 * r.error_l2) for r in runs]
+    slower = [dataclasses.replace(r, time=10 * max(r.time, TIME_FLOOR)) for r in runs]
+    assert len(regressions(worse, baseline)) == len(runs)
+    assert len(regressions(slower, baseline)) == len(runs)
+
+
+def test_timings_below_floor_are_not_regressions():
+    """
+    Slowdowns of runs far below the time floor are timer noise and must not be flagged.
+    """
+    baseline = [BenchmarkRun("direct", 9, 0.4, None, error_l2=1e-3, time=1e-4)]
+    noisy = [dataclasses.replace(baseline[0], time=TIME_FLOOR)]
+
+    assert regressions(noisy, baseline) == []
+    assert regressions(noisy, baseline, time_floor=0.0) != []
+
+
+def test_unknown_solver():
+    """
+    Unknown solver names are rejected.
+    """
+    with pytest.raises(ValueError):
+        run_benchmark((9,), solvers=["multigrid"])
+
+
+def test_run_key_identifies_configuration():
+    """
+    Runs are matched across results by solver, size and tolerance.
+    """
+    assert BenchmarkRun("cg", 17, 0.1, 1e-6).key == "cg|17|1e-06"
+    assert BenchmarkRun("direct", 17, 0.1, None).key == "direct|17|-"
@@ -0,0 +1,219 @@
+"""
+Tests for the dependency-aware figure and paper build.
+
+LaTeX is never invoked: a stub compiler records the calls it receives,
+so these tests exercise only the dependency graph and staleness logic.
+"""
+
+import asyncio
+import json
+import time
+
+import matplotlib
+import pytest
+
+from src.build import (
+    FIGURES,
+    MAIN_TEX,
+    TELEMETRY_FILE,
+    build,
+    included_figures,
+    module_dependencies,
+    stale_figures,
+)
+from src.utils.paths import ROOT_DIR
+
+
+# ---------------------------------------------------------------------
+# Global test configuration
+# ---------------------------------------------------------------------
+@pytest.fixture(autouse=True)
+def use_headless_backend():
+    """
+    Force a non-interactive Matplotlib backend for tests.
+    """
+    matplotlib.use("Agg")
+
+
+@pytest.fixture
+def paper(tmp_path, monkeypatch):
+    """
+    Minimal RevTeX paper including one registered figure.
+    """
+    monkeypatch.setattr("src.utils.paths.PAPER_DIR", tmp_path / "paper")
+
+    root = tmp_path / "paper" / "revtext"
+    (root / "sections").mkdir(parents=True)
+    (root / MAIN_TEX["revtext"]).write_text(
+        "\\documentclass{revtex4-2}\n"
+        "\\begin{document}\\input{sections/01_body}\\end{document}\n"
+    )
+    (root / "sections" / "01_body.tex").write_text(
+        "\\includegraphics[width=0.5\\linewidth]"
+        "{figures/fig_alignment_operator_spectrum.pdf}\n"
+    )
+    return root
+
+
+class StubCompiler:
+    """
+    Records compilation requests and fakes the PDF output.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, main_tex):
+        await asyncio.sleep(0)
+        self.calls.append(main_tex)
+        main_tex.with_suffix(".pdf").write_bytes(b"%PDF-stub")
+
+
+# ---------------------------------------------------------------------
+# Dependency discovery
+# ---------------------------------------------------------------------
+def test_module_dependencies_follow_src_imports():
+    """
+    Figure modules must depend on the utilities they import.
+    """
+    deps = module_dependencies("src.figures.fig_alignment_field_screening")
+    names = {p.relative_to(ROOT_DIR).as_posix() for p in deps}
+
+    assert "src/figures/fig_alignment_field_screening.py" in names
+    assert "src/utils/plotting.py" in names
+    assert "src/utils/paths.py" in names
+
+
+def test_included_figures_of_repository_paper():
+    """
+    The manuscript includes the spectrum and Gaussian-field figures only.
+    """
+    assert included_figures("revtext") == [
+        "fig_alignment_operator_spectrum",
+        "fig_univariate_gaussian_alignment_field",
+    ]
+
+
+# ---------------------------------------------------------------------
+# Incremental builds
+# ---------------------------------------------------------------------
+def test_first_build_generates_everything(paper):
+    """
+    A fresh tree must build every figure and compile the paper once.
+    """
+    compiler = StubCompiler()
+
+    report = build(("revtext",), compiler=compiler)
+
+    assert set(report.values()) == {"built"}
+    assert "paper:revtext" in report
+    assert compiler.calls == [paper / MAIN_TEX["revtext"]]
+    assert (paper / "figures" / "fig_alignment_operator_spectrum.pdf").exists()
+
+
+def test_build_records_solver_telemetry(paper):
+    """
+    Regenerated figures must report their solves to the telemetry file.
+    """
+    build(("revtext",), compiler=None)
+
+    telemetry = json.loads((paper / TELEMETRY_FILE).read_text())
+    solves = telemetry["fig_univariate_gaussian_alignment_field"]
+
+    assert solves["summary"]["field/direct"]["solves"] == 2
+    assert solves["summary"]["field/direct-block"]["solves"] == 1
+    assert solves["records"][0]["factorization_bytes"] > 0
+    assert telemetry["fig_alignment_operator_spectrum"]["records"] == []
+
+
+def test_second_build_is_a_no_op(paper):
+    """
+    Rebuilding an unchanged tree must not render or compile anything.
+    """
+    build(("revtext",), compiler=StubCompiler())
+    compiler = StubCompiler()
+
+    report = build(("revtext",), compiler=compiler)
+
+    assert set(report.values()) == {"up-to-date"}
+    assert compiler.calls == []
+    assert stale_figures(("revtext",)) == []
+
+
+def test_section_edit_recompiles_paper_only(paper):
+    """
+    Editing a .tex section must recompile the paper without figures.
+    """
+    build(("revtext",), compiler=StubCompiler())
+    (paper / "sections" / "01_body.tex").write_text("% edited\n", encoding="utf-8")
+    compiler = StubCompiler()
+
+    report = build(("revtext",), compiler=compiler)
+
+    assert report["paper:revtext"] == "built"
+    assert len(compiler.calls) == 1
+    assert all(
+        status == "up-to-date"
+        for target, status in report.items()
+        if target.startswith("fig_")
+    )
+
+
+def test_missing_figure_is_rebuilt(paper):
+    """
+    Deleting a figure output must make that figure stale again.
+    """
+    build(("revtext",), compiler=StubCompiler())
+    (paper / "figures" / "fig_alignment_field_screening.pdf").unlink()
+
+    assert stale_figures(("revtext",)) == ["fig_alignment_field_screening"]
+
+
+def test_failing_compiler_propagates(paper):
+    """
+    Compiler failures must surface and leave the paper stale.
+    """
+
+    async def failing(main_tex):
+        raise RuntimeError("latex error")
+
+    with pytest.raises(RuntimeError, match="latex error"):
+        build(("revtext",), compiler=failing)
+
+    compiler = StubCompiler()
+    build(("revtext",), compiler=compiler)
+    assert len(compiler.calls) == 1
+
+
+def test_failing_figure_with_others_in_flight(paper, monkeypatch):
+    """
+    A figure error must surface unchanged while siblings render and the paper compiles.
+    """
+    compiled = []
+
+    def quick(formats=("revtext",)):
+        (paper / "figures").mkdir(exist_ok=True)
+        (paper / "figures" / "fig_alignment_operator_spectrum.pdf").write_bytes(b"%PDF")
+
+    def failing(formats=("revtext",)):
+        time.sleep(0.05)
+        raise RuntimeError("figure failed")
+
+    def slow(formats=("revtext",)):
+        time.sleep(0.2)
+        (paper / "figures" / "fig_alignment_field_screening.pdf").write_bytes(b"%PDF")
+
+    async def slow_compiler(main_tex):
+        await asyncio.sleep(0.5)
+        compiled.append(main_tex)
+        main_tex.with_suffix(".pdf").write_bytes(b"%PDF-stub")
+
+    monkeypatch.setitem(FIGURES, "fig_alignment_operator_spectrum", quick)
+    monkeypatch.setitem(FIGURES, "fig_univariate_gaussian_alignment_field", failing)
+    monkeypatch.setitem(FIGURES, "fig_alignment_field_screening", slow)
+
+    with pytest.raises(RuntimeError, match="figure failed"):
+        build(("revtext",), compiler=slow_compiler, jobs=3)
+
+    assert compiled == [paper / MAIN_TEX["revtext"]]
+    assert stale_figures(("revtext",)) == ["fig_univariate_gaussian_alignment_field"]
@@ -0,0 +1,153 @@
+"""
+Tests for the polling watch mode.
+
+These tests cover change detection, the mapping from edited sources to
+affected figures, debouncing, and in-process regeneration.
+"""
+
+import matplotlib
+import pytest
+
+from src.utils.paths import ROOT_DIR
+from src.watch import (
+    affected_figures,
+    changed_files,
+    regenerate,
+    reload_order,
+    snapshot,
+    wait_for_changes,
+)
+
+
+# ---------------------------------------------------------------------
+# Global test configuration
+# ---------------------------------------------------------------------
+@pytest.fixture(autouse=True)
+def use_headless_backend():
+    """
+    Force a non-interactive Matplotlib backend for tests.
+    """
+    matplotlib.use("Agg")
+
+
+# ---------------------------------------------------------------------
+# Change detection
+# ---------------------------------------------------------------------
+def test_changed_files_detects_edits_additions_and_removals(tmp_path):
+    """
+    changed_files must report modified, new and deleted files.
+    """
+    a, b, c = tmp_path / "a.py", tmp_path / "b.py", tmp_path / "c.py"
+    a.write_text("x = 1\n")
+    b.write_text("y = 1\n")
+    before = snapshot([a, b, c])
+
+    a.write_text("x = 22\n")
+    b.unlink()
+    c.write_text("z = 1\n")
+    after = snapshot([a, b, c])
+
+    assert changed_files(before, after) == {a, b, c}
+
+
+def test_wait_for_changes_debounces_bursts(tmp_path):
+    """
+    A burst of edits must be reported once, after the quiet period.
+    """
+    path = tmp_path / "fig_mod.py"
+    path.write_text("v = 0\n")
+    state = snapshot([path])
+    clock = {"t": 0.0, "polls": 0}
+
+    def fake_sleep(dt):
+        clock["t"] += dt
+        clock["polls"] += 1
+        if clock["polls"] <= 3:  # three edits in quick succession
+            path.write_text("v = " + "1" * clock["polls"] + "\n")
+
+    path.write_text("v = 9\n")
+    _, changed = wait_for_changes(
+        state,
+        files=lambda: [path],
+        interval=0.1,
+        debounce=0.5,
+        sleep=fake_sleep,
+        clock=lambda: clock["t"],
+    )
+
+    assert changed == {path}
+    assert clock["t"] >= 0.3 + 0.5 - 1e-9
+
+
+# ---------------------------------------------------------------------
+# Dependency mapping
+# ---------------------------------------------------------------------
+def test_figure_module_edit_affects_only_that_figure():
+    """
+    Editing a figure module must only affect its own figure.
+    """
+    path = ROOT_DIR / "src" / "figures" / "fig_alignment_field_screening.py"
+
+    assert affected_figures([path]) == ["fig_alignment_field_screening"]
+
+
+def test_utility_edit_affects_all_importing_figures():
+    """
+    Editing a shared utility must affect every figure importing it.
+    """
+    path = ROOT_DIR / "src" / "utils" / "plotting.py"
+
+    assert affected_figures([path]) == [
+        "fig_alignment_operator_spectrum",
+        "fig_alignment_field_screening",
+        "fig_univariate_gaussian_alignment_field",
+    ]
+
+
+def test_reload_order_puts_dependencies_first():
+    """
+    Changed utilities must be reloaded before the figures using them.
+    """
+    order = reload_order([ROOT_DIR / "src" / "utils" / "plotting.py"])
+
+    assert order[0] == "src.utils.plotting"
+    assert "src.figures.fig_alignment_field_screening" in order
+    assert "src.run_figures" not in order
+
+
+# ---------------------------------------------------------------------
+# Regeneration
+# ---------------------------------------------------------------------
+def test_regenerate_writes_only_requested_figures(tmp_path, monkeypatch):
+    """
+    regenerate must render only the requested figures.
+    """
+    monkeypatch.setattr("src.utils.paths.PAPER_DIR", tmp_path / "paper")
+
+    done = regenerate(["fig_alignment_field_screening"], formats=("revtext",))
+
+    produced = {p.name for p in (tmp_path / "paper" / "revtext" / "figures").iterdir()}
+    assert done == ["fig_alignment_field_screening"]
+    assert produced == {"fig_alignment_field_screening.pdf"}
+
+
+def test_watch_entry_point_builds_incrementally(monkeypatch):
+    """
+    --watch must start from the incremental build, not a full run_all.
+    """
+    calls = []
+
+    def fail_run_all(formats=None):
+        raise AssertionError("run_all must not be called in watch mode")
+
+    monkeypatch.setattr("src.run_figures.run_all", fail_run_all)
+    monkeypatch.setattr("src.build.build", lambda **kw: calls.append(("build", kw)))
+    monkeypatch.setattr("src.watch.watch", lambda **kw: calls.append(("watch", kw)))
+
+    from src.run_figures import main
+
+    main(["--watch", "--interval", "0.1"])
+
+    assert [c[0] for c in calls] == ["build", "watch"]
+    assert calls[0][1] == {"compiler": None}
+    assert calls[1][1]["interval"] == 0.1
@@ -0,0 +1,107 @@
+"""
+Tests for the discrete action functional and its minimizer.
+"""
+
+import numpy as np
+import pytest
+
+from src.utils.action import ActionFunctional, field_action, minimize_action
+from src.utils.laplacian import Grid, LaplaceBeltrami
+from src.utils.poisson import solve_field
+
+
+@pytest.fixture
+def grid():
+    return Grid.linspace((-2.0, 2.0), (0.5, 2.5), (24, 26))
+
+
+def source(grid):
+    MU, SIGMA = grid.mesh()
+    return np.exp(-MU**2) * np.sin(3.0 * SIGMA)
+
+
+def quartic(phi):
+    return 0.25 * phi**4, phi**3
+
+
+@pytest.mark.parametrize("potential", [None, quartic])
+def test_gradient_matches_finite_differences(grid, potential):
+    """
+    The analytic gradient must match central differences of S_h.
+    """
+    op = LaplaceBeltrami(grid)
+    S = ActionFunctional(op, source(grid), gamma=2.0, m=0.7, potential=potential)
+    phi = np.random.default_rng(0).normal(size=grid.shape)
+    direction = np.random.default_rng(1).normal(size=grid.shape)
+    eps = 1e-6
+
+    fd = (S(phi + eps * direction) - S(phi - eps * direction)) / (2 * eps)
+
+    assert np.vdot(S.gradient(phi), direction) == pytest.approx(fd, rel=1e-7)
+
+
+def test_solution_value_and_stationarity(grid):
+    """
+    The field-equation solution must be stationary with S = ½ γ (M A)ᵀ φ.
+    """
+    op = LaplaceBeltrami(grid)
+    A = source(grid)
+    phi = solve_field(A, op, m=1.0, gamma=2.0)
+    S = ActionFunctional(op, A, m=1.0, gamma=2.0)
+
+    value, gradient = S.value_and_gradient(phi)
+
+    assert np.abs(gradient).max() < 1e-10 * np.abs(S.linear).max()
+    assert value == pytest.approx(0.5 * 2.0 * np.vdot(op.mass * A, phi))
+    assert field_action(phi, A, op, m=1.0, gamma=2.0) == value
+
+
+@pytest.mark.parametrize("method", ["L-BFGS-B", "CG"])
+@pytest.mark.parametrize("bc, m", [("dirichlet", 0.0), ("dirichlet", 1.5), ("neumann", 0.0)])
+def test_minimizer_recovers_field_solution(grid, method, bc, m):
+    """
+    Minimizing S_h must reproduce the linear solver's field.
+    """
+    op = LaplaceBeltrami(grid, bc=bc)
+    A = source(grid) + 0.3
+    expected = solve_field(A, op, m=m)
+
+    result = minimize_action(ActionFunctional(op, A, m=m), method=method)
+
+    assert result.converged
+    assert np.allclose(result.phi, expected, atol=1e-5 * np.abs(expected).max())
+
+
+def test_nonlinear_coupling_is_stationary(grid):
+    """
+    With a quartic potential the minimizer must satisfy the nonlinear equation.
+    """
+    op = LaplaceBeltrami(grid)
+    S = ActionFunctional(op, 50.0 * source(grid), potential=quartic)
+
+    result = minimize_action(S)
+    linear = minimize_action(ActionFunctional(op, 50.0 * source(grid)))
+
+    assert result.converged
+    assert result.gradient_norm < 1e-4
+    assert np.abs(result.phi).max() < np.abs(linear.phi).max()
+
+
+def test_buffers_are_reused(grid):
+    """
+    Evaluating into a caller buffer must not allocate a new gradient.
+    """
+    S = ActionFunctional(LaplaceBeltrami(grid), source(grid))
+    out = np.empty(grid.size)
+
+    _, gradient = S.value_and_gradient(np.zeros(grid.size), out=out)
+
+    assert gradient is out
+
+
+def test_unknown_method(grid):
+    """
+    Unsupported optimizers are rejected.
+    """
+    with pytest.raises(ValueError):
+        minimize_action(ActionFunctional(LaplaceBeltrami(grid), source(grid)), method="BFGS")
@@ -0,0 +1,185 @@
+"""
+Tests for compressed chunked field archives.
+"""
+
+import numpy as np
+import pytest
+
+from src.utils.archive import Archive, ArchiveWriter, save_archive
+from src.utils.field import Field
+from src.utils.laplacian import Grid
+
+
+@pytest.fixture
+def source():
+    grid = Grid.linspace((-3.0, 3.0), (0.5, 3.0), (90, 70))
+    MU, SIGMA = grid.mesh()
+    return np.exp(-(MU**2)) * np.sin(3.0 * SIGMA) / SIGMA**2
+
+
+@pytest.mark.parametrize("codec", ["zlib", "lzma", "none"])
+def test_round_trip_is_lossless(tmp_path, source, codec):
+    """
+    Without quantization every codec must reproduce arrays and metadata exactly.
+    """
+    path = tmp_path / "fields.fga"
+    labels = np.arange(24, dtype=np.int32).reshape(2, 3, 4)
+    with ArchiveWriter(path, codec=codec, attrs={"version": "v2"}) as writer:
+        writer.add("A", source, chunks=(16, 25), attrs={"gamma": 1.0})
+        writer.add("labels", labels)
+        writer.add("scalar", np.float64(2.5))
+
+    with Archive(path) as archive:
+        assert archive.names == ["A", "labels", "scalar"]
+        assert archive.attrs == {"version": "v2"}
+        assert archive.info("A")["attrs"] == {"gamma": 1.0}
+        assert np.array_equal(archive["A"].read(), source)
+        assert archive["labels"].read().dtype == np.int32
+        assert np.array_equal(np.asarray(archive["labels"]), labels)
+        assert archive["scalar"].read() == 2.5
+
+
+def test_slices_match_numpy_and_touch_only_needed_chunks(tmp_path, source):
+    """
+    Lazy slicing must match NumPy indexing and decode only overlapping chunks.
+    """
+    path = save_archive(tmp_path / "fields.fga", {"A": source}, chunks=(10, 10))
+    archive = Archive(path)
+    array = archive["A"]
+
+    keys = [
+        (slice(5, 37), slice(None, None, 3)),
+        (-1,),
+        (Ellipsis, 12),
+        (slice(None, None, -7), 3),
+    ]
+    for key in keys:
+        assert np.array_equal(array[key], source[key])
+
+    decoded = []
+    original = archive._chunk
+    archive._chunk = lambda name, number: decoded.append(number) or original(name, number)
+    array[12:18, 41:49]
+    assert sorted(decoded) == [1 * 7 + 4]
+    archive.close()
+
+
+@pytest.mark.parametrize("dtype", ["float16", "float32"])
+def test_quantization_records_error_bounds(tmp_path, source, dtype):
+    """
+    Quantized arrays must respect the recorded absolute and relative error bounds.
+    """
+    path = save_archive(tmp_path / "fields.fga", {"A": source}, quantize=dtype)
+
+    with Archive(path) as archive:
+        array = archive["A"]
+        error = np.abs(array.read() - source).max()
+        assert array.dtype == np.float64
+        assert array.quantization.dtype == dtype
+        assert error == pytest.approx(array.quantization.max_abs_error)
+        assert array.quantization.max_rel_error <= np.finfo(dtype).eps
+        assert np.dtype(archive.info("A")["stored_dtype"]) == np.dtype(dtype)
+
+
+def test_compression_and_invalid_input(tmp_path, source):
+    """
+    Smooth fields must compress, and overflow or corruption must be reported.
+    """
+    zero = save_archive(tmp_path / "zero.fga", {"Z": np.zeros((256, 256))})
+    assert zero.stat().st_size < 0.01 * 256 * 256 * 8
+
+    with pytest.raises(ValueError, match="overflow"):
+        save_archive(tmp_path / "big.fga", {"A": source * 1e6}, quantize="float16")
+    assert not list(tmp_path.glob(".big.fga*"))
+
+    path = save_archive(tmp_path / "fields.fga", {"A": source}, chunks=(45, 70))
+    data = bytearray(path.read_bytes())
+    data[10] ^= 0xFF
+    path.write_bytes(bytes(data))
+    with Archive(path) as archive:
+        with pytest.raises(ValueError, match="corrupted"):
+            archive["A"][0, 0]
+        assert np.array_equal(archive["A"][60:], source[60:])
+
+
+def test_fields_round_trip(tmp_path, source):
+    """
+    add_field / field must restore grid, values and interpolation settings.
+    """
+    grid = Grid.linspace((-3.0, 3.0), (0.5, 3.0), (90, 70))
+    field = Field(grid, source, kind="linear", decay_length=0.5)
+    path = tmp_path / "fields.fga"
+    with ArchiveWriter(path, codec="lzma") as writer:
+        writer.add_field("phi", field, quantize="float32")
+
+    with Archive(path) as archive:
+        loaded = archive.field("phi")
+
+    assert loaded.kind == "linear" and loaded.decay_length == 0.5
+    assert np.array_equal(loaded.grid.mu, grid.mu)
+    assert np.allclose(loaded(0.3, 1.2), field(0.3, 1.2), rtol=1e-6)
+
+
+def test_memmaps_and_chunk_iterators_stream_to_disk(tmp_path, source):
+    """
+    Memmaps and iterators of row bands must store the same array and error bounds.
+    """
+    mapped = np.lib.format.open_memmap(tmp_path / "A.npy", "w+", source.dtype, source.shape)
+    mapped[:] = source
+    bands = (source[start:start + 7] for start in range(0, source.shape[0], 7))
+
+    with ArchiveWriter(tmp_path / "fields.fga") as writer:
+        writer.add("array", source, chunks=(20, 30), quantize="float32")
+        writer.add("mapped", mapped, chunks=(20, 30), quantize="float32")
+        writer.add("streamed", bands, chunks=(20, 30), quantize="float32")
+
+    with Archive(tmp_path / "fields.fga") as archive:
+        reference = archive["array"]
+        for name in ("mapped", "streamed"):
+            assert archive[name].shape == source.shape
+            assert np.array_equal(archive[name].read(), reference.read())
+            assert archive[name].quantization == reference.quantization
+
+    with ArchiveWriter(tmp_path / "bad.fga") as writer:
+        with pytest.raises(ValueError, match="trailing shape"):
+            writer.add("ragged", iter([source[:3], source[:3, :5]]))
+
+
+@pytest.mark.parametrize(
+    "content", [b"", b"FGAR", b"NOPE\x01" + bytes(20), b"FGAR\x01" + b"{}" + bytes(12)]
+)
+def test_invalid_files_are_rejected_and_closed(tmp_path, content, monkeypatch):
+    """
+    Opening a non-archive must raise ValueError without leaking the file handle.
+    """
+    path = tmp_path / "broken.fga"
+    path.write_bytes(content)
+    opened = []
+    original_open = open
+
+    def tracking_open(*args, **kwargs):
+        handle = original_open(*args, **kwargs)
+        opened.append(handle)
+        return handle
+
+    monkeypatch.setattr("builtins.open", tracking_open)
+    with pytest.raises(ValueError):
+        Archive(path)
+
+    assert opened and all(handle.closed for handle in opened)
+
+
+def test_writer_uses_a_unique_temporary_file(tmp_path, source):
+    """
+    Concurrent writers of one path must not share a temporary file.
+    """
+    first = ArchiveWriter(tmp_path / "fields.fga")
+    second = ArchiveWriter(tmp_path / "fields.fga")
+    first.add("A", source)
+    second.add("A", 2 * source)
+
+    assert first._tmp != second._tmp
+    first.close()
+    second.close()
+    with Archive(tmp_path / "fields.fga") as archive:
+        assert np.array_equal(archive["A"].read(), 2 * source)
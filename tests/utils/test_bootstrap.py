@@ -0,0 +1,104 @@
+"""
+Tests for vectorized bootstrap bands of the alignment source and field.
+"""
+
+import numpy as np
+import pytest
+
+from src.utils.bootstrap import (
+    BootstrapBands,
+    bootstrap_alignment_field,
+    bootstrap_weights,
+    power_sums,
+)
+from src.utils.laplacian import Grid, LaplaceBeltrami
+from src.utils.online import gaussian_alignment_from_moments
+from src.utils.poisson import FieldSolver
+
+
+@pytest.fixture
+def grid():
+    return Grid.linspace((-2.0, 2.0), (0.5, 2.5), (24, 28))
+
+
+@pytest.mark.parametrize("scheme", ["multinomial", "bayesian"])
+def test_weights_rows_sum_to_sample_size(scheme):
+    """
+    Every replicate weight vector must be non-negative and sum to n.
+    """
+    W = bootstrap_weights(50, 30, scheme=scheme, seed=0)
+
+    assert W.shape == (30, 50)
+    assert np.all(W >= 0.0)
+    assert np.allclose(W.sum(axis=1), 50.0)
+
+
+def test_weights_reject_unknown_scheme():
+    """
+    An unknown resampling scheme must raise ValueError.
+    """
+    with pytest.raises(ValueError):
+        bootstrap_weights(10, scheme="jackknife")
+
+
+def test_weight_matrix_moments_match_explicit_resamples(grid):
+    """
+    W P must give the moments of explicitly resampled data sets.
+    """
+    x = np.random.default_rng(1).normal(0.3, 1.2, size=40)
+    W = bootstrap_weights(x.size, 5, seed=2)
+    sums = W @ power_sums(x, 0.0)
+    MU, SIGMA = grid.mesh()
+
+    for counts, s in zip(W, sums):
+        resample = np.repeat(x, counts.astype(int))
+        moments = [np.mean(resample**k) for k in range(5)]
+        assert np.allclose(s / s[0], moments)
+        assert np.allclose(
+            gaussian_alignment_from_moments(MU, SIGMA, s / s[0]),
+            gaussian_alignment_from_moments(MU, SIGMA, moments),
+        )
+
+
+@pytest.mark.parametrize("bc, m", [("dirichlet", 0.0), ("neumann", 0.0), ("neumann", 1.0)])
+@pytest.mark.parametrize("method", ["direct", "cg"])
+def test_solve_many_matches_individual_solves(grid, bc, m, method):
+    """
+    The multi-RHS block solve must match solving each source in turn.
+    """
+    sources = np.random.default_rng(3).normal(size=(4,) + grid.shape)
+    solver = FieldSolver(LaplaceBeltrami(grid, bc=bc), m=m, method=method)
+
+    block = solver.solve_many(sources, gamma=0.7)
+    single = np.stack([solver.solve(s, gamma=0.7) for s in sources])
+
+    assert block.shape == sources.shape
+    assert np.allclose(block, single, rtol=1e-6, atol=1e-8 * np.abs(single).max())
+
+
+def test_bands_bracket_estimate_and_narrow_with_sample_size(grid):
+    """
+    Bands must bracket their replicates' median and shrink as n grows.
+    """
+    operator = LaplaceBeltrami(grid)
+    rng = np.random.default_rng(4)
+    widths = []
+    for n in (100, 1600):
+        result = bootstrap_alignment_field(
+            rng.normal(0.0, 1.0, size=n), operator, m=1.0, replicates=60, seed=5
+        )
+        for bands in (result.source, result.field):
+            assert bands.replicates.shape == (60,) + grid.shape
+            median = np.median(bands.replicates, axis=0)
+            assert np.all(bands.lower <= median) and np.all(median <= bands.upper)
+        widths.append(np.mean(result.field.width))
+
+    assert widths[1] < 0.5 * widths[0]
+
+
+def test_bands_reject_invalid_level():
+    """
+    A coverage level outside (0, 1) must raise ValueError.
+    """
+    with pytest.raises(ValueError):
+        BootstrapBands.from_replicates(np.zeros(3), np.zeros((5, 3)), level=1.0)
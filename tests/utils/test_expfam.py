@@ -0,0 +1,258 @@
+"""
+Tests for the batched exponential-family Fisher backend.
+
+The univariate Gaussian case is cross-checked against the closed-form
+geometry; GLM families are checked against direct NumPy formulas.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from src.utils.expfam import (  # noqa: E402
+    ExponentialFamily,
+    categorical_glm_family,
+    diagonal_gaussian_family,
+    fisher_batch,
+    fisher_metric,
+    gaussian_family,
+    laplacian_metric,
+    poisson_glm_family,
+    score,
+)
+from src.utils.fisher import gaussian_metric, gaussian_score  # noqa: E402
+from src.utils.laplacian import Grid, LaplaceBeltrami  # noqa: E402
+from src.utils.quadrature import (  # noqa: E402
+    gaussian_alignment_source,
+    gaussian_alignment_tensor,
+    gaussian_rule,
+)
+
+
+@pytest.fixture
+def gaussian_grid():
+    mu, sigma = np.meshgrid(np.linspace(-2, 2, 11), np.linspace(0.5, 3, 9))
+    return mu, sigma, np.stack([mu.ravel(), sigma.ravel()], axis=1)
+
+
+def test_gaussian_family_matches_closed_form(gaussian_grid):
+    """
+    For d = 1, G, A and the alignment tensor must agree with the closed-form Gaussian geometry.
+    """
+    mu, sigma, thetas = gaussian_grid
+    rule = gaussian_rule(0.5, 1.3, n=16)
+
+    batch = fisher_batch(
+        diagonal_gaussian_family(1), thetas, rule.nodes[:, None], weights=rule.weights
+    )
+
+    assert batch.metric.shape == (thetas.shape[0], 2, 2)
+    assert np.allclose(batch.metric, gaussian_metric(mu.ravel(), sigma.ravel()))
+    assert np.allclose(batch.alignment, gaussian_alignment_source(mu, sigma, rule).ravel())
+    tensor = gaussian_alignment_tensor(mu, sigma, rule)
+    assert np.allclose(batch.alignment_tensor.data, tensor.data.reshape(-1, 3))
+
+
+def test_gaussian_scores_match_closed_form(gaussian_grid):
+    """
+    Autodiff scores must equal the analytic Gaussian scores.
+    """
+    _, _, thetas = gaussian_grid
+    y = np.linspace(-3, 3, 7)
+
+    s = score(diagonal_gaussian_family(1), thetas, y[:, None])
+    expected = gaussian_score(y[None, :], thetas[:, :1], thetas[:, 1:])
+
+    assert s.shape == (thetas.shape[0], 7, 2)
+    assert np.allclose(s, np.moveaxis(expected, 0, -1))
+
+
+def test_chunking_does_not_change_results(gaussian_grid):
+    """
+    Splitting the parameter batch must not alter the output.
+    """
+    _, _, thetas = gaussian_grid
+    y = np.random.default_rng(0).normal(size=(50, 2))
+    family = diagonal_gaussian_family(2)
+    thetas4 = np.hstack([thetas[:, :1], thetas[:, :1], thetas[:, 1:], thetas[:, 1:]])
+
+    full = fisher_batch(family, thetas4, y)
+    chunked = fisher_batch(family, thetas4, y, chunk_size=7)
+
+    assert np.allclose(full.metric, chunked.metric)
+    assert np.allclose(full.covariance, chunked.covariance)
+
+
+def test_poisson_glm_metric_and_covariance():
+    """
+    Poisson GLM: G = E[λ x xᵀ] and C = E[(y − λ)² x xᵀ].
+    """
+    rng = np.random.default_rng(1)
+    X = rng.normal(size=(40, 3))
+    y = rng.poisson(1.0, size=40).astype(float)
+    beta = rng.normal(size=(5, 3)) * 0.2
+
+    batch = fisher_batch(poisson_glm_family(3), beta, (X, y))
+
+    lam = np.exp(beta @ X.T)
+    G = np.einsum("bn,ni,nj->bij", lam, X, X) / 40
+    C = np.einsum("bn,ni,nj->bij", (y - lam) ** 2, X, X) / 40
+    assert np.allclose(batch.metric, G)
+    assert np.allclose(batch.covariance, C)
+
+
+def test_categorical_glm_metric_is_positive_definite():
+    """
+    The categorical GLM metric must be symmetric positive definite.
+    """
+    rng = np.random.default_rng(2)
+    X = rng.normal(size=(60, 2))
+    y = rng.integers(0, 3, size=60)
+    thetas = rng.normal(size=(4, 4)) * 0.1
+
+    batch = fisher_batch(categorical_glm_family(2, 3), thetas, (X, y))
+
+    assert batch.metric.shape == (4, 4, 4)
+    assert np.allclose(batch.metric, np.swapaxes(batch.metric, 1, 2))
+    assert np.all(np.linalg.eigvalsh(batch.metric) > 0)
+    assert np.all(batch.volume > 0)
+
+
+@pytest.fixture
+def cholesky_thetas():
+    rng = np.random.default_rng(3)
+    mu = rng.normal(size=(6, 2))
+    L = np.stack(
+        [rng.uniform(0.5, 2.0, 6), rng.normal(scale=0.5, size=6), rng.uniform(0.5, 2.0, 6)],
+        axis=1,
+    )
+    return np.hstack([mu, L])
+
+
+def _bivariate_log_likelihood(theta, y, x):
+    m1, m2, a, b, c = theta
+    z1 = (y[0] - m1) / a
+    z2 = (y[1] - m2 - b * z1) / c
+    return -0.5 * (z1**2 + z2**2) - torch.log(a) - torch.log(c) - math.log(2 * math.pi)
+
+
+def _bivariate_statistic(y):
+    return torch.stack([y[0], y[1], y[0] ** 2, y[0] * y[1], y[1] ** 2])
+
+
+def test_full_gaussian_metric_matches_closed_form(cholesky_thetas):
+    """
+    The Cholesky-parametrized metric must equal Σ⁻¹ ⊕ ½ Tr(Σ⁻¹ ∂Σ Σ⁻¹ ∂Σ) at every point.
+    """
+    G = fisher_metric(gaussian_family(2), cholesky_thetas, chunk_size=4)
+
+    rows, cols = np.tril_indices(2)
+    for theta, g in zip(cholesky_thetas, G):
+        L = np.zeros((2, 2))
+        L[rows, cols] = theta[2:]
+        S_inv = np.linalg.inv(L @ L.T)
+        dS = []
+        for r, c in zip(rows, cols):
+            E = np.zeros((2, 2))
+            E[r, c] = 1.0
+            dS.append(E @ L.T + L @ E.T)
+        block = [[0.5 * np.trace(S_inv @ a @ S_inv @ b) for b in dS] for a in dS]
+        assert np.allclose(g[:2, :2], S_inv)
+        assert np.allclose(g[:2, 2:], 0.0, atol=1e-12)
+        assert np.allclose(g[2:, 2:], block)
+
+
+def test_full_gaussian_reduces_to_univariate():
+    """
+    For d = 1 the full-covariance family must coincide with the diagonal one.
+    """
+    thetas = np.array([[0.3, 1.5], [-1.0, 0.7]])
+    y = np.random.default_rng(4).normal(size=(30, 1))
+
+    full = fisher_batch(gaussian_family(1), thetas, y)
+    diagonal = fisher_batch(diagonal_gaussian_family(1), thetas, y)
+
+    assert np.allclose(full.metric, diagonal.metric)
+    assert np.allclose(full.covariance, diagonal.covariance)
+
+
+def test_family_from_log_likelihood_matches_explicit_family(cholesky_thetas):
+    """
+    A family built from the bivariate Gaussian log-density must match gaussian_family(2).
+    """
+    rng = np.random.default_rng(5)
+    family = ExponentialFamily.from_log_likelihood(
+        _bivariate_log_likelihood, _bivariate_statistic, 5, rng.normal(size=(6, 2))
+    )
+    y = rng.normal(size=(40, 2))
+
+    derived = fisher_batch(family, cholesky_thetas, y)
+    explicit = fisher_batch(gaussian_family(2), cholesky_thetas, y)
+
+    assert np.allclose(derived.metric, explicit.metric)
+    assert np.allclose(derived.covariance, explicit.covariance)
+    assert np.allclose(
+        score(family, cholesky_thetas, y), score(gaussian_family(2), cholesky_thetas, y)
+    )
+
+
+def test_conditional_family_from_log_likelihood_matches_poisson_glm():
+    """
+    A Poisson regression log-likelihood must reproduce poisson_glm_family.
+    """
+    def log_likelihood(theta, y, x):
+        eta = x @ theta
+        return y * eta - torch.exp(eta) - torch.lgamma(y + 1.0)
+
+    family = ExponentialFamily.from_log_likelihood(
+        log_likelihood, lambda y: y.reshape(1), 3, [0.0, 1.0], conditional=True
+    )
+    rng = np.random.default_rng(6)
+    X = rng.normal(size=(30, 3))
+    y = rng.poisson(1.0, size=30).astype(float)
+    beta = rng.normal(size=(4, 3)) * 0.2
+
+    derived = fisher_batch(family, beta, (X, y))
+    explicit = fisher_batch(poisson_glm_family(3), beta, (X, y))
+
+    assert np.allclose(derived.metric, explicit.metric)
+    assert np.allclose(derived.covariance, explicit.covariance)
+    assert np.allclose(fisher_metric(family, beta, X), explicit.metric)
+
+
+def test_from_log_likelihood_rejects_degenerate_reference():
+    """
+    Reference statistics that are not affinely independent must raise ValueError.
+    """
+    with pytest.raises(ValueError):
+        ExponentialFamily.from_log_likelihood(
+            _bivariate_log_likelihood, _bivariate_statistic, 5, np.zeros((6, 2))
+        )
+
+
+def test_score_chunking_does_not_change_results(cholesky_thetas):
+    """
+    Scores computed in parameter blocks must equal the unchunked scores.
+    """
+    y = np.random.default_rng(7).normal(size=(20, 2))
+    family = gaussian_family(2)
+
+    assert np.allclose(
+        score(family, cholesky_thetas, y, chunk_size=4), score(family, cholesky_thetas, y)
+    )
+
+
+def test_laplacian_metric_reproduces_gaussian_operator():
+    """
+    The autodiff metric adapter must rebuild the closed-form Gaussian operator.
+    """
+    grid = Grid.linspace((-2.0, 2.0), (0.5, 2.5), (12, 14))
+    volume, inverse_metric = laplacian_metric(diagonal_gaussian_family(1))
+
+    K = LaplaceBeltrami(grid, volume=volume, inverse_metric=inverse_metric).matrix()
+    reference = LaplaceBeltrami(grid).matrix()
+
+    assert abs(K - reference).max() <= 1e-12 * abs(reference).max()
@@ -0,0 +1,173 @@
+"""
+Tests for interpolated field queries.
+"""
+
+import pickle
+
+import numpy as np
+import pytest
+
+from src.utils.field import Field
+from src.utils.fisher import gaussian_inverse_metric
+from src.utils.laplacian import Grid, LaplaceBeltrami
+from src.utils.poisson import FieldSolver
+
+
+@pytest.fixture
+def grid():
+    return Grid.linspace((-2.0, 2.0), (0.5, 2.5), (41, 51))
+
+
+def smooth(mu, sigma):
+    return np.sin(mu) * np.exp(-sigma)
+
+
+@pytest.fixture
+def points():
+    rng = np.random.default_rng(1)
+    return rng.uniform(-2.0, 2.0, 500), rng.uniform(0.5, 2.5, 500)
+
+
+@pytest.mark.parametrize("kind", ["cubic", "linear"])
+def test_interpolant_reproduces_nodes(grid, kind):
+    """
+    The interpolant must pass through the nodal values.
+    """
+    MU, SIGMA = grid.mesh()
+    field = Field(grid, smooth(MU, SIGMA), kind=kind)
+
+    assert np.allclose(field(MU, SIGMA), smooth(MU, SIGMA), atol=1e-13)
+
+
+def test_cubic_values_and_gradients(grid, points):
+    """
+    Bicubic queries must approximate a smooth field and its gradient.
+    """
+    mu, sigma = points
+    MU, SIGMA = grid.mesh()
+    query = Field(grid, smooth(MU, SIGMA)).query(mu, sigma)
+
+    assert np.allclose(query.value, smooth(mu, sigma), atol=1e-5)
+    assert np.allclose(query.gradient[0], np.cos(mu) * np.exp(-sigma), atol=1e-3)
+    assert np.allclose(query.gradient[1], -smooth(mu, sigma), atol=1e-3)
+
+    G_inv = gaussian_inverse_metric(mu, sigma)
+    expected = np.einsum("in,nij,jn->n", query.gradient, G_inv, query.gradient)
+    assert np.allclose(query.fisher_norm, expected)
+
+
+@pytest.mark.parametrize("kind", ["cubic", "linear"])
+def test_gradient_matches_finite_differences(grid, kind):
+    """
+    Gradients must be exact for the interpolant, also when extrapolating.
+    """
+    MU, SIGMA = grid.mesh()
+    field = Field(grid, smooth(MU, SIGMA), kind=kind, decay_length=0.5)
+    mu = np.array([0.13, -2.7, 2.4, 0.31, 3.0])
+    sigma = np.array([1.07, 1.21, 0.2, 2.9, 3.1])
+    eps = 1e-6
+
+    gradient = field.gradient(mu, sigma)
+
+    fd_mu = (field(mu + eps, sigma) - field(mu - eps, sigma)) / (2 * eps)
+    fd_sigma = (field(mu, sigma + eps) - field(mu, sigma - eps)) / (2 * eps)
+    assert np.allclose(gradient, [fd_mu, fd_sigma], atol=1e-6)
+
+
+def test_extrapolation_decays(grid):
+    """
+    Outside the grid box the field must decay from its boundary value.
+    """
+    MU, SIGMA = grid.mesh()
+    field = Field(grid, np.ones(grid.shape), decay_length=0.5)
+
+    values = field([2.0, 2.5, 3.0], 1.0)
+
+    assert values == pytest.approx(np.exp(-np.array([0.0, 1.0, 2.0])))
+
+
+def test_queries_broadcast_and_chunk(grid, points):
+    """
+    Chunked evaluation must not change results and must keep shapes.
+    """
+    MU, SIGMA = grid.mesh()
+    field = Field(grid, smooth(MU, SIGMA))
+    mu, sigma = points
+
+    assert np.array_equal(field(mu, sigma, chunk_size=7), field(mu, sigma))
+    assert field(mu.reshape(20, 25), 1.0).shape == (20, 25)
+    assert field.gradient(mu.reshape(20, 25), 1.0).shape == (2, 20, 25)
+
+
+def test_query_chunking_matches_single_block(grid, points):
+    """
+    query() with small chunks must reproduce values, gradients and Fisher norms.
+    """
+    MU, SIGMA = grid.mesh()
+    field = Field(grid, smooth(MU, SIGMA))
+    mu, sigma = points
+
+    full, chunked = field.query(mu, sigma), field.query(mu, sigma, chunk_size=7)
+
+    assert np.array_equal(chunked.value, full.value)
+    assert np.array_equal(chunked.gradient, full.gradient)
+    assert np.allclose(chunked.fisher_norm, full.fisher_norm, rtol=1e-14)
+
+
+def test_non_finite_points_return_nan(grid):
+    """
+    NaN or infinite coordinates must yield NaN without disturbing other points.
+    """
+    MU, SIGMA = grid.mesh()
+    field = Field(grid, smooth(MU, SIGMA))
+    mu = np.array([0.3, np.nan, np.inf, -np.inf, 0.3])
+    sigma = np.array([1.2, 1.0, 1.0, 1.0, np.nan])
+
+    result = field.query(mu, sigma)
+
+    assert result.value[0] == pytest.approx(field(0.3, 1.2))
+    assert np.all(np.isnan(result.value[1:]))
+    assert np.all(np.isnan(result.gradient[:, 1:]))
+    assert np.all(np.isnan(result.fisher_norm[1:]))
+    assert np.all(np.isnan(field(mu, sigma)[1:]))
+
+
+def test_save_and_load_memory_mapped(grid, points, tmp_path):
+    """
+    A saved field must load memory-mapped and give identical queries.
+    """
+    MU, SIGMA = grid.mesh()
+    field = Field(grid, smooth(MU, SIGMA), decay_length=0.3)
+    field.save(tmp_path / "phi")
+
+    loaded = Field.load(tmp_path / "phi")
+
+    assert isinstance(loaded.coefficients, np.memmap)
+    assert loaded.decay_length == 0.3
+    assert np.array_equal(loaded(*points), field(*points))
+    assert np.array_equal(pickle.loads(pickle.dumps(loaded))(*points), field(*points))
+
+
+def test_solver_returns_field(grid):
+    """
+    FieldSolver.field must wrap the solution and use the screening length.
+    """
+    MU, SIGMA = grid.mesh()
+    solver = FieldSolver(LaplaceBeltrami(grid), m=2.0)
+
+    field = solver.field(smooth(MU, SIGMA))
+
+    assert field.decay_length == 0.5
+    assert np.allclose(field(MU, SIGMA), solver.solve(smooth(MU, SIGMA)))
+
+
+def test_invalid_arguments(grid):
+    """
+    Unknown kinds, bad decay lengths and mismatched values are rejected.
+    """
+    with pytest.raises(ValueError):
+        Field(grid, np.zeros(grid.shape), kind="quintic")
+    with pytest.raises(ValueError):
+        Field(grid, np.zeros(grid.shape), decay_length=0.0)
+    with pytest.raises(ValueError):
+        Field(grid, np.zeros(3))
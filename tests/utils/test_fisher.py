@@ -0,0 +1,64 @@
+"""
+Tests for the closed-form Fisher–Rao geometry of the Gaussian family.
+"""
+
+import numpy as np
+import pytest
+
+from src.utils.fisher import (
+    alignment_diagnostic,
+    gaussian_inverse_metric,
+    gaussian_metric,
+    gaussian_score,
+    gaussian_volume,
+)
+
+
+def test_metric_and_inverse_are_consistent():
+    """
+    G and G⁻¹ must be inverse to each other at every grid point.
+    """
+    mu, sigma = np.meshgrid(np.linspace(-2, 2, 5), np.linspace(0.5, 3, 4))
+
+    product = gaussian_metric(mu, sigma) @ gaussian_inverse_metric(mu, sigma)
+
+    assert product.shape == (4, 5, 2, 2)
+    assert np.allclose(product, np.eye(2))
+
+
+def test_volume_matches_metric_determinant():
+    """
+    gaussian_volume must equal √det G.
+    """
+    sigma = np.linspace(0.3, 4.0, 7)
+
+    expected = np.sqrt(np.linalg.det(gaussian_metric(0.0, sigma)))
+
+    assert np.allclose(gaussian_volume(0.0, sigma), expected)
+
+
+def test_score_has_zero_mean_and_fisher_covariance():
+    """
+    Under the model itself, the score has mean zero and covariance G.
+    """
+    t, w = np.polynomial.hermite.hermgauss(20)
+    mu, sigma = 0.7, 1.6
+    x = mu + np.sqrt(2.0) * sigma * t
+    w = w / np.sqrt(np.pi)
+
+    s = gaussian_score(x, mu, sigma)
+
+    assert s.shape == (2, 20)
+    assert np.allclose(s @ w, 0.0, atol=1e-12)
+    assert np.allclose((s * w) @ s.T, gaussian_metric(mu, sigma))
+
+
+def test_alignment_diagnostic_vanishes_at_equilibrium():
+    """
+    A = Tr(G⁻¹ C) − D must vanish when C equals G.
+    """
+    G = gaussian_metric(0.0, np.array([0.5, 1.0, 2.0]))
+
+    A = alignment_diagnostic(np.linalg.inv(G), G)
+
+    assert A == pytest.approx(np.zeros(3), abs=1e-12)
@@ -0,0 +1,97 @@
+"""
+Tests for closed-form Gaussian Fisher–Rao geodesics and geodesic balls.
+"""
+
+import numpy as np
+import pytest
+
+from src.utils.geodesic import GeodesicBall, Geodesics, fisher_distance
+from src.utils.laplacian import Grid
+
+
+@pytest.fixture
+def geodesics():
+    rng = np.random.default_rng(0)
+    mu0, mu1 = rng.uniform(-3, 3, (2, 4, 5))
+    sigma0, sigma1 = rng.uniform(0.2, 3, (2, 4, 5))
+    # Include a vertical segment and a degenerate one.
+    mu1[0, 0] = mu0[0, 0]
+    mu1[0, 1], sigma1[0, 1] = mu0[0, 1], sigma0[0, 1]
+    return Geodesics(mu0, sigma0, mu1, sigma1)
+
+
+def polyline_length(mu, sigma):
+    """
+    Fisher length of a densely sampled path (midpoint metric).
+    """
+    dmu, dsigma = np.diff(mu, axis=-1), np.diff(sigma, axis=-1)
+    mid = 0.5 * (sigma[..., 1:] + sigma[..., :-1])
+    return np.sum(np.sqrt(dmu**2 + 2.0 * dsigma**2) / mid, axis=-1)
+
+
+def test_distance_is_a_symmetric_metric():
+    """
+    fisher_distance must vanish on the diagonal, be symmetric and give √2 log ratio vertically.
+    """
+    assert fisher_distance(1.0, 2.0, 1.0, 2.0) == 0.0
+    forward = fisher_distance(0.0, 1.0, 2.0, 0.5)
+    assert forward == pytest.approx(fisher_distance(2.0, 0.5, 0.0, 1.0))
+    assert fisher_distance(0.0, 1.0, 0.0, np.e) == pytest.approx(np.sqrt(2.0))
+
+
+def test_samples_are_equally_spaced_along_the_geodesic(geodesics):
+    """
+    Samples must hit both endpoints, be equally spaced in Fisher length and realize d_G.
+    """
+    mu, sigma, s = geodesics.sample(2001)
+
+    assert np.allclose(mu[..., 0], geodesics.mu0) and np.allclose(sigma[..., -1], geodesics.sigma1)
+    assert np.allclose(mu[..., -1], geodesics.mu1) and np.allclose(sigma[..., 0], geodesics.sigma0)
+    assert np.allclose(polyline_length(mu, sigma), geodesics.length, rtol=1e-6, atol=1e-12)
+    steps = fisher_distance(mu[..., :-1], sigma[..., :-1], mu[..., 1:], sigma[..., 1:])
+    assert np.allclose(steps, (geodesics.length / 2000)[..., None], rtol=1e-6, atol=1e-12)
+    assert np.allclose(s[..., -1], geodesics.length)
+
+
+def test_semicircles_are_centred_on_the_axis(geodesics):
+    """
+    Non-vertical segments must lie on semicircles centred at sigma = 0 in (μ/√2, σ).
+    """
+    mu, sigma, _ = geodesics.sample(17)
+    arc = ~geodesics.vertical
+    r2 = ((mu - geodesics.center[..., None]) / np.sqrt(2.0)) ** 2 + sigma**2
+
+    assert geodesics.vertical[0, 0] and geodesics.vertical[0, 1]
+    assert np.allclose(r2[arc], (geodesics.radius[arc] ** 2)[:, None])
+
+
+def test_evaluate_samples_a_field_in_one_pass(geodesics):
+    """
+    evaluate must return the field values at the arc-length samples.
+    """
+    s, values = geodesics.evaluate(lambda mu, sigma: mu * sigma, 9)
+    mu, sigma, _ = geodesics.sample(9)
+
+    assert values.shape == geodesics.shape + (9,)
+    assert np.allclose(values, mu * sigma)
+    assert np.allclose(s[..., 4], 0.5 * geodesics.length)
+
+
+def test_geodesic_ball_boundary_and_membership():
+    """
+    Ball boundaries must lie at distance r, and windows must cover every member grid point.
+    """
+    balls = GeodesicBall(np.array([0.0, 1.0]), np.array([0.5, 2.0]), np.array([0.3, 1.2]))
+    mu, sigma = balls.boundary(64)
+
+    distance = fisher_distance(balls.mu[:, None], balls.sigma[:, None], mu, sigma)
+    assert np.allclose(distance, balls.radius[:, None])
+
+    grid = Grid.linspace((-3.0, 3.0), (0.1, 6.0), (300, 200))
+    MU, SIGMA = grid.mesh()
+    for k in range(2):
+        ball = GeodesicBall(balls.mu[k], balls.sigma[k], balls.radius[k])
+        inside = ball.contains(MU, SIGMA)
+        window = np.zeros_like(inside)
+        window[ball.window(grid.mu, grid.sigma)] = True
+        assert inside.any() and np.all(window[inside])
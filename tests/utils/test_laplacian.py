@@ -0,0 +1,80 @@
+"""
+Tests for the finite-volume Laplace–Beltrami operator.
+"""
+
+import numpy as np
+import pytest
+
+from src.utils.laplacian import Grid, LaplaceBeltrami
+
+
+@pytest.fixture
+def grid():
+    return Grid.linspace((-2.0, 2.0), (0.5, 2.5), (41, 49))
+
+
+def test_grid_rejects_invalid_axes():
+    """
+    Grids must be uniform and stay inside the half-plane.
+    """
+    with pytest.raises(ValueError):
+        Grid(np.array([0.0, 1.0, 3.0]), np.linspace(1, 2, 5))
+    with pytest.raises(ValueError):
+        Grid(np.linspace(0, 1, 5), np.linspace(0.1, 2, 5))
+
+
+def test_grid_key_is_content_based(grid):
+    """
+    Equal grids must share a key; different grids must not.
+    """
+    same = Grid.linspace((-2.0, 2.0), (0.5, 2.5), (41, 49))
+    other = Grid.linspace((-2.0, 2.0), (0.5, 2.5), (41, 51))
+
+    assert grid.key == same.key
+    assert grid.key != other.key
+
+
+def test_operator_matches_analytic_laplacian(grid):
+    """
+    Δ_G (μ² σ) = 2 σ³ on the Gaussian manifold (interior nodes).
+    """
+    MU, SIGMA = grid.mesh()
+    phi = MU**2 * SIGMA
+
+    result = LaplaceBeltrami(grid)(phi)
+
+    assert np.allclose(result[1:-1, 1:-1], 2.0 * SIGMA[1:-1, 1:-1] ** 3)
+
+
+@pytest.mark.parametrize("bc", ["dirichlet", "neumann"])
+def test_stiffness_is_symmetric_and_matches_matrix(grid, bc):
+    """
+    The assembled matrix must be symmetric and agree with the stencil.
+    """
+    op = LaplaceBeltrami(grid, bc=bc)
+    phi = np.random.default_rng(0).normal(size=grid.shape)
+
+    K = op.matrix()
+
+    assert abs(K - K.T).max() == 0.0
+    assert np.allclose(K @ phi.ravel(), op.stiffness(phi).ravel())
+
+
+def test_neumann_operator_annihilates_constants(grid):
+    """
+    With zero-flux boundaries, constants are in the kernel of K.
+    """
+    op = LaplaceBeltrami(grid, bc="neumann")
+
+    assert np.allclose(op.stiffness(np.ones(grid.shape)), 0.0)
+
+
+def test_single_precision_storage(grid):
+    """
+    Under the single policy, coefficients are stored as float32.
+    """
+    op = LaplaceBeltrami(grid, precision="single")
+
+    assert op.cx.dtype == np.float32
+    assert op.mass.dtype == np.float32
+    assert op.stiffness(np.ones(grid.shape)).dtype == np.float32
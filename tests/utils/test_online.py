@@ -0,0 +1,85 @@
+"""
+Tests for the streaming alignment field.
+"""
+
+import numpy as np
+import pytest
+
+from src.utils.laplacian import Grid, LaplaceBeltrami
+from src.utils.online import OnlineAlignmentField, gaussian_alignment_from_moments
+from src.utils.poisson import solve_field
+from src.utils.quadrature import gaussian_alignment_source, gaussian_rule
+
+
+@pytest.fixture
+def grid():
+    return Grid.linspace((-2.0, 2.0), (0.5, 2.5), (30, 34))
+
+
+def test_source_from_moments_matches_quadrature(grid):
+    """
+    A from the fourth central moment must equal the quadrature source.
+    """
+    MU, SIGMA = grid.mesh()
+    rule = gaussian_rule(0.3, 1.2).mix(gaussian_rule(2.0, 0.5), 0.2)
+    center = 0.7
+    moments = [rule.expect(lambda x, k=k: (x - center) ** k) for k in range(5)]
+
+    A = gaussian_alignment_from_moments(MU, SIGMA, moments, center)
+
+    assert np.allclose(A, gaussian_alignment_source(MU, SIGMA, rule))
+
+
+@pytest.mark.parametrize("method", ["direct", "cg"])
+def test_batches_match_one_shot_solution(grid, method):
+    """
+    Streaming batches must reproduce the one-shot solve on all data.
+    """
+    data = np.random.default_rng(0).normal(0.5, 1.3, size=3000)
+    field = OnlineAlignmentField(LaplaceBeltrami(grid), m=1.0, method=method)
+
+    for batch in np.array_split(data, 6):
+        phi = field.update(batch)
+
+    MU, SIGMA = grid.mesh()
+    moments = [np.mean(data**k) for k in range(5)]
+    A = gaussian_alignment_from_moments(MU, SIGMA, moments)
+    expected = solve_field(A, LaplaceBeltrami(grid), m=1.0)
+
+    assert field.count == pytest.approx(3000)
+    assert np.allclose(field.source, A)
+    assert np.allclose(phi, expected, atol=1e-8)
+
+
+def test_direct_updates_reuse_factorization(grid):
+    """
+    The LU factorization must be computed once across updates.
+    """
+    field = OnlineAlignmentField(LaplaceBeltrami(grid))
+    field.update([0.0, 1.0, -1.0])
+    lu = field.solver.factorize()
+
+    field.update([0.5, 2.0])
+
+    assert field.solver.factorize() is lu
+
+
+def test_decay_forgets_old_batches(grid):
+    """
+    With decay, recent batches dominate the statistics.
+    """
+    field = OnlineAlignmentField(LaplaceBeltrami(grid), decay=0.5)
+
+    field.update(np.zeros(10))
+    field.update(np.ones(10))
+
+    assert field.count == pytest.approx(15.0)
+    assert field.center + field.moments[1] == pytest.approx(10 / 15)
+
+
+def test_first_batch_must_not_be_empty(grid):
+    """
+    An empty first batch leaves q undefined.
+    """
+    with pytest.raises(ValueError):
+        OnlineAlignmentField(LaplaceBeltrami(grid)).update([])
@@ -16,6 +16,7 @@ from src.utils.paths import (
     figures_dir,
     figure_path,
     figure_paths_all_formats,
+    write_bytes_if_changed,
 )
 
 
@@ -67,6 +68,19 @@ def test_figure_paths_all_formats_yields_all_supported_formats():
         assert path.name == "fig_test.pdf"
 
 
+def test_write_bytes_if_changed_skips_identical_content(tmp_path):
+    """
+    write_bytes_if_changed must only touch the file when bytes differ.
+    """
+    path = tmp_path / "fig_data.bin"
+
+    assert write_bytes_if_changed(path, b"abc") is True
+    assert write_bytes_if_changed(path, b"abc") is False
+    assert write_bytes_if_changed(path, b"abcd") is True
+    assert path.read_bytes() == b"abcd"
+    assert [p.name for p in tmp_path.iterdir()] == ["fig_data.bin"]
+
+
 # ---------------------------------------------------------------------
 # Error handling
 # ---------------------------------------------------------------------
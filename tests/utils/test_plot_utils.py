@@ -5,6 +5,11 @@ These tests verify DPI enforcement, resolution guarantees, saving behavior,
 and basic semantic helpers without relying on visual inspection.
 """
 
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
 import matplotlib
 import matplotlib.pyplot as plt
 import pytest
@@ -14,11 +19,15 @@ from src.utils.plotting import (
     MIN_DPI,
     MIN_PIXELS,
     setup_figure,
+    new_axes,
+    new_figure,
     ensure_min_resolution,
     finalize_figure,
+    source_date,
     add_fisher_equilibrium_line,
     set_axis_labels,
 )
+from src.utils.paths import ROOT_DIR
 
 
 # ---------------------------------------------------------------------
@@ -127,6 +136,144 @@ def test_finalize_figure_uses_current_figure(tmp_path):
     assert path.stat().st_size > 0
 
 
+def _draw_reference_figure():
+    fig = setup_figure()
+    plt.plot([0.0, 1.0, 2.0], [1.0, 0.5, 0.25])
+    return fig
+
+
+def test_finalize_figure_is_byte_stable(tmp_path, monkeypatch):
+    """
+    finalize_figure must produce identical bytes for identical content.
+    """
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+    first = tmp_path / "first.pdf"
+    second = tmp_path / "second.pdf"
+
+    finalize_figure(first, fig=_draw_reference_figure())
+    finalize_figure(second, fig=_draw_reference_figure())
+
+    assert first.read_bytes() == second.read_bytes()
+    assert b"CreationDate" not in first.read_bytes()
+
+
+def test_finalize_figure_skips_unchanged_write(tmp_path):
+    """
+    finalize_figure must not rewrite a file whose bytes are unchanged.
+    """
+    path = tmp_path / "stable.pdf"
+
+    assert finalize_figure(path, fig=_draw_reference_figure()) is True
+    os.utime(path, ns=(0, 0))
+
+    assert finalize_figure(path, fig=_draw_reference_figure()) is False
+    assert path.stat().st_mtime_ns == 0
+
+
+def test_finalize_figure_honors_source_date_epoch(tmp_path, monkeypatch):
+    """
+    SOURCE_DATE_EPOCH must fix the embedded creation date.
+    """
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+    path = tmp_path / "dated.pdf"
+
+    finalize_figure(path, fig=_draw_reference_figure())
+
+    assert source_date().year == 2023
+    assert b"D:20231114" in path.read_bytes()
+
+
+def test_source_date_rejects_non_integer(monkeypatch):
+    """
+    A malformed SOURCE_DATE_EPOCH must raise a ValueError.
+    """
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "yesterday")
+
+    with pytest.raises(ValueError):
+        source_date()
+
+
+# ---------------------------------------------------------------------
+# Standalone (pyplot-free) figures
+# ---------------------------------------------------------------------
+def _draw_standalone(label: str, fmt: str, directory: Path) -> bytes:
+    fig, ax = new_axes()
+    ax.plot([0.0, 1.0, 2.0], [1.0, 0.5, 0.25], label=label)
+    add_fisher_equilibrium_line(0.5, ax=ax)
+    set_axis_labels("x", label, ax=ax)
+    ax.legend()
+    path = directory / f"{label}.{fmt}"
+    finalize_figure(path, fig)
+    return path.read_bytes()
+
+
+def test_new_figure_bypasses_pyplot(tmp_path):
+    """
+    new_figure must not register figures with pyplot or change the current figure.
+    """
+    before = plt.get_fignums()
+
+    fig = new_figure(width=3.0, height=2.0, dpi=72)
+    finalize_figure(tmp_path / "standalone.png", fig)
+
+    assert plt.get_fignums() == before
+    assert fig.get_dpi() >= MIN_DPI
+    assert (tmp_path / "standalone.png").stat().st_size > 0
+
+
+@pytest.mark.parametrize("fmt", ["pdf", "svg", "png"])
+def test_standalone_figures_render_concurrently(tmp_path, fmt, monkeypatch):
+    """
+    Figures rendered in parallel threads must match their serial renderings.
+    """
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+    labels = [f"panel{k}" for k in range(6)]
+    (tmp_path / "serial").mkdir()
+    (tmp_path / "parallel").mkdir()
+    serial = [_draw_standalone(label, fmt, tmp_path / "serial") for label in labels]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        parallel = list(
+            pool.map(lambda label: _draw_standalone(label, fmt, tmp_path / "parallel"), labels)
+        )
+
+    assert parallel == serial
+
+
+def test_svg_save_touches_only_the_hash_salt(tmp_path, monkeypatch):
+    """
+    SVG saves must restore svg.hashsalt and leave concurrent rcParams changes intact.
+    """
+    monkeypatch.setitem(matplotlib.rcParams, "svg.hashsalt", None)
+    fig, ax = new_axes()
+    ax.plot([0.0, 1.0], [1.0, 0.0])
+    original_draw = fig.draw
+
+    def draw_and_change_rc(renderer):
+        # Stands in for another thread editing rcParams during the save.
+        matplotlib.rcParams["lines.linewidth"] = 7.0
+        original_draw(renderer)
+
+    monkeypatch.setattr(fig, "draw", draw_and_change_rc)
+    monkeypatch.setitem(matplotlib.rcParams, "lines.linewidth", 1.0)
+    finalize_figure(tmp_path / "salted.svg", fig)
+
+    assert matplotlib.rcParams["svg.hashsalt"] is None
+    assert matplotlib.rcParams["lines.linewidth"] == 7.0
+
+
+def test_plotting_does_not_import_pyplot():
+    """
+    Importing the plotting utilities must not load pyplot.
+    """
+    code = "import sys, src.utils.plotting; print('matplotlib.pyplot' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT_DIR, capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "False"
+
+
 # ---------------------------------------------------------------------
 # Semantic helpers
 # ---------------------------------------------------------------------
@@ -0,0 +1,89 @@
+"""
+Tests for the Fisher–geometric field-equation solvers.
+"""
+
+import numpy as np
+import pytest
+
+from src.utils.laplacian import Grid, LaplaceBeltrami
+from src.utils.poisson import solve_field
+from src.utils.precision import accuracy_report
+
+
+@pytest.fixture
+def grid():
+    return Grid.linspace((-3.0, 3.0), (0.5, 3.0), (48, 56))
+
+
+@pytest.fixture
+def source(grid):
+    MU, SIGMA = grid.mesh()
+    return np.exp(-(MU**2)) * np.exp(-((SIGMA - 1.0) ** 2))
+
+
+@pytest.mark.parametrize("bc", ["dirichlet", "neumann"])
+@pytest.mark.parametrize("m", [0.0, 1.0])
+def test_solution_satisfies_discrete_equation(grid, source, bc, m):
+    """
+    (−Δ_G + m²) φ = −γ A must hold to solver tolerance.
+    """
+    op = LaplaceBeltrami(grid, bc=bc)
+
+    phi = solve_field(source, op, gamma=2.0, m=m)
+
+    residual = -op(phi) + m**2 * phi + 2.0 * source
+    if bc == "neumann" and m == 0.0:
+        residual -= np.sum(op.mass * residual) / op.mass.sum()
+    assert np.max(np.abs(residual)) < 1e-8
+
+
+@pytest.mark.parametrize("bc", ["dirichlet", "neumann"])
+def test_cg_matches_direct(grid, source, bc):
+    """
+    Conjugate gradients and LU must give the same field.
+    """
+    op = LaplaceBeltrami(grid, bc=bc)
+
+    direct = solve_field(source, op, method="direct")
+    iterative = solve_field(source, op, method="cg", tol=1e-12)
+
+    assert np.allclose(direct, iterative, atol=1e-9)
+
+
+def test_neumann_solution_has_zero_volume_mean(grid, source):
+    """
+    The zero mode must be fixed by zero Fisher-volume mean.
+    """
+    op = LaplaceBeltrami(grid, bc="neumann")
+
+    phi = solve_field(source, op)
+
+    assert abs(np.sum(op.mass * phi)) < 1e-10
+
+
+@pytest.mark.parametrize("method", ["direct", "cg"])
+def test_mixed_precision_reaches_storage_accuracy(grid, source, method):
+    """
+    Mixed precision with refinement must match float64 to ~float32 eps.
+    """
+    reference = solve_field(source, LaplaceBeltrami(grid), method="direct")
+
+    mixed = solve_field(source, LaplaceBeltrami(grid, precision="mixed"), method=method)
+    single = solve_field(
+        source, LaplaceBeltrami(grid, precision="single"), method=method, tol=1e-6
+    )
+
+    mixed_report = accuracy_report(mixed, reference)
+    single_report = accuracy_report(single, reference)
+    assert mixed.dtype == np.float32
+    assert mixed_report["bytes_ratio"] == 0.5
+    assert mixed_report["rel_l2_error"] < 1e-6
+    assert mixed_report["rel_l2_error"] <= single_report["rel_l2_error"]
+
+
+def test_unknown_method_raises(grid, source):
+    """
+    Unsupported solver names must raise a ValueError.
+    """
+    with pytest.raises(ValueError):
+        solve_field(source, LaplaceBeltrami(grid), method="multigrid")
@@ -0,0 +1,83 @@
+"""
+Tests for precision policies and accuracy reporting.
+"""
+
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from src.utils.laplacian import Grid, LaplaceBeltrami
+from src.utils.poisson import FieldSolver
+from src.utils.precision import DOUBLE, MIXED, SINGLE, accuracy_report, get_policy
+from src.utils.quadrature import gaussian_alignment_source, gaussian_rule
+
+
+def test_get_policy_resolves_names_and_instances():
+    """
+    Names resolve to registered policies; instances pass through.
+    """
+    assert get_policy("mixed") is MIXED
+    assert get_policy(SINGLE) is SINGLE
+    with pytest.raises(ValueError):
+        get_policy("half")
+
+
+def test_reductions_accumulate_in_double():
+    """
+    Single-precision dot products must accumulate in float64.
+    """
+    a = np.full(10**6, 1e-4, dtype=np.float32)
+
+    assert SINGLE.dot(a, np.ones_like(a)) == pytest.approx(100.0, rel=1e-6)
+
+
+def test_accuracy_report_against_reference():
+    """
+    accuracy_report must measure errors relative to the float64 field.
+    """
+    reference = np.linspace(0.0, 1.0, 101)
+
+    report = accuracy_report(reference.astype(np.float32), reference)
+
+    assert report["max_abs_error"] < 1e-7
+    assert report["rel_l2_error"] < 1e-7
+    assert report["bytes_ratio"] == 0.5
+    assert accuracy_report(reference, reference)["max_abs_error"] == 0.0
+
+
+def test_source_evaluation_in_single_storage():
+    """
+    Grid sources may be stored in float32 with float64 accumulation.
+    """
+    mu, sigma = np.meshgrid(np.linspace(-2, 2, 30), np.linspace(0.5, 2, 20))
+    rule = gaussian_rule(0.0, 1.0)
+
+    single = gaussian_alignment_source(mu, sigma, rule, precision="single")
+    double = gaussian_alignment_source(mu, sigma, rule, precision=DOUBLE)
+
+    assert single.dtype == np.float32
+    assert accuracy_report(single, double)["rel_l2_error"] < 1e-6
+
+
+def _peak_bytes(precision, grid, source):
+    tracemalloc.start()
+    try:
+        operator = LaplaceBeltrami(grid, precision=precision)
+        FieldSolver(operator, m=1.0, method="cg", tol=1e-2).solve(source)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_single_precision_halves_peak_solve_memory():
+    """
+    Building and CG-solving in single precision must peak at about half the double memory.
+    """
+    grid = Grid.linspace((-3.0, 3.0), (0.5, 3.0), (300, 300))
+    MU, SIGMA = grid.mesh()
+    source = (np.exp(-(MU**2)) / SIGMA).astype(np.float32)
+
+    ratio = _peak_bytes("single", grid, source) / _peak_bytes("double", grid, source)
+
+    assert ratio < 0.55
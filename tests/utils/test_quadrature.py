@@ -0,0 +1,125 @@
+"""
+Tests for deterministic quadrature of score expectations.
+
+Accuracy is checked against closed-form Gaussian moments, so no
+sampling noise is involved.
+"""
+
+import numpy as np
+import pytest
+
+from src.utils.quadrature import (
+    QuadratureRule,
+    adaptive_rule,
+    contaminated_gaussian_rule,
+    gaussian_alignment_source,
+    gaussian_rule,
+)
+
+
+def _gaussian_source_closed_form(mu, sigma, m, s):
+    """
+    A(μ, σ; N(m, s²)) from the raw moments of q.
+    """
+    d = m - mu
+    m2 = s**2 + d**2
+    m4 = 3 * s**4 + 6 * s**2 * d**2 + d**4
+    c_mu = m2 / sigma**4
+    c_sigma = (m4 - 2 * sigma**2 * m2 + sigma**4) / sigma**6
+    return sigma**2 * c_mu + 0.5 * sigma**2 * c_sigma - 2.0
+
+
+def _laplace(x):
+    return 0.5 * np.exp(-np.abs(x - 3.0))
+
+
+# ---------------------------------------------------------------------
+# Rules
+# ---------------------------------------------------------------------
+def test_gaussian_rule_reproduces_moments():
+    """
+    Gauss–Hermite nodes must reproduce the first four Gaussian moments.
+    """
+    rule = gaussian_rule(1.5, 0.5, n=8)
+
+    assert rule.expect(np.ones_like) == pytest.approx(1.0)
+    assert rule.expect(lambda x: x) == pytest.approx(1.5)
+    assert rule.expect(lambda x: (x - 1.5) ** 4) == pytest.approx(3 * 0.5**4)
+
+
+def test_rules_are_read_only():
+    """
+    Cached node tables must not be mutable through a returned rule.
+    """
+    rule = gaussian_rule(0.0, 1.0)
+
+    with pytest.raises(ValueError):
+        rule.nodes[0] = 1.0
+
+
+def test_adaptive_rule_integrates_heavy_tailed_density():
+    """
+    The adaptive rule must recover the moments of a Laplace density.
+    """
+    rule = adaptive_rule(_laplace, center=3.0)
+
+    assert isinstance(rule, QuadratureRule)
+    assert rule.expect(np.ones_like) == pytest.approx(1.0, abs=1e-9)
+    assert rule.expect(lambda x: (x - 3.0) ** 2) == pytest.approx(2.0, abs=1e-8)
+    assert rule.expect(lambda x: (x - 3.0) ** 4) == pytest.approx(24.0, abs=1e-7)
+
+
+def test_adaptive_rule_is_cached():
+    """
+    Repeated requests for the same density must reuse the node table.
+    """
+    assert adaptive_rule(_laplace, center=3.0) is adaptive_rule(_laplace, center=3.0)
+
+
+def test_mixture_weight_must_be_a_probability():
+    """
+    Contamination fractions outside [0, 1] must raise a ValueError.
+    """
+    with pytest.raises(ValueError):
+        contaminated_gaussian_rule(0.0, 1.0, 1.5, gaussian_rule(3.0, 1.0))
+
+
+# ---------------------------------------------------------------------
+# Alignment source
+# ---------------------------------------------------------------------
+def test_gaussian_source_matches_closed_form_over_grid():
+    """
+    Quadrature A(μ, σ; q) must match closed-form moments for Gaussian q.
+    """
+    mu, sigma = np.meshgrid(np.linspace(-3, 3, 41), np.linspace(0.5, 3, 37))
+
+    A = gaussian_alignment_source(mu, sigma, gaussian_rule(0.5, 1.3), chunk_size=100)
+
+    assert A.shape == mu.shape
+    assert np.allclose(A, _gaussian_source_closed_form(mu, sigma, 0.5, 1.3))
+
+
+def test_source_vanishes_when_model_matches_data():
+    """
+    A(θ; q) must vanish at θ = (μ₀, σ₀) for uncontaminated q.
+    """
+    A = gaussian_alignment_source(0.2, 0.9, gaussian_rule(0.2, 0.9))
+
+    assert float(A) == pytest.approx(0.0, abs=1e-12)
+
+
+def test_contaminated_source_is_linear_in_eps():
+    """
+    C(θ; q) is linear in q, so A must interpolate linearly in ε.
+    """
+    mu, sigma = np.meshgrid(np.linspace(-2, 2, 9), np.linspace(0.5, 2, 7))
+    outlier = adaptive_rule(_laplace, center=3.0)
+
+    A0, A1, Ah = (
+        gaussian_alignment_source(
+            mu, sigma, contaminated_gaussian_rule(0.0, 1.0, eps, outlier)
+        )
+        for eps in (0.0, 1.0, 0.25)
+    )
+
+    assert np.allclose(Ah, 0.75 * A0 + 0.25 * A1)
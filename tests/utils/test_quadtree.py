@@ -0,0 +1,110 @@
+"""
+Tests for the adaptive quadtree mesh and its finite-volume operator.
+"""
+
+import numpy as np
+import pytest
+
+from src.utils.laplacian import Grid, LaplaceBeltrami
+from src.utils.poisson import solve_field
+from src.utils.quadtree import QuadtreeLaplaceBeltrami, QuadtreeMesh
+
+
+MU_RANGE = (-3.0, 3.0)
+SIGMA_RANGE = (0.2, 3.0)
+
+
+def peaked_source(mu, sigma):
+    """
+    Contamination-like source concentrated at small σ.
+    """
+    return 0.25 * np.exp(-((mu - 2.0) ** 2) / (2.0 * sigma**2)) / sigma**4 - 1.5 * np.exp(
+        -(mu**2) / 2.0
+    )
+
+
+@pytest.fixture
+def mesh():
+    return QuadtreeMesh.adapt(MU_RANGE, SIGMA_RANGE, base=(4, 4), max_level=4, fisher_size=0.4)
+
+
+def test_refinement_follows_fisher_scale_and_is_balanced(mesh):
+    """
+    Refinement must concentrate at small σ and keep face neighbours within one level.
+    """
+    _, sigma = mesh.centers()
+    a, b = mesh.faces["cells"].T
+
+    assert mesh.level[sigma < 0.5].min() > mesh.level[sigma > 2.0].max()
+    assert np.max(np.abs(mesh.level[a] - mesh.level[b])) <= 1
+    assert np.sum(mesh.h_mu * mesh.h_sigma) == pytest.approx(6.0 * 2.8)
+
+
+@pytest.mark.parametrize("bc", ["dirichlet", "neumann"])
+def test_operator_is_symmetric_and_conservative(mesh, bc):
+    """
+    K must be symmetric, and with Neumann boundaries constants must carry no flux.
+    """
+    K = QuadtreeLaplaceBeltrami(mesh, bc=bc).matrix()
+
+    assert abs(K - K.T).max() == 0.0
+    if bc == "neumann":
+        assert np.allclose(K @ np.ones(mesh.size), 0.0, atol=1e-12)
+    else:
+        assert np.all(np.linalg.eigvalsh(K.toarray()) > 0.0)
+
+
+def test_unrefined_mesh_reproduces_uniform_operator():
+    """
+    Without refinement the Neumann operator must equal the uniform finite-volume one.
+    """
+    mesh = QuadtreeMesh.uniform((-2.0, 2.0), (0.5, 2.5), (6, 8))
+    mu, sigma = mesh.centers()
+    grid = Grid.linspace((mu.min(), mu.max()), (sigma.min(), sigma.max()), (6, 8))
+
+    K = QuadtreeLaplaceBeltrami(mesh, bc="neumann").matrix().toarray()
+    assert np.allclose(K, LaplaceBeltrami(grid, bc="neumann").matrix().toarray(), atol=1e-12)
+
+
+def test_resample_reproduces_linear_fields(mesh):
+    """
+    Gradient reconstruction must resample linear fields exactly.
+    """
+    mu, sigma = mesh.centers()
+    grid = Grid.linspace(MU_RANGE, SIGMA_RANGE, (23, 19))
+    MU, SIGMA = grid.mesh()
+
+    resampled = mesh.to_grid(1.0 + 2.0 * mu - 0.5 * sigma, grid, bc="neumann")
+    assert np.allclose(resampled, 1.0 + 2.0 * MU - 0.5 * SIGMA, atol=1e-9)
+
+
+def test_adaptive_mesh_matches_uniform_accuracy_with_fewer_unknowns():
+    """
+    An adaptive mesh must reach the uniform finest-level error with a fraction of the unknowns.
+    """
+
+    def solve(mesh):
+        mu, sigma = mesh.centers()
+        return solve_field(peaked_source(mu, sigma), QuadtreeLaplaceBeltrami(mesh), m=1.0)
+
+    grid = Grid.linspace(MU_RANGE, SIGMA_RANGE, (101, 101))
+    weight = 1.0 / grid.mesh()[1] ** 2
+    fine = QuadtreeMesh.uniform(MU_RANGE, SIGMA_RANGE, (256, 256))
+    reference = fine.to_grid(solve(fine), grid)
+
+    def error(mesh):
+        diff = mesh.to_grid(solve(mesh), grid) - reference
+        return np.sqrt(np.sum(weight * diff**2) / np.sum(weight * reference**2))
+
+    uniform = QuadtreeMesh.uniform(MU_RANGE, SIGMA_RANGE, (64, 64))
+    adaptive = QuadtreeMesh.adapt(
+        MU_RANGE,
+        SIGMA_RANGE,
+        base=(8, 8),
+        max_level=3,
+        fisher_size=0.4,
+        source=peaked_source,
+    )
+
+    assert adaptive.size < uniform.size / 4
+    assert error(adaptive) <= 1.05 * error(uniform)
@@ -0,0 +1,126 @@
+"""
+Tests for the truncated eigenbasis and spectral solves.
+"""
+
+import numpy as np
+import pytest
+
+from src.utils.laplacian import Grid, LaplaceBeltrami
+from src.utils.poisson import solve_field
+from src.utils.spectral import Eigenbasis, cache_path, eigenbasis
+
+
+@pytest.fixture
+def grid():
+    return Grid.linspace((-2.0, 2.0), (0.5, 2.5), (18, 20))
+
+
+def smooth_source(grid):
+    MU, SIGMA = grid.mesh()
+    return np.exp(-MU**2) * np.sin(SIGMA)
+
+
+@pytest.mark.parametrize("bc", ["dirichlet", "neumann"])
+def test_eigenpairs_are_m_orthonormal(grid, bc):
+    """
+    Lanczos eigenpairs must satisfy K V = M V Λ and Vᵀ M V = I.
+    """
+    op = LaplaceBeltrami(grid, bc=bc)
+    basis = Eigenbasis.compute(op, 12)
+    V, M = basis.vectors, op.mass.ravel()
+
+    assert np.all(np.diff(basis.eigenvalues) >= 0.0)
+    assert np.allclose(V.T @ (M[:, None] * V), np.eye(12), atol=1e-10)
+    assert np.allclose(op.matrix() @ V, M[:, None] * V * basis.eigenvalues, atol=1e-8)
+
+
+def test_lanczos_matches_dense_eigenvalues(grid):
+    """
+    Shift-invert Lanczos must find the lowest eigenvalues.
+    """
+    op = LaplaceBeltrami(grid)
+    dense = Eigenbasis.compute(op, grid.size)
+
+    assert np.allclose(Eigenbasis.compute(op, 8).eigenvalues, dense.eigenvalues[:8])
+
+
+@pytest.mark.parametrize("bc", ["dirichlet", "neumann"])
+@pytest.mark.parametrize("m", [0.0, 1.5])
+def test_full_basis_reproduces_field_solver(grid, bc, m):
+    """
+    With all N modes, the spectral solve must equal the sparse solve.
+    """
+    op = LaplaceBeltrami(grid, bc=bc)
+    A = smooth_source(grid)
+
+    result = Eigenbasis.compute(op, grid.size).solve(A, m=m, gamma=2.0)
+
+    assert np.allclose(result.field, solve_field(A, op, m=m, gamma=2.0), atol=1e-9)
+    assert result.error_bound == pytest.approx(0.0, abs=1e-9)
+
+
+@pytest.mark.parametrize("m", [0.0, 1.0])
+def test_truncation_bound_holds(grid, m):
+    """
+    The error bound must dominate the actual truncation error.
+    """
+    op = LaplaceBeltrami(grid)
+    basis = Eigenbasis.compute(op, 40)
+    A = smooth_source(grid)
+
+    result = basis.solve(A, m=m)
+    error = basis.m_norm(result.field - solve_field(A, op, m=m))
+
+    assert 0.0 < error <= result.error_bound
+    assert result.relative_error < 0.05
+
+
+def test_heat_kernel(grid):
+    """
+    Heat smoothing must be the projection at t = 0 and decay like e^{−λt}.
+    """
+    op = LaplaceBeltrami(grid)
+    basis = Eigenbasis.compute(op, 6)
+    v = basis.vectors[:, 2].reshape(grid.shape)
+
+    assert np.allclose(basis.heat(v, 0.0).field, v)
+    assert np.allclose(basis.heat(v, 0.3).field, np.exp(-0.3 * basis.eigenvalues[2]) * v)
+    with pytest.raises(ValueError):
+        basis.heat(v, -1.0)
+
+
+def test_eigenbasis_is_persisted_and_reused(grid, tmp_path):
+    """
+    A cached basis must be reloaded, and truncated for smaller k.
+    """
+    op = LaplaceBeltrami(grid)
+    first = eigenbasis(op, 10, cache_dir=tmp_path)
+    path = cache_path(op, 10, tmp_path)
+    mtime = path.stat().st_mtime_ns
+
+    again = eigenbasis(op, 10, cache_dir=tmp_path)
+    smaller = eigenbasis(op, 4, cache_dir=tmp_path)
+
+    assert path.stat().st_mtime_ns == mtime
+    assert list(tmp_path.iterdir()) == [path]
+    assert np.array_equal(again.vectors, first.vectors)
+    assert np.array_equal(smaller.eigenvalues, first.eigenvalues[:4])
+
+
+def test_cache_distinguishes_operators(grid, tmp_path):
+    """
+    Bases of different operators on the same grid must not be shared.
+    """
+    dirichlet = eigenbasis(LaplaceBeltrami(grid), 5, cache_dir=tmp_path)
+    neumann = eigenbasis(LaplaceBeltrami(grid, bc="neumann"), 5, cache_dir=tmp_path)
+
+    assert dirichlet.digest != neumann.digest
+    assert neumann.eigenvalues[0] == pytest.approx(0.0, abs=1e-10)
+
+
+def test_invalid_k(grid):
+    """
+    The number of eigenpairs must lie in [1, N].
+    """
+    with pytest.raises(ValueError):
+        Eigenbasis.compute(LaplaceBeltrami(grid), 0)
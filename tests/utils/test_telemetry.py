@@ -0,0 +1,160 @@
+"""
+Tests for solver telemetry.
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from src.utils import telemetry
+from src.utils.action import ActionFunctional, minimize_action
+from src.utils.laplacian import Grid, LaplaceBeltrami
+from src.utils.poisson import FieldSolver, solve_field
+from src.utils.spectral import Eigenbasis
+from src.utils.telemetry import Telemetry
+
+
+@pytest.fixture
+def grid():
+    return Grid.linspace((-2.0, 2.0), (0.5, 2.5), (20, 24))
+
+
+def source(grid):
+    MU, SIGMA = grid.mesh()
+    return np.exp(-MU**2) * np.sin(SIGMA)
+
+
+def test_disabled_without_session(grid):
+    """
+    Outside a session no records are created.
+    """
+    assert telemetry.active() is None
+    assert telemetry.start("field", "cg", grid.shape) is None
+    solve_field(source(grid), LaplaceBeltrami(grid), method="cg")
+
+
+def test_cg_residual_history(grid):
+    """
+    CG records one residual per iteration and every operator application.
+    """
+    with Telemetry() as session:
+        solve_field(source(grid), LaplaceBeltrami(grid), method="cg", tol=1e-8)
+
+    (record,) = session.records
+    assert record.solver == "field" and record.method == "cg"
+    assert record.iterations == len(record.residuals) > 0
+    assert record.residuals[-1] <= 1e-8
+    assert record.operator_applications == record.iterations
+    assert record.extra["final_residual"] == record.residuals[-1]
+    assert record.converged
+
+
+def test_direct_residual_only_on_request(grid):
+    """
+    Direct solves must skip the residual check unless the session asks for it.
+    """
+    solver = FieldSolver(LaplaceBeltrami(grid), m=1.0)
+    applications = []
+    original = solver.apply
+
+    def counting_apply(*args, **kwargs):
+        applications.append(1)
+        return original(*args, **kwargs)
+
+    solver.apply = counting_apply
+
+    with Telemetry() as quiet:
+        solver.solve(source(grid))
+    assert "final_residual" not in quiet.records[0].extra
+    assert not applications
+
+    with Telemetry(residuals=True) as checked:
+        solver.solve(source(grid))
+    assert checked.records[0].extra["final_residual"] <= 1e-12
+    assert len(applications) == 1
+
+
+def test_factorization_is_timed_once(grid):
+    """
+    A reused factorization is charged to the first solve only.
+    """
+    solver = FieldSolver(LaplaceBeltrami(grid), m=1.0)
+
+    with Telemetry() as session:
+        solver.solve(source(grid))
+        solver.solve(2.0 * source(grid))
+
+    first, second = session.records
+    assert first.factorization_time > 0.0
+    assert second.factorization_time == 0.0
+    assert first.factorization_bytes == second.factorization_bytes > 0
+    assert session.summary()["field/direct"]["solves"] == 2
+
+
+def test_compatibility_and_refinement(grid):
+    """
+    Zero-mode residuals and refinement sweeps are recorded.
+    """
+    op = LaplaceBeltrami(grid, bc="neumann", precision="mixed")
+    A = source(grid) + 0.25
+    mean = np.sum(op.mass * A) / np.sum(op.mass)
+
+    with Telemetry() as session:
+        solve_field(A, op)
+
+    (record,) = session.records
+    assert record.compatibility_residual == pytest.approx(-mean)
+    assert record.parameters["precision"] == "mixed"
+    assert len(record.refinements) >= 2
+    assert record.refinements[-1] <= 1e-10
+
+
+def test_spectral_and_action_records(grid):
+    """
+    Spectral and action solvers report to the same session.
+    """
+    op = LaplaceBeltrami(grid)
+    with Telemetry() as session:
+        basis = Eigenbasis.compute(op, 8)
+        basis.solve(source(grid), m=1.0)
+        minimize_action(ActionFunctional(op, source(grid)))
+
+    solvers = [(r.solver, r.method) for r in session.records]
+    assert solvers == [
+        ("eigenbasis", "eigsh"),
+        ("spectral", "screened"),
+        ("action", "L-BFGS-B"),
+    ]
+    assert session.records[1].extra["error_bound"] > 0.0
+    action = session.records[2]
+    assert action.iterations == len(action.residuals) > 0
+    assert action.operator_applications >= action.iterations
+
+
+def test_callbacks_and_json_export(grid, tmp_path):
+    """
+    Callbacks see start/finish events; reports round-trip through JSON.
+    """
+    events = []
+    with Telemetry(callbacks=[lambda record, event: events.append(event)]) as session:
+        solve_field(source(grid), LaplaceBeltrami(grid))
+
+    path = session.write_json(tmp_path / "telemetry.json")
+    report = json.loads(path.read_text())
+
+    assert events == ["start", "finish"]
+    assert report["records"][0]["shape"] == list(grid.shape)
+    assert report["summary"]["field/direct"]["solves"] == 1
+
+
+def test_sessions_nest(grid):
+    """
+    An inner session captures solves without leaking to the outer one.
+    """
+    with Telemetry() as outer:
+        with Telemetry() as inner:
+            solve_field(source(grid), LaplaceBeltrami(grid))
+        assert telemetry.active() is outer
+
+    assert len(inner) == 1 and len(outer) == 0
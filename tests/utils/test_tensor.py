@@ -0,0 +1,98 @@
+"""
+Tests for packed symmetric tensor fields and anisotropic diagnostics.
+"""
+
+import numpy as np
+import pytest
+
+from src.utils.fisher import alignment_diagnostic, gaussian_inverse_metric, gaussian_score
+from src.utils.quadrature import (
+    gaussian_alignment_source,
+    gaussian_alignment_tensor,
+    gaussian_rule,
+    score_covariance,
+)
+from src.utils.tensor import SymmetricTensorField, packed_indices, packed_size
+
+
+def random_symmetric(shape, dim, seed=0):
+    rng = np.random.default_rng(seed)
+    T = rng.normal(size=shape + (dim, dim))
+    return T + np.swapaxes(T, -1, -2)
+
+
+@pytest.mark.parametrize("dim", [2, 3, 5])
+def test_packed_round_trip_uses_triangular_storage(dim):
+    """
+    Packing must store D(D+1)/2 components and unpack to the same tensors.
+    """
+    T = random_symmetric((4, 6), dim)
+    field = SymmetricTensorField.from_dense(T)
+
+    assert field.data.shape == (4, 6, packed_size(dim))
+    assert field.shape == (4, 6) and field.dim == dim
+    assert np.array_equal(field.to_dense(), T)
+    rows, cols = packed_indices(dim)
+    assert np.array_equal(field.component(cols[-2], rows[-2]), T[..., rows[-2], cols[-2]])
+
+
+@pytest.mark.parametrize("dim", [2, 4])
+def test_trace_split_and_norms_match_dense_formulas(dim):
+    """
+    Trace, traceless part, Frobenius norm and shear must match dense algebra.
+    """
+    T = random_symmetric((3, 5), dim, seed=1)
+    field = SymmetricTensorField.from_dense(T)
+    trace, deviator = field.split()
+    dense_dev = T - (np.trace(T, axis1=-2, axis2=-1) / dim)[..., None, None] * np.eye(dim)
+
+    assert np.allclose(trace, np.trace(T, axis1=-2, axis2=-1))
+    assert np.allclose(deviator.to_dense(), dense_dev)
+    assert np.allclose(deviator.trace(), 0.0)
+    assert np.allclose(field.frobenius(), np.linalg.norm(T, axis=(-2, -1)))
+    assert np.allclose(field.shear(), np.linalg.norm(dense_dev, axis=(-2, -1)))
+    assert np.allclose((deviator + SymmetricTensorField.isotropic(trace / dim, dim)).data, field.data)
+
+
+@pytest.mark.parametrize("dim", [2, 3])
+def test_principal_directions_diagonalize_the_field(dim):
+    """
+    eigh must return ascending eigenvalues with orthonormal eigenvectors.
+    """
+    T = random_symmetric((7, 3), dim, seed=2)
+    values, vectors = SymmetricTensorField.from_dense(T).eigh(chunk_size=5)
+
+    assert np.allclose(values, np.linalg.eigvalsh(T))
+    assert np.allclose(T @ vectors, vectors * values[..., None, :])
+    assert np.allclose(np.swapaxes(vectors, -1, -2) @ vectors, np.eye(dim))
+
+
+def test_alignment_tensor_trace_is_isotropic_diagnostic():
+    """
+    The Gaussian alignment tensor must trace to A and vanish for q equal to the model.
+    """
+    rule = gaussian_rule(0.3, 1.4)
+    mu, sigma = np.meshgrid(np.linspace(-2, 2, 9), np.linspace(0.5, 3, 7))
+
+    S = gaussian_alignment_tensor(mu, sigma, rule, chunk_size=10)
+    C = score_covariance(gaussian_score, (mu, sigma), rule)
+
+    assert S.shape == mu.shape
+    assert np.allclose(S.trace(), gaussian_alignment_source(mu, sigma, rule))
+    assert np.allclose(S.trace(), alignment_diagnostic(gaussian_inverse_metric(mu, sigma), C))
+    model = gaussian_alignment_tensor(0.3, 1.4, rule)
+    assert np.allclose(model.data, 0.0, atol=1e-12)
+
+
+def test_alignment_tensor_shear_for_variance_mismatch():
+    """
+    A variance mismatch must give the closed-form diagonal alignment tensor.
+    """
+    r = 1.5
+    S = gaussian_alignment_tensor(0.0, 1.0, gaussian_rule(0.0, r), precision="single")
+    expected = np.array([r**2 - 1.0, (3 * r**4 - 2 * r**2 + 1.0) / 2.0 - 1.0])
+
+    assert S.data.dtype == np.float32
+    assert np.allclose(S.eigh()[0], np.sort(expected), rtol=1e-6)
+    assert S.shear() == pytest.approx(abs(expected[1] - expected[0]) / np.sqrt(2.0), rel=1e-6)
+    assert S.principal_angle() == pytest.approx(np.pi / 2)
@@ -0,0 +1,165 @@
+"""
+Tests for the tiled multi-threaded grid executor.
+"""
+
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from src.utils.fisher import gaussian_metric
+from src.utils.laplacian import Grid
+from src.utils.quadrature import gaussian_alignment_source, gaussian_rule
+from src.utils.tiling import (
+    TiledExecutor,
+    default_workers,
+    evaluate,
+    evaluate_grid,
+    limit_workers,
+    tiles,
+)
+
+
+@pytest.fixture
+def grid():
+    return Grid.linspace((-3.0, 3.0), (0.5, 3.0), (301, 257))
+
+
+def gaussian_bump(mu, sigma, out):
+    """
+    In-place kernel for exp(−μ²) exp(−(σ − 1)²).
+    """
+    np.multiply(mu, mu, out=out)
+    out += (sigma - 1.0) ** 2
+    np.negative(out, out=out)
+    np.exp(out, out=out)
+
+
+@pytest.mark.parametrize("shape", [(10,), (7, 9), (3, 100, 4), (2, 1000)])
+def test_tiles_cover_every_point_once(shape):
+    """
+    Tiles must partition the leading axes of the array.
+    """
+    count = np.zeros(shape, dtype=int)
+    for block in tiles(shape, tile_size=50):
+        count[block] += 1
+
+    assert np.all(count == 1)
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_grid_kernel_matches_dense_expression(grid, workers):
+    """
+    Tiled evaluation must reproduce the meshgrid expression bit for bit.
+    """
+    MU, SIGMA = grid.mesh()
+    expected = np.exp(-(MU**2)) * np.exp(-((SIGMA - 1.0) ** 2))
+    in_place = np.exp(-(MU**2 + (SIGMA - 1.0) ** 2))
+
+    result = evaluate_grid(gaussian_bump, grid, workers=workers, tile_size=1000)
+
+    assert result.shape == grid.shape
+    assert np.array_equal(result, in_place)
+    assert np.allclose(result, expected, rtol=1e-14)
+
+
+def test_returning_kernels_and_component_axes(grid):
+    """
+    Kernels may return their tile, and outputs may carry per-point axes.
+    """
+    MU, SIGMA = grid.mesh()
+    with TiledExecutor(3, tile_size=4096) as executor:
+        metric = executor.grid(
+            lambda mu, sigma, out: gaussian_metric(mu, sigma), grid, components=(2, 2)
+        )
+        product = executor.map(lambda a, b, out: a * b, MU[:, :1], SIGMA, dtype=np.float32)
+
+    assert np.array_equal(metric, gaussian_metric(MU, SIGMA))
+    assert product.dtype == np.float32
+    assert np.allclose(product, MU[:, :1] * SIGMA)
+
+
+def test_peak_memory_is_about_one_output_array(grid):
+    """
+    Tiled evaluation must not allocate full-size temporaries.
+    """
+    out_bytes = grid.size * 8
+    tracemalloc.start()
+    try:
+        evaluate_grid(gaussian_bump, grid, workers=2, tile_size=4096)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak < 1.5 * out_bytes
+
+
+def test_errors_propagate_and_shapes_are_checked(grid):
+    """
+    Kernel exceptions must reach the caller, and mismatched outputs must be rejected.
+    """
+
+    def failing(mu, sigma, out):
+        raise RuntimeError("kernel failed")
+
+    with pytest.raises(RuntimeError, match="kernel failed"):
+        evaluate_grid(failing, grid, workers=2, tile_size=1000)
+    with pytest.raises(ValueError, match="shape"):
+        evaluate(gaussian_bump, np.zeros(5), np.zeros(5), out=np.empty(4))
+
+
+def test_axes_tuple_matches_grid(grid):
+    """
+    1D (mu, sigma) axes must evaluate like the Grid, even when they do not form a valid grid.
+    """
+    faces = np.concatenate([grid.sigma - 0.5 * grid.h_sigma, grid.sigma[-1:] + 0.5])
+
+    on_grid = evaluate_grid(gaussian_bump, grid, workers=2, tile_size=1000)
+    on_axes = evaluate_grid(gaussian_bump, (grid.mu, grid.sigma), workers=2, tile_size=1000)
+    on_faces = evaluate_grid(gaussian_bump, (grid.mu, faces), workers=2, tile_size=1000)
+
+    assert np.array_equal(on_axes, on_grid)
+    assert on_faces.shape == (faces.size, grid.mu.size)
+
+
+def test_nested_evaluations_run_single_threaded(grid):
+    """
+    Tile kernels, and callers under limit_workers, must not start one thread per core.
+    """
+    seen = []
+
+    def kernel(mu, sigma, out):
+        seen.append(default_workers())
+        gaussian_bump(mu, sigma, out)
+
+    evaluate_grid(kernel, grid, workers=4, tile_size=1000)
+    with limit_workers(2):
+        limited = default_workers()
+
+    assert set(seen) == {1}
+    assert limited == 2
+    with pytest.raises(ValueError):
+        with limit_workers(0):
+            pass
+
+
+def test_broadcast_inputs_are_not_materialized():
+    """
+    Quadrature sources from broadcast axes must match the meshgrid result without full-size copies.
+    """
+    grid = Grid.linspace((-3.0, 3.0), (0.5, 3.0), (1000, 1000))
+    rule = gaussian_rule(0.3, 1.2, n=8)
+    MU, SIGMA = grid.mesh()
+    expected = gaussian_alignment_source(MU[::97], SIGMA[::97], rule)
+
+    tracemalloc.start()
+    try:
+        result = gaussian_alignment_source(
+            grid.mu[None, :], grid.sigma[:, None], rule, workers=2
+        )
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert np.allclose(result[::97], expected, rtol=1e-14)
+    assert peak < 2.0 * grid.size * 8